@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark for frontmatter parsing in validate-cps.py.
+Compares the restricted header parser and the libyaml loader against the
+pure-Python `yaml.safe_load` path on the proposal READMEs in this repository.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import yaml
+
+from cps_validator import load_validator
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent.parent
+
+
+def collect_headers(validator) -> List[List[str]]:
+    """Frontmatter lines of every CIP/CPS README that has a header."""
+    headers = []
+    for path in sorted(REPO_ROOT.glob('C[IP][PS]-*/README.md')):
+        doc = validator.scan_text(path.read_text(encoding='utf-8'))
+        if doc.frontmatter_lines is not None:
+            headers.append(doc.frontmatter_lines)
+    return headers
+
+
+def time_parser(parse: Callable[[List[str]], Optional[Dict]], headers: List[List[str]], repeat: int) -> float:
+    """Best-of-`repeat` wall time (seconds) to parse every header once."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for lines in headers:
+            parse(lines)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter parsing on the repository corpus.")
+    parser.add_argument('-r', '--repeat', type=int, default=20, help="timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    validator = load_validator()
+    headers = collect_headers(validator)
+
+    def pure_yaml(lines):
+        # The original implementation: preprocessing + yaml.safe_load
+        return validator._load_yaml_header(lines, loader=yaml.SafeLoader)
+
+    parsers = {
+        'yaml.safe_load (pure Python)': pure_yaml,
+        f'yaml.load ({validator.YAML_LOADER.__name__})': validator._load_yaml_header,
+        'load_frontmatter (fast path)': validator.load_frontmatter,
+    }
+
+    # All parsers must agree before their timings mean anything
+    reference = [repr(pure_yaml(lines)) for lines in headers]
+    for name, parse in parsers.items():
+        if [repr(parse(lines)) for lines in headers] != reference:
+            print(f"Error: {name} does not match yaml.safe_load", file=sys.stderr)
+            sys.exit(1)
+
+    fast = sum(1 for lines in headers if _is_simple(validator, lines))
+    print(f"{len(headers)} headers, {fast} handled by the restricted parser, "
+          f"{len(headers) - fast} by the YAML fallback")
+
+    baseline = None
+    for name, parse in parsers.items():
+        elapsed = time_parser(parse, headers, args.repeat)
+        baseline = baseline or elapsed
+        per_header = elapsed / len(headers) * 1e6
+        print(f"{name:36} {elapsed * 1e3:8.2f} ms  {per_header:8.1f} us/header  {baseline / elapsed:6.1f}x")
+
+
+def _is_simple(validator, lines: List[str]) -> bool:
+    try:
+        validator._parse_simple_header(lines)
+        return True
+    except (validator._UnsupportedHeader, ValueError):
+        return False
+
+
+if __name__ == '__main__':
+    main()
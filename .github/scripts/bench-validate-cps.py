@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for validate-cps.py.
+Generates a synthetic corpus of proposal READMEs shaped after
+.github/CPS-TEMPLATE.md and .github/CIP-TEMPLATE.md, then reports
+throughput, per-file latency and peak memory for `validate_file` and `main`.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from cps_validator import VALIDATOR_PATH, load_validator
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent.parent
+CPS_TEMPLATE_PATH = SCRIPT_DIR.parent / 'CPS-TEMPLATE.md'
+CIP_TEMPLATE_PATH = SCRIPT_DIR.parent / 'CIP-TEMPLATE.md'
+
+# Share of each document kind in the generated corpus
+DEFAULT_MIX = {
+    'valid': 0.6,
+    'crlf': 0.1,
+    'invalid': 0.2,
+    'cip-shaped': 0.1,
+}
+# Share of documents generated with a long body
+LONG_DOCUMENT_RATIO = 0.1
+
+# CIP labels must resolve against this checkout (the cip-refs rule): merged
+# labels use existing CIP directories, candidates use numbers not merged yet
+MERGED_CIPS = sorted(int(p.name[4:]) for p in REPO_ROOT.glob('CIP-[0-9]*') if p.is_dir() and p.name[4:].isdigit()) or [1]
+CANDIDATE_CIPS = sorted(set(range(1, 200)) - set(MERGED_CIPS))
+
+CATEGORIES = ['Meta', 'Wallets', 'Tokens', 'Metadata', 'Tools', 'Plutus', 'Ledger', 'Consensus', 'Network']
+WORDS = ('ledger block stake pool wallet token script datum redeemer epoch slot consensus network '
+         'protocol metadata governance treasury validator node relay transaction output input').split()
+
+
+def template_sections(validator, template_path: Path) -> List[str]:
+    """H2 section names of a template, in order."""
+    return validator.scan_document(template_path).headings_at(2)
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 18))]
+    return ' '.join(words).capitalize() + '.'
+
+
+def _paragraphs(rng: random.Random, count: int) -> List[str]:
+    blocks = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.15:
+            # Fenced code containing heading-like lines, which must not count as headings
+            blocks.append('```md\n# Not a heading\n## Not a section either\n```')
+        elif kind < 0.3:
+            blocks.append('\n'.join(f"- {_sentence(rng)}" for _ in range(rng.randint(2, 6))))
+        elif kind < 0.35:
+            blocks.append(f"### {_sentence(rng)[:40]}")
+        else:
+            blocks.append(' '.join(_sentence(rng) for _ in range(rng.randint(2, 6))))
+    return blocks
+
+
+def _header(rng: random.Random, number: int) -> List[str]:
+    """Valid CPS header with a varied number of list entries."""
+    large = rng.random() < 0.2
+    authors = rng.randint(1, 40 if large else 3)
+    discussions = rng.randint(1, 30 if large else 3)
+    solutions = rng.randint(0, 20 if large else 2)
+
+    lines = [
+        f"CPS: {number}",
+        f"Title: {_sentence(rng)[:60].rstrip('.')}",
+        f"Category: {rng.choice(CATEGORIES)}",
+        f"Status: {rng.choice(['Open', 'Solved', 'Inactive (Superseded)'])}",
+        "Authors:",
+    ]
+    lines += [f"    - Author {i} <author{i}@example.com>" for i in range(authors)]
+    if solutions:
+        lines.append("Proposed Solutions:")
+        for i in range(solutions):
+            if rng.random() < 0.5:
+                cip = rng.choice(MERGED_CIPS)
+                lines.append(f"    - CIP-{cip:04d}: https://github.com/cardano-foundation/CIPs/tree/master/CIP-{cip:04d}")
+            else:
+                cip = rng.choice(CANDIDATE_CIPS)
+                lines.append(f"    - CIP-{cip:04d}?: https://github.com/cardano-foundation/CIPs/pull/{rng.randint(100, 1100)}")
+    else:
+        lines.append("Proposed Solutions: []")
+    lines.append("Discussions:")
+    lines += [f"    - Discussion {i}: https://forum.example.com/t/{rng.randint(1, 99999)}" for i in range(discussions)]
+    lines.append(f"Created: {rng.randint(2020, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+    lines.append(f"License: {rng.choice(['CC-BY-4.0', 'Apache-2.0'])}")
+    return lines
+
+
+def _body(rng: random.Random, sections: List[str], long: bool) -> List[str]:
+    lines = []
+    for section in sections:
+        lines.append(f"## {section}")
+        lines.append('')
+        count = rng.randint(20, 80) if long else rng.randint(1, 4)
+        for block in _paragraphs(rng, count):
+            lines.append(block)
+            lines.append('')
+    return lines
+
+
+def _invalidate(rng: random.Random, header: List[str], sections: List[str]) -> Tuple[List[str], List[str], str]:
+    """Apply one deliberate rule violation."""
+    header = list(header)
+    sections = list(sections)
+    mutation = rng.choice([
+        'category', 'missing-section', 'h1', 'leading-zero', 'section-order',
+        'cip-label', 'cip-ref', 'unknown-section', 'field-order', 'bad-yaml',
+    ])
+    if mutation == 'category':
+        header[2] = "Category: Unknown"
+    elif mutation == 'missing-section':
+        sections.remove(rng.choice(sections[:-1]))
+    elif mutation == 'h1':
+        sections.insert(0, '__H1__')
+    elif mutation == 'leading-zero':
+        header[0] = header[0].replace('CPS: ', 'CPS: 0')
+    elif mutation == 'section-order':
+        sections[0], sections[1] = sections[1], sections[0]
+    elif mutation in ('cip-label', 'cip-ref'):
+        if mutation == 'cip-label':
+            # A pull request linked without the '?' candidate suffix
+            bad_entry = "    - CIP-0001: https://github.com/cardano-foundation/CIPs/pull/1"
+        else:
+            # A candidate label for a CIP that has been merged since
+            cip = rng.choice(MERGED_CIPS)
+            bad_entry = f"    - CIP-{cip:04d}?: https://github.com/cardano-foundation/CIPs/pull/{rng.randint(100, 1100)}"
+        if "Proposed Solutions: []" in header:
+            i = header.index("Proposed Solutions: []")
+            header[i:i + 1] = ["Proposed Solutions:", bad_entry]
+        else:
+            header.insert(header.index("Proposed Solutions:") + 1, bad_entry)
+    elif mutation == 'unknown-section':
+        sections.insert(len(sections) - 1, 'Implementation Notes')
+    elif mutation == 'field-order':
+        header[1], header[2] = header[2], header[1]
+    elif mutation == 'bad-yaml':
+        header[1] = "Title: broken: value: here"
+    return header, sections, mutation
+
+
+def generate_document(rng: random.Random, number: int, kind: str,
+                      cps_sections: List[str], cip_sections: List[str]) -> Tuple[str, bytes]:
+    """Generate one synthetic README.
+
+    Returns:
+        Tuple of (label, file bytes), where label describes the document kind
+    """
+    long = rng.random() < LONG_DOCUMENT_RATIO
+    header = _header(rng, number)
+    sections = list(cps_sections)
+    label = kind
+
+    if kind == 'invalid':
+        header, sections, mutation = _invalidate(rng, header, sections)
+        label = f"invalid:{mutation}"
+    elif kind == 'cip-shaped':
+        # A CIP filed in a CPS directory: CIP header fields and sections
+        start = next(i for i, line in enumerate(header) if line.startswith('Proposed Solutions'))
+        end = header.index("Discussions:")
+        header[start:end] = ["Implementors: []"]
+        header[0] = header[0].replace('CPS:', 'CIP:')
+        sections = list(cip_sections)
+
+    body = _body(rng, [s for s in sections if s != '__H1__'], long)
+    if '__H1__' in sections:
+        body.insert(0, f"# {_sentence(rng)[:40]}")
+
+    text = '\n'.join(['---', *header, '---', '', *body])
+    if long:
+        label += ':long'
+    newline = '\r\n' if kind == 'crlf' else '\n'
+    return label, text.replace('\n', newline).encode('utf-8')
+
+
+def generate_corpus(output_dir: Path, count: int, seed: int, mix: Dict[str, float] = DEFAULT_MIX) -> List[Path]:
+    """Write `count` synthetic README.md files under output_dir/CPS-NNNNN/.
+
+    Returns:
+        List of generated file paths, in generation order
+    """
+    validator = load_validator()
+    cps_sections = template_sections(validator, CPS_TEMPLATE_PATH)
+    cip_sections = template_sections(validator, CIP_TEMPLATE_PATH)
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[k] for k in kinds]
+
+    files = []
+    for number in range(1, count + 1):
+        kind = rng.choices(kinds, weights)[0]
+        _, content = generate_document(rng, number, kind, cps_sections, cip_sections)
+        path = output_dir / f"CPS-{number:05d}" / 'README.md'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        files.append(path)
+    return files
+
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _measure_validate_file(files: List[Path], queue):
+    """Child process body: time validate_file on each file in a fresh interpreter."""
+    validator = load_validator()
+    latencies = []
+    invalid = 0
+    start = time.perf_counter()
+    for file_path in files:
+        t0 = time.perf_counter()
+        is_valid, _ = validator.validate_file(file_path)
+        latencies.append(time.perf_counter() - t0)
+        invalid += not is_valid
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, latencies, invalid, _peak_rss_kb()))
+
+
+def bench_validate_file(files: List[Path]) -> Dict:
+    """Benchmark validate_file in an isolated process, so peak RSS is its own."""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_measure_validate_file, args=(files, queue))
+    process.start()
+    elapsed, latencies, invalid, peak_rss = queue.get()
+    process.join()
+    return {'elapsed': elapsed, 'latencies': latencies, 'invalid': invalid, 'peak_rss_kb': peak_rss}
+
+
+# Interval at which the memory of a run's process tree is sampled
+RSS_SAMPLE_INTERVAL = 0.01
+# Whether the RSS of worker processes can be read (Linux /proc)
+CAN_SAMPLE_TREE_RSS = Path('/proc/self/task').is_dir()
+
+
+def _tree_rss_kb(pid: int) -> int:
+    """Current RSS of a process and all its descendants, from /proc."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            for line in Path(f'/proc/{current}/status').read_text().splitlines():
+                if line.startswith('VmRSS:'):
+                    total += int(line.split()[1])
+                    break
+            for task in Path(f'/proc/{current}/task').iterdir():
+                pending.extend(int(child) for child in (task / 'children').read_text().split())
+        except (OSError, ValueError):
+            # The process exited while it was being read
+            continue
+    return total
+
+
+def bench_main(files: List[Path], extra_args: List[str]) -> Dict:
+    """Benchmark a full validate-cps.py run as a subprocess.
+
+    Peak RSS covers the -j worker processes too: on Linux the process tree
+    is sampled while the run goes on, and the peak of the sums is kept
+    (along with the parent's own peak, which sampling can miss). Elsewhere
+    only the parent's peak is available.
+    """
+    command = [sys.executable, str(VALIDATOR_PATH), *extra_args, *map(str, files)]
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    peak_rss = None
+    if hasattr(os, 'wait4'):
+        sampled = 0
+        while True:
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+            if pid:
+                break
+            if CAN_SAMPLE_TREE_RSS:
+                sampled = max(sampled, _tree_rss_kb(process.pid))
+            time.sleep(RSS_SAMPLE_INTERVAL)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        own = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+        peak_rss = max(own, sampled)
+    else:
+        process.wait()
+    elapsed = time.perf_counter() - start
+    return {'elapsed': elapsed, 'latencies': None, 'returncode': process.returncode, 'peak_rss_kb': peak_rss}
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def format_row(name: str, count: int, result: Dict) -> str:
+    elapsed = result['elapsed']
+    rate = count / elapsed if elapsed else float('inf')
+    if result['latencies']:
+        p50 = f"{_percentile(result['latencies'], 0.50) * 1e3:8.3f}"
+        p99 = f"{_percentile(result['latencies'], 0.99) * 1e3:8.3f}"
+    else:
+        p50 = p99 = f"{'-':>8}"
+    rss = f"{result['peak_rss_kb'] / 1024:8.1f}" if result['peak_rss_kb'] is not None else f"{'-':>8}"
+    return f"{name:32} {elapsed:8.3f} {rate:10.1f} {p50} {p99} {rss}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validate-cps.py on a synthetic CPS/CIP corpus.")
+    parser.add_argument('-n', '--count', type=int, default=2000, help="number of documents to generate (default: 2000)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the corpus (default: 0)")
+    parser.add_argument('--output', type=Path, help="keep the generated corpus in this directory")
+    parser.add_argument('--generate-only', action='store_true', help="only generate the corpus")
+    parser.add_argument('-j', '--jobs', type=int, action='append', metavar='N',
+                        help="also benchmark main with -j N; repeatable (default: 1 and CPU count)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='bench-validate-cps-') as tmp:
+        corpus_dir = args.output or Path(tmp) / 'corpus'
+        files = generate_corpus(corpus_dir, args.count, args.seed)
+        print(f"Generated {len(files)} documents in {corpus_dir}", file=sys.stderr)
+        if args.generate_only:
+            return
+
+        cache_path = Path(tmp) / 'cache.json'
+        jobs = args.jobs or sorted({1, os.cpu_count() or 1})
+
+        runs = [('validate_file', bench_validate_file(files))]
+        for n in jobs:
+            runs.append((f"main -j {n} (no cache)", bench_main(files, ['--no-cache', '-j', str(n)])))
+        runs.append(("main (cold cache)", bench_main(files, ['--cache', str(cache_path)])))
+        runs.append(("main (warm cache)", bench_main(files, ['--cache', str(cache_path)])))
+
+        print(f"{'benchmark':32} {'wall (s)':>8} {'files/s':>10} {'p50 (ms)':>8} {'p99 (ms)':>8} {'RSS (MB)':>8}")
+        for name, result in runs:
+            print(format_row(name, len(files), result))
+        scope = "including -j workers" if CAN_SAMPLE_TREE_RSS else "parent process only, -j workers not included"
+        print(f"\nRSS: peak resident memory ({scope})", file=sys.stderr)
+        print(f"\n{runs[0][1]['invalid']} of {len(files)} documents failed validation (expected: the invalid, "
+              f"CRLF and CIP-shaped ones)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
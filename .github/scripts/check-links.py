@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Link checker for CIP and CPS headers.
+Checks that the URLs listed under `Discussions` and `Proposed Solutions` are
+alive, concurrently (asyncio, pooled keep-alive connections, per-host limits)
+and with an on-disk ETag/Last-Modified cache, so repeat runs mostly avoid the
+network. The HTTP transport is pluggable, so the checker can be exercised
+against a local stand-in server.
+"""
+
+import os
+import ssl
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from cps_validator import load_validator
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent.parent
+
+DOCUMENT_GLOBS = ['CIP-*/README.md', 'CPS-*/README.md']
+LINK_FIELDS = ('Proposed Solutions', 'Discussions')
+
+DEFAULT_CACHE_PATH = REPO_ROOT / '.cache' / 'check-links.json'
+DEFAULT_TTL_HOURS = 24.0
+DEFAULT_CONCURRENCY = 32
+DEFAULT_PER_HOST = 8
+DEFAULT_TIMEOUT = 15.0
+MAX_REDIRECTS = 5
+# Larger response bodies are not read: the connection is closed instead of reused
+MAX_DISCARDED_BODY = 1 << 20
+USER_AGENT = 'CIPs-link-checker/1.0 (+https://github.com/cardano-foundation/CIPs)'
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Servers that refuse HEAD (or answer it wrongly) are retried with GET
+HEAD_RETRY_STATUSES = {400, 403, 404, 405, 501}
+# Answers that say nothing about whether the page exists (bot protection, rate limits)
+INCONCLUSIVE_STATUSES = {401, 403, 429}
+
+
+class TransportError(Exception):
+    """The request failed before an HTTP status was received."""
+
+
+@dataclass
+class HttpResponse:
+    """Status and headers (lowercase names) of one HTTP exchange; bodies are discarded."""
+    status: int
+    headers: Dict[str, str]
+
+
+class PooledHttpTransport:
+    """Minimal asyncio HTTP/1.1 client that keeps idle keep-alive connections per host.
+
+    Only what link checking needs is implemented: HEAD and GET requests
+    whose response bodies are discarded. Small Content-Length and chunked
+    bodies are read past so that the connection can be reused; any other
+    body closes it. Any object with the same `request` and `close`
+    coroutines can be used instead (e.g. one pointed at a local stand-in
+    server).
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, max_idle_per_host: int = DEFAULT_PER_HOST):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.ssl_context = ssl.create_default_context()
+        # (scheme, host, port) -> idle (reader, writer) pairs
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        """Send one request and read the response head.
+
+        Raises:
+            TransportError: on connection errors, timeouts or malformed responses
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise TransportError(f"unsupported URL: {url}")
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}", f"User-Agent: {USER_AGENT}",
+                 'Accept: */*', 'Connection: keep-alive']
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        payload = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+        # An idle connection may have been closed by the server meanwhile: retry once on a fresh one
+        for reused in (True, False):
+            connection = self._take_idle(key) if reused else None
+            if reused and connection is None:
+                continue
+            try:
+                if connection is None:
+                    connection = await asyncio.wait_for(self._connect(key), self.timeout)
+                return await asyncio.wait_for(self._exchange(key, connection, method, payload), self.timeout)
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ssl.SSLError, ValueError) as e:
+                if connection is not None:
+                    connection[1].close()
+                if reused:
+                    continue
+                raise TransportError(_describe_error(e)) from None
+        raise TransportError("no connection")
+
+    def _take_idle(self, key):
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+        return None
+
+    async def _connect(self, key):
+        scheme, hostname, port = key
+        if scheme == 'https':
+            return await asyncio.open_connection(hostname, port, ssl=self.ssl_context, server_hostname=hostname)
+        return await asyncio.open_connection(hostname, port)
+
+    async def _exchange(self, key, connection, method: str, payload: bytes) -> HttpResponse:
+        reader, writer = connection
+        writer.write(payload)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(b'', None)
+        parts = status_line.decode('latin-1').split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+            raise ValueError(f"malformed status line {status_line[:60]!r}")
+        status = int(parts[1])
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        no_body = method == 'HEAD' or status in (204, 304) or 100 <= status < 200
+        keep_alive = headers.get('connection', '').lower() != 'close'
+        if keep_alive and not no_body:
+            keep_alive = await self._discard_body(reader, headers)
+        if keep_alive and len(self._idle.setdefault(key, [])) < self.max_idle_per_host:
+            self._idle[key].append(connection)
+        else:
+            writer.close()
+        return HttpResponse(status, headers)
+
+    async def _discard_body(self, reader: asyncio.StreamReader, headers: Dict[str, str]) -> bool:
+        """Read past a response body; False when the connection cannot be reused."""
+        try:
+            if headers.get('transfer-encoding', '').lower() == 'chunked':
+                total = 0
+                while True:
+                    size = int((await reader.readline()).split(b';', 1)[0], 16)
+                    total += size
+                    if total > MAX_DISCARDED_BODY:
+                        return False
+                    if size == 0:
+                        break
+                    await reader.readexactly(size + 2)
+                # Trailer fields, up to the blank line
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return True
+            length = headers.get('content-length', '')
+            if not length.isdigit() or int(length) > MAX_DISCARDED_BODY:
+                # Delimited by the end of the connection, or too large to be worth reading
+                return False
+            await reader.readexactly(int(length))
+            return True
+        except (ValueError, asyncio.IncompleteReadError):
+            # The status is already known: only the connection is lost
+            return False
+
+    async def close(self):
+        for idle in self._idle.values():
+            for _, writer in idle:
+                writer.close()
+        self._idle.clear()
+
+
+def _describe_error(error: Exception) -> str:
+    if isinstance(error, asyncio.TimeoutError):
+        return 'timed out'
+    if isinstance(error, asyncio.IncompleteReadError):
+        return 'connection closed by server'
+    return str(error) or type(error).__name__
+
+
+@dataclass
+class LinkResult:
+    """Outcome of checking one URL."""
+    url: str
+    ok: bool
+    status: Optional[int] = None
+    error: Optional[str] = None
+    final_url: Optional[str] = None
+    inconclusive: bool = False
+    cached: bool = False
+
+    def describe(self) -> str:
+        if self.error:
+            return self.error
+        text = f"HTTP {self.status}"
+        if self.final_url and self.final_url != self.url:
+            text += f" (redirected to {self.final_url})"
+        return text
+
+
+class LinkCache:
+    """On-disk cache of link results with a time-to-live.
+
+    Fresh entries are served without touching the network. Stale entries
+    that carry an ETag or Last-Modified are revalidated with a conditional
+    request, so an unchanged page costs a 304 instead of a full check.
+    Failures are never served from the cache.
+    """
+
+    def __init__(self, path: Path, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and isinstance(data.get('entries'), dict):
+                self.entries = data['entries']
+        except (OSError, ValueError):
+            pass
+
+    def fresh(self, url: str) -> Optional[LinkResult]:
+        entry = self.entries.get(url)
+        if entry is None or not entry.get('ok') or time.time() - entry.get('checked', 0) > self.ttl:
+            return None
+        return LinkResult(url, True, entry.get('status'), final_url=entry.get('final_url'),
+                          inconclusive=entry.get('inconclusive', False), cached=True)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a stale entry."""
+        entry = self.entries.get(url)
+        if entry is None or not entry.get('ok') or entry.get('final_url', url) != url:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, result: LinkResult, response: Optional[HttpResponse] = None):
+        entry = {
+            'ok': result.ok,
+            'status': result.status,
+            'final_url': result.final_url or result.url,
+            'inconclusive': result.inconclusive,
+            'checked': time.time(),
+        }
+        previous = self.entries.get(result.url, {})
+        headers = response.headers if response is not None else {}
+        # A 304 carries no new validators: keep the ones it confirmed
+        entry['etag'] = headers.get('etag') or previous.get('etag')
+        entry['last_modified'] = headers.get('last-modified') or previous.get('last_modified')
+        self.entries[result.url] = entry
+        self.dirty = True
+
+    def save(self):
+        """Write the cache atomically, dropping entries that are long expired."""
+        if not self.dirty:
+            return
+        horizon = time.time() - 7 * self.ttl
+        entries = {url: e for url, e in self.entries.items() if e.get('checked', 0) >= horizon}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix='.check-links-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'entries': entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.dirty = False
+
+
+class LinkChecker:
+    """Check many URLs concurrently, with global and per-host concurrency limits."""
+
+    def __init__(self, transport, cache: Optional[LinkCache] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, per_host: int = DEFAULT_PER_HOST):
+        self.transport = transport
+        self.cache = cache
+        self.per_host = per_host
+        self._slots = asyncio.Semaphore(concurrency)
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = (urlsplit(url).hostname or '').lower()
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host)
+        return self._host_slots[host]
+
+    async def _request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        # Host slot first, so requests queued behind a busy host do not hold global slots
+        async with self._host_slot(url), self._slots:
+            return await self.transport.request(method, url, headers)
+
+    async def check(self, url: str) -> LinkResult:
+        """Check one URL, following redirects and falling back from HEAD to GET."""
+        if self.cache is not None:
+            cached = self.cache.fresh(url)
+            if cached is not None:
+                return cached
+        conditional = self.cache.validators(url) if self.cache is not None else {}
+
+        current = url
+        response = None
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                response = await self._request('HEAD', current, conditional)
+                if response.status in HEAD_RETRY_STATUSES:
+                    response = await self._request('GET', current, conditional)
+                if response.status in REDIRECT_STATUSES and response.headers.get('location'):
+                    current = urljoin(current, response.headers['location'])
+                    conditional = {}
+                    continue
+                break
+            else:
+                result = LinkResult(url, False, response.status, error=f"more than {MAX_REDIRECTS} redirects")
+                return self._record(result, None)
+        except TransportError as e:
+            return self._record(LinkResult(url, False, error=str(e)), None)
+
+        status = response.status
+        inconclusive = status in INCONCLUSIVE_STATUSES
+        ok = status < 400 or inconclusive
+        return self._record(LinkResult(url, ok, status, final_url=current, inconclusive=inconclusive), response)
+
+    def _record(self, result: LinkResult, response: Optional[HttpResponse]) -> LinkResult:
+        if self.cache is not None:
+            self.cache.put(result, response)
+        return result
+
+    async def check_all(self, urls: Iterable[str]) -> Dict[str, LinkResult]:
+        urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.check(url) for url in urls))
+        return dict(zip(urls, results))
+
+
+@dataclass
+class LinkUse:
+    """Where a URL appears: document, header field and 1-based entry number."""
+    path: Path
+    field_name: str
+    entry: int
+    label: str
+
+
+def _is_http_url(text: str) -> bool:
+    return ' ' not in text and urlsplit(text).scheme in ('http', 'https')
+
+
+def collect_links(files: List[Path], validator) -> Dict[str, List[LinkUse]]:
+    """URL -> every header entry (of LINK_FIELDS) that lists it, via parse_frontmatter."""
+    links: Dict[str, List[LinkUse]] = {}
+    for path in files:
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+        frontmatter, _, _ = validator.parse_frontmatter(content)
+        if not isinstance(frontmatter, dict):
+            continue
+        for field_name in LINK_FIELDS:
+            entries = frontmatter.get(field_name)
+            if not isinstance(entries, list):
+                continue
+            # CIP headers often list bare URLs rather than 'Label: URL' entries
+            found = [(i, '', entry.strip()) for i, entry in enumerate(entries)
+                     if isinstance(entry, str) and _is_http_url(entry.strip())]
+            found += [(i, label, url) for i, label, url in validator._iter_label_entries(entries) if _is_http_url(url)]
+            for i, label, url in sorted(found):
+                links.setdefault(url, []).append(LinkUse(path, field_name, i + 1, label))
+    return links
+
+
+async def run_checks(urls: List[str], cache: Optional[LinkCache], concurrency: int, per_host: int,
+                     timeout: float, transport=None) -> Dict[str, LinkResult]:
+    """Check `urls` with a pooled transport (or the given one), closing it afterwards."""
+    transport = transport or PooledHttpTransport(timeout=timeout, max_idle_per_host=per_host)
+    try:
+        return await LinkChecker(transport, cache, concurrency, per_host).check_all(urls)
+    finally:
+        await transport.close()
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Check Discussions / Proposed Solutions URLs in CIP and CPS headers.")
+    parser.add_argument('files', nargs='*', type=Path,
+                        help="README.md files to check (default: every CIP and CPS in the repository)")
+    parser.add_argument('-c', '--concurrency', type=int, default=DEFAULT_CONCURRENCY, metavar='N',
+                        help=f"requests in flight overall (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST, metavar='N',
+                        help=f"requests in flight per host (default: {DEFAULT_PER_HOST})")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, metavar='SECONDS',
+                        help=f"per-request timeout (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE_PATH, metavar='PATH',
+                        help="link cache file (default: .cache/check-links.json)")
+    parser.add_argument('--ttl', type=float, default=DEFAULT_TTL_HOURS, metavar='HOURS',
+                        help=f"serve cached successes younger than this without a request (default: {DEFAULT_TTL_HOURS:g})")
+    parser.add_argument('--no-cache', action='store_true', help="check every URL over the network")
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                        help="report format: text on stderr (default) or JSON on stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the link checker."""
+    args = parse_arguments(argv)
+    validator = load_validator()
+
+    files = list(args.files) or validator.discover_files(DOCUMENT_GLOBS)
+    links = collect_links(files, validator)
+    cache = None if args.no_cache else LinkCache(args.cache, args.ttl * 3600)
+
+    started = time.perf_counter()
+    results = asyncio.run(run_checks(list(links), cache, args.concurrency, args.per_host, args.timeout))
+    elapsed = time.perf_counter() - started
+
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"Warning: could not write link cache: {e}", file=sys.stderr)
+
+    broken = {url: result for url, result in results.items() if not result.ok}
+    if args.format == 'json':
+        print(json.dumps({
+            'links': [
+                {**vars(result), 'uses': [{**vars(use), 'path': use.path.as_posix()} for use in links[url]]}
+                for url, result in results.items()
+            ],
+            'summary': {'links': len(results), 'broken': len(broken),
+                        'cached': sum(1 for r in results.values() if r.cached), 'seconds': round(elapsed, 3)},
+        }, indent=2))
+    else:
+        by_file: Dict[Path, List[str]] = {}
+        for url, result in broken.items():
+            for use in links[url]:
+                by_file.setdefault(use.path, []).append(
+                    f"'{use.field_name}' entry {use.entry}{f' ({use.label})' if use.label else ''}: {url} -> {result.describe()}")
+        for path in sorted(by_file):
+            print(f"\nBroken links in {path}:", file=sys.stderr)
+            for message in by_file[path]:
+                print(f"  - {message}", file=sys.stderr)
+        inconclusive = sum(1 for r in results.values() if r.inconclusive)
+        cached = sum(1 for r in results.values() if r.cached)
+        print(f"\nChecked {len(results)} link(s) from {len(files)} file(s) in {elapsed:.1f}s "
+              f"({cached} from cache, {inconclusive} inconclusive, {len(broken)} broken)", file=sys.stderr)
+
+    sys.exit(1 if broken else 0)
+
+
+if __name__ == '__main__':
+    main()
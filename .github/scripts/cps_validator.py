@@ -0,0 +1,23 @@
+"""Import helper shared by the scripts that reuse validate-cps.py.
+
+The validator's hyphenated file name rules out a plain `import`, so the
+scripts next to it load it through `load_validator()`:
+
+    from cps_validator import load_validator
+
+    validator = load_validator()
+    validator.load_frontmatter(path)
+"""
+
+import importlib.util
+from pathlib import Path
+
+VALIDATOR_PATH = Path(__file__).resolve().parent / 'validate-cps.py'
+
+
+def load_validator():
+    """Import a fresh copy of validate-cps.py as the module `validate_cps`."""
+    spec = importlib.util.spec_from_file_location('validate_cps', VALIDATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
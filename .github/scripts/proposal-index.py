@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Metadata index and query tool for CIP and CPS headers.
+Every CIP-*/README.md and CPS-*/README.md header is parsed with
+validate-cps.py's parse_frontmatter and stored in a SQLite index under
+.cache/. The index is refreshed incrementally before each query (by file
+mtime and size, then content hash), so only edited documents are re-parsed.
+"""
+
+import re
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cps_validator import VALIDATOR_PATH, load_validator
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent.parent
+
+DEFAULT_INDEX_PATH = REPO_ROOT / '.cache' / 'proposal-index.sqlite'
+DOCUMENT_GLOBS = ['CIP-*/README.md', 'CPS-*/README.md']
+
+# Bump when the table layout or the extracted columns change
+INDEX_FORMAT = 1
+
+PROPOSAL_DIR_PATTERN = re.compile(r'^(CIP|CPS)-(\d+)$')
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+LONG_DATE_PATTERN = re.compile(r'(\d{1,2}) ([A-Za-z]+) (\d{4})')
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    number INTEGER,
+    title TEXT,
+    status TEXT,
+    category TEXT,
+    created TEXT,
+    header TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS authors (
+    path TEXT NOT NULL REFERENCES documents(path) ON DELETE CASCADE,
+    author TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_status ON documents(status COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS documents_category ON documents(category COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS documents_created ON documents(created);
+CREATE INDEX IF NOT EXISTS authors_path ON authors(path);
+"""
+
+
+def index_version() -> str:
+    """Identify the index format and the header parser that produced it.
+
+    A change to validate-cps.py may change how headers parse, so it
+    invalidates the whole index.
+    """
+    digest = hashlib.sha256(VALIDATOR_PATH.read_bytes()).hexdigest()
+    return f"{INDEX_FORMAT}:{digest}"
+
+
+def normalize_created(value) -> Optional[str]:
+    """ISO date (YYYY-MM-DD) for a Created header value, or None if unrecognised.
+
+    Most headers hold a YAML date; a few hold free text such as "2024-12-3" or
+    "4 April 2022 (original), 20 May 2025 (updated)", of which the first date is used.
+    """
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if not isinstance(value, str):
+        return None
+    match = ISO_DATE_PATTERN.search(value)
+    try:
+        if match:
+            return date(*map(int, match.groups())).isoformat()
+        match = LONG_DATE_PATTERN.search(value)
+        if match:
+            return datetime.strptime(' '.join(match.groups()), '%d %B %Y').date().isoformat()
+    except ValueError:
+        pass
+    return None
+
+
+def _header_text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _header_authors(value) -> List[str]:
+    if isinstance(value, list):
+        return [str(author) for author in value if author is not None]
+    if value is None:
+        return []
+    return [str(value)]
+
+
+class ProposalIndex:
+    """SQLite index of proposal headers, refreshed incrementally."""
+
+    def __init__(self, path: Path = DEFAULT_INDEX_PATH, root: Path = REPO_ROOT):
+        self.path = path
+        self.root = root
+        self._validator = None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.execute('PRAGMA foreign_keys = ON')
+        self.db.executescript(SCHEMA_SQL)
+        self._check_version()
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_version(self):
+        version = index_version()
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is not None and row[0] == version:
+            return
+        # Different format or parser: start afresh
+        with self.db:
+            self.db.execute('DELETE FROM documents')
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (version,))
+
+    @property
+    def validator(self):
+        # Loaded lazily: an up-to-date index answers queries without yaml/jsonschema
+        if self._validator is None:
+            self._validator = load_validator()
+        return self._validator
+
+    def _discover(self) -> List[str]:
+        found = set()
+        for pattern in DOCUMENT_GLOBS:
+            for path in self.root.glob(pattern):
+                if path.is_file():
+                    found.add(path.relative_to(self.root).as_posix())
+        return sorted(found)
+
+    def refresh(self, force: bool = False) -> Tuple[int, int]:
+        """Bring the index up to date with the working tree.
+
+        Files whose mtime and size are unchanged are skipped without being
+        read; files that were touched but whose content hash is unchanged only
+        have their stat information updated.
+
+        Returns:
+            Tuple of (documents re-parsed, documents removed)
+        """
+        known = {
+            path: (mtime_ns, size, sha256)
+            for path, mtime_ns, size, sha256 in self.db.execute('SELECT path, mtime_ns, size, sha256 FROM documents')
+        }
+        files = self._discover()
+        parsed = 0
+        with self.db:
+            for relative in files:
+                stat = (self.root / relative).stat()
+                previous = known.get(relative)
+                if not force and previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                content = (self.root / relative).read_bytes()
+                digest = hashlib.sha256(content).hexdigest()
+                if not force and previous is not None and previous[2] == digest:
+                    self.db.execute('UPDATE documents SET mtime_ns = ?, size = ? WHERE path = ?',
+                                    (stat.st_mtime_ns, stat.st_size, relative))
+                    continue
+                self._store(relative, content, digest, stat.st_mtime_ns, stat.st_size)
+                parsed += 1
+            removed = set(known) - set(files)
+            self.db.executemany('DELETE FROM documents WHERE path = ?', [(path,) for path in removed])
+        return parsed, len(removed)
+
+    def _parse_header(self, content: bytes) -> Optional[Dict]:
+        try:
+            text = content.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        frontmatter, _, _ = self.validator.parse_frontmatter(text)
+        return frontmatter if isinstance(frontmatter, dict) else None
+
+    def _store(self, relative: str, content: bytes, digest: str, mtime_ns: int, size: int):
+        header = self._parse_header(content) or {}
+        match = PROPOSAL_DIR_PATTERN.match(Path(relative).parent.name)
+        kind, number = (match.group(1), int(match.group(2))) if match else (relative.split('-', 1)[0], None)
+        self.db.execute('DELETE FROM documents WHERE path = ?', (relative,))
+        self.db.execute(
+            'INSERT INTO documents (path, kind, number, title, status, category, created, header, mtime_ns, size, sha256) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (relative, kind, number,
+             _header_text(header.get('Title')),
+             _header_text(header.get('Status')),
+             _header_text(header.get('Category')),
+             normalize_created(header.get('Created')),
+             json.dumps(header, default=str),
+             mtime_ns, size, digest))
+        self.db.executemany('INSERT INTO authors (path, author) VALUES (?, ?)',
+                            [(relative, author) for author in _header_authors(header.get('Authors'))])
+
+    def query(self, kinds: Iterable[str] = (), statuses: Iterable[str] = (), categories: Iterable[str] = (),
+              authors: Iterable[str] = (), created_after: Optional[date] = None,
+              created_before: Optional[date] = None) -> List[Dict]:
+        """Select proposals matching every given filter.
+
+        Several values for one filter match any of them. Status and category
+        match case-insensitively, and a status also matches its qualified
+        forms ("Inactive" matches "Inactive (superseded by ...)"). Authors
+        match by case-insensitive substring. Created bounds are inclusive.
+
+        Returns:
+            Matching proposals ordered by kind and number
+        """
+        clauses = []
+        params: List = []
+
+        def any_of(values: Iterable[str], template: str, bind=lambda value: (value,)):
+            values = list(values)
+            if values:
+                clauses.append('(' + ' OR '.join([template] * len(values)) + ')')
+                for value in values:
+                    params.extend(bind(value))
+
+        any_of([k.upper() for k in kinds], 'kind = ?')
+        any_of(statuses, "(status = ? COLLATE NOCASE OR status LIKE ? ESCAPE '\\')",
+               lambda status: (status, _like_escape(status) + ' (%'))
+        any_of(categories, 'category = ? COLLATE NOCASE')
+        any_of(authors, "EXISTS (SELECT 1 FROM authors a WHERE a.path = documents.path AND a.author LIKE ? ESCAPE '\\')",
+               lambda author: (f"%{_like_escape(author)}%",))
+        if created_after is not None:
+            clauses.append('created >= ?')
+            params.append(created_after.isoformat())
+        if created_before is not None:
+            clauses.append('created <= ?')
+            params.append(created_before.isoformat())
+
+        where = ' WHERE ' + ' AND '.join(clauses) if clauses else ''
+        sql = f'SELECT path, kind, number, title, status, category, created FROM documents{where}'
+        rows = self.db.execute(sql + ' ORDER BY kind, number, path', params).fetchall()
+
+        # Authors of the matched documents only, looked up through authors_path
+        author_rows: Dict[str, List[str]] = {}
+        if rows:
+            author_sql = f'SELECT path, author FROM authors WHERE path IN (SELECT path FROM documents{where}) ORDER BY rowid'
+            for path, author in self.db.execute(author_sql, params):
+                author_rows.setdefault(path, []).append(author)
+        return [
+            {
+                'path': path,
+                'proposal': f"{kind}-{number:04d}" if number is not None else kind,
+                'title': title,
+                'status': status,
+                'category': category,
+                'created': created,
+                'authors': author_rows.get(path, []),
+            }
+            for path, kind, number, title, status, category, created in rows
+        ]
+
+
+def _like_escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def format_text(proposals: List[Dict]) -> str:
+    """One aligned line per proposal: id, status, category, created, title."""
+    columns = [
+        [p['proposal'], p['status'] or '-', p['category'] or '-', p['created'] or '-', p['title'] or '']
+        for p in proposals
+    ]
+    if not columns:
+        return ''
+    widths = [max(len(row[i]) for row in columns) for i in range(4)]
+    return '\n'.join(
+        '  '.join(cell.ljust(width) for cell, width in zip(row[:4], widths)) + '  ' + row[4]
+        for row in columns
+    )
+
+
+def _iso_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a YYYY-MM-DD date, got '{value}'")
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Query CIP/CPS header metadata from an incrementally maintained index.",
+        epilog="Repeat a filter to match any of its values; different filters must all match.")
+    parser.add_argument('--kind', action='append', default=[], choices=['CIP', 'CPS', 'cip', 'cps'],
+                        help="proposal kind")
+    parser.add_argument('--status', action='append', default=[], help="Status (e.g. Open, Active, Inactive)")
+    parser.add_argument('--category', action='append', default=[], help="Category (e.g. Consensus, Ledger)")
+    parser.add_argument('--author', action='append', default=[], help="substring of an Authors entry (name or email)")
+    parser.add_argument('--created-after', '--since', type=_iso_date, metavar='YYYY-MM-DD',
+                        help="Created on or after this date")
+    parser.add_argument('--created-before', '--until', type=_iso_date, metavar='YYYY-MM-DD',
+                        help="Created on or before this date")
+    parser.add_argument('--format', choices=['text', 'json', 'paths'], default='text', help="output format")
+    parser.add_argument('--index', type=Path, default=DEFAULT_INDEX_PATH,
+                        help=f"index file (default: {DEFAULT_INDEX_PATH.relative_to(REPO_ROOT)})")
+    parser.add_argument('--rebuild', action='store_true', help="re-parse every document")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the query tool."""
+    args = parse_arguments(argv)
+
+    with ProposalIndex(args.index) as index:
+        index.refresh(force=args.rebuild)
+        proposals = index.query(kinds=args.kind, statuses=args.status, categories=args.category,
+                                authors=args.author, created_after=args.created_after,
+                                created_before=args.created_before)
+
+    if args.format == 'json':
+        print(json.dumps(proposals, indent=2))
+    elif args.format == 'paths':
+        for proposal in proposals:
+            print(proposal['path'])
+    else:
+        if proposals:
+            print(format_text(proposals))
+        print(f"\n{len(proposals)} proposal(s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
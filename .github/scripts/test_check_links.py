@@ -0,0 +1,300 @@
+"""
+Tests for check-links.py, run against a local `http.server` stand-in.
+
+    python3 -m unittest discover -s .github/scripts
+"""
+
+import json
+import time
+import asyncio
+import tempfile
+import threading
+import unittest
+import importlib.util
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).resolve().parent / 'check-links.py'
+
+
+def load_check_links():
+    """Import check-links.py, whose hyphenated name rules out a plain `import`."""
+    spec = importlib.util.spec_from_file_location('check_links', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+check_links = load_check_links()
+
+ETAG = '"v1"'
+LAST_MODIFIED = 'Mon, 05 Oct 2026 10:00:00 GMT'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes of the stand-in server, by path (the query string is ignored):
+
+    /ok          200 to HEAD and GET
+    /chunked     405 to HEAD, 200 with a chunked body to GET
+    /no-head     405 to HEAD, 200 with a Content-Length body to GET
+    /missing     404 to HEAD and GET
+    /redirect    301 to /ok, by a relative Location
+    /loop        302 to itself
+    /etag        200 with an ETag and a Last-Modified, 304 when either matches
+    /drop        200, then closes the connection without announcing it
+    /slow        200 after 0.2s
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.respond(with_body=False)
+
+    def do_GET(self):
+        self.respond(with_body=True)
+
+    def respond(self, with_body: bool):
+        route = self.path.split('?', 1)[0]
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path, dict(self.headers)))
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            if route == '/slow':
+                time.sleep(0.2)
+            if route in ('/chunked', '/no-head') and not with_body:
+                self.send_body(405, with_body)
+            elif route == '/chunked':
+                self.send_response(200)
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for chunk in (b'hello, ', b'chunked ', b'world'):
+                    self.wfile.write(b'%x;ext=1\r\n%s\r\n' % (len(chunk), chunk))
+                self.wfile.write(b'0\r\nX-Trailer: done\r\n\r\n')
+            elif route == '/missing':
+                self.send_body(404, with_body)
+            elif route == '/redirect':
+                self.send_body(301, with_body, {'Location': 'ok'})
+            elif route == '/loop':
+                self.send_body(302, with_body, {'Location': self.path})
+            elif route == '/etag':
+                if self.headers.get('If-None-Match') == ETAG or self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+                    self.send_response(304)
+                    self.send_header('ETag', ETAG)
+                    self.end_headers()
+                else:
+                    self.send_body(200, with_body, {'ETag': ETAG, 'Last-Modified': LAST_MODIFIED})
+            elif route == '/drop':
+                self.send_body(200, with_body)
+                self.close_connection = True
+            else:
+                self.send_body(200, with_body)
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def send_body(self, status: int, with_body: bool = True, headers=None):
+        body = b'<html>stand-in</html>'
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+    def methods(self):
+        return [(method, path.split('?', 1)[0]) for method, path, _ in self.requests]
+
+
+class StandInTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = StandInServer()
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def check(self, *paths, cache=None, transport=None, concurrency=8, per_host=8):
+        """Results of checking the stand-in's `paths`, by path."""
+        urls = [self.server.url(path) for path in paths]
+        results = asyncio.run(check_links.run_checks(urls, cache, concurrency, per_host, 5.0, transport))
+        return {path: results[url] for path, url in zip(paths, urls)}
+
+
+class TransportTest(StandInTestCase):
+    def exchange(self, *requests):
+        """Responses to (method, path) requests sent one after the other on one transport."""
+        async def run():
+            transport = check_links.PooledHttpTransport(timeout=5.0)
+            try:
+                return [await transport.request(method, self.server.url(path)) for method, path in requests]
+            finally:
+                await transport.close()
+        return asyncio.run(run())
+
+    def test_keep_alive_reuses_the_connection(self):
+        responses = self.exchange(('HEAD', '/ok'), ('HEAD', '/ok'), ('GET', '/ok'), ('HEAD', '/ok'))
+        self.assertEqual([r.status for r in responses], [200, 200, 200, 200])
+        self.assertEqual(self.server.connections, 1)
+
+    def test_chunked_body_is_read_past(self):
+        responses = self.exchange(('GET', '/chunked'), ('GET', '/chunked'), ('HEAD', '/ok'))
+        self.assertEqual([r.status for r in responses], [200, 200, 200])
+        self.assertEqual(responses[0].headers['transfer-encoding'], 'chunked')
+        self.assertEqual(self.server.connections, 1)
+
+    def test_dropped_idle_connection_is_replaced(self):
+        responses = self.exchange(('HEAD', '/drop'), ('HEAD', '/ok'))
+        self.assertEqual([r.status for r in responses], [200, 200])
+        self.assertEqual(self.server.connections, 2)
+
+    def test_connection_refused_is_a_transport_error(self):
+        port = self.server.server_address[1]
+        self.server.shutdown()
+        self.server.server_close()
+
+        async def run():
+            transport = check_links.PooledHttpTransport(timeout=5.0)
+            try:
+                await transport.request('HEAD', f"http://127.0.0.1:{port}/ok")
+            finally:
+                await transport.close()
+        with self.assertRaises(check_links.TransportError):
+            asyncio.run(run())
+
+
+class LinkCheckerTest(StandInTestCase):
+    def test_ok_and_missing(self):
+        results = self.check('/ok', '/missing')
+        self.assertTrue(results['/ok'].ok)
+        self.assertEqual(results['/ok'].status, 200)
+        self.assertFalse(results['/missing'].ok)
+        self.assertEqual(results['/missing'].status, 404)
+        # A 404 to HEAD is retried with GET before being reported
+        self.assertEqual(self.server.methods().count(('GET', '/missing')), 1)
+
+    def test_redirect_is_followed(self):
+        result = self.check('/redirect')['/redirect']
+        self.assertTrue(result.ok)
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.final_url, self.server.url('/ok'))
+        self.assertIn('redirected to', result.describe())
+
+    def test_redirect_loop_is_broken(self):
+        result = self.check('/loop')['/loop']
+        self.assertFalse(result.ok)
+        self.assertEqual(result.status, 302)
+        self.assertIn('redirects', result.error)
+        self.assertEqual(self.server.methods().count(('HEAD', '/loop')), check_links.MAX_REDIRECTS + 1)
+
+    def test_head_405_falls_back_to_get(self):
+        results = self.check('/no-head', '/chunked')
+        for path in ('/no-head', '/chunked'):
+            self.assertTrue(results[path].ok)
+            self.assertEqual(results[path].status, 200)
+            self.assertEqual(self.server.methods().count(('HEAD', path)), 1)
+            self.assertEqual(self.server.methods().count(('GET', path)), 1)
+
+    def test_per_host_limit(self):
+        paths = [f"/slow?{i}" for i in range(6)]
+        results = self.check(*paths, concurrency=32, per_host=2)
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(self.server.max_in_flight, 2)
+
+    def test_global_limit(self):
+        paths = [f"/slow?{i}" for i in range(6)]
+        self.check(*paths, concurrency=3, per_host=8)
+        self.assertEqual(self.server.max_in_flight, 3)
+
+
+class LinkCacheTest(StandInTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_path = Path(directory.name) / 'links.json'
+
+    def cache(self, ttl=3600.0):
+        return check_links.LinkCache(self.cache_path, ttl)
+
+    def age(self, seconds: float):
+        """Make every saved entry `seconds` older."""
+        data = json.loads(self.cache_path.read_text())
+        for entry in data['entries'].values():
+            entry['checked'] -= seconds
+        self.cache_path.write_text(json.dumps(data))
+
+    def test_fresh_entries_skip_the_network(self):
+        cache = self.cache()
+        self.check('/ok', cache=cache)
+        cache.save()
+        requests = len(self.server.requests)
+        result = self.check('/ok', cache=self.cache())['/ok']
+        self.assertTrue(result.ok)
+        self.assertTrue(result.cached)
+        self.assertEqual(len(self.server.requests), requests)
+
+    def test_failures_are_not_served_from_the_cache(self):
+        cache = self.cache()
+        self.check('/missing', cache=cache)
+        cache.save()
+        result = self.check('/missing', cache=self.cache())['/missing']
+        self.assertFalse(result.ok)
+        self.assertFalse(result.cached)
+
+    def test_expired_entry_is_revalidated(self):
+        cache = self.cache(ttl=60.0)
+        self.check('/etag', cache=cache)
+        cache.save()
+        self.assertEqual(cache.entries[self.server.url('/etag')]['etag'], ETAG)
+        self.age(120.0)
+
+        cache = self.cache(ttl=60.0)
+        result = self.check('/etag', cache=cache)['/etag']
+        self.assertTrue(result.ok)
+        self.assertFalse(result.cached)
+        self.assertEqual(result.status, 304)
+        _, _, headers = self.server.requests[-1]
+        self.assertEqual(headers.get('If-None-Match'), ETAG)
+        self.assertEqual(headers.get('If-Modified-Since'), LAST_MODIFIED)
+        # The 304 confirms the validators, which are kept for the next revalidation
+        entry = cache.entries[self.server.url('/etag')]
+        self.assertEqual((entry['etag'], entry['last_modified']), (ETAG, LAST_MODIFIED))
+
+    def test_long_expired_entries_are_dropped(self):
+        cache = self.cache(ttl=60.0)
+        self.check('/ok', cache=cache)
+        cache.save()
+        self.age(8 * 60.0)
+        cache = self.cache(ttl=60.0)
+        cache.dirty = True
+        cache.save()
+        self.assertEqual(json.loads(self.cache_path.read_text())['entries'], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for validate-cps.py.
+
+    python3 -m unittest discover -s .github/scripts
+"""
+
+import random
+import unittest
+from pathlib import Path
+
+import yaml
+
+from cps_validator import load_validator
+
+validator = load_validator()
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def yaml_path(lines):
+    """The header as the original parser read it: preprocessing and yaml.safe_load."""
+    return validator._load_yaml_header(lines, loader=yaml.SafeLoader)
+
+
+class FrontmatterParityTest(unittest.TestCase):
+    """load_frontmatter (restricted parser, libyaml fallback) must match the pure YAML path."""
+
+    def assertParity(self, lines):
+        self.assertEqual(repr(validator.load_frontmatter(lines)), repr(yaml_path(lines)), lines)
+
+    def test_repository_headers(self):
+        for path in sorted(REPO_ROOT.glob('C[IP][PS]-*/README.md')):
+            doc = validator.scan_text(path.read_text(encoding='utf-8'))
+            if doc.frontmatter_lines is not None:
+                with self.subTest(path=path.parent.name):
+                    self.assertParity(doc.frontmatter_lines)
+
+    def test_line_endings(self):
+        # CRLF files split on '\n' keep a trailing '\r', which YAML reads as a line break
+        self.assertParity(['CPS: 1\r', 'Title: a\r', 'Authors:\r', '  - A <a@b.c>\r'])
+        self.assertParity(['Title: a\r'])
+        self.assertParity(['Title: \r'])
+        self.assertParity(['Title: \rb'])
+        # Only the --- delimiters must be exact: a '\r' inside the header reaches the parsers
+        self.assertEqual(validator.parse_frontmatter('---\nTitle: a\r\nCPS: 1\r\n---\nbody\n')[0], {'Title': 'a', 'CPS': 1})
+
+    def test_unusual_characters(self):
+        for text in ('\t', '\x85', ' ', ' ', '﻿', '\x00', '\x0b', '\x0c', '\x1b', '\xa0', '\u3000', '\xe9'):
+            with self.subTest(char=repr(text)):
+                self.assertParity([f"Title: a{text}b"])
+                self.assertParity([f"Title: {text}a"])
+                self.assertParity(['Discussions:', f"  - a{text}b"])
+                self.assertParity([f"CPS: {text}?"])
+
+    def test_flow_collections(self):
+        # libyaml rejects these, the pure-Python loader accepts them
+        self.assertParity(['Title: [?]'])
+        self.assertParity(['Title: {? a}'])
+        self.assertParity(['CPS:  [', 'Key:]'])
+        # ... and these the other way round
+        self.assertParity(['- ', '- {1?}'])
+        self.assertParity(['a:  [<<', '- ?]'])
+
+    def test_scalars_without_constructor(self):
+        self.assertParity(['Title: ='])
+        self.assertParity(['Title: <<'])
+
+    def test_fuzzed_headers(self):
+        pieces = ['a', 'b', ' ', '-', ':', '?', '\r', '\t', '\x85', ' ', '﻿', '\x0b', '1', '2021-01-01',
+                  '#', '"', "'", '[', ']', '{', '}', ',', '\xa0', 'x y', 'http://a.b/c', '~', 'null', 'true', '0x1f', '.5', '=', '<<']
+        keys = ['CPS', 'Title', 'Proposed Solutions', 'a']
+        rng = random.Random(0)
+        for _ in range(3000):
+            lines = []
+            for _ in range(rng.randint(1, 4)):
+                value = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 4)))
+                if rng.random() < 0.6:
+                    lines.append(f"{rng.choice(keys)}:{rng.choice(['', ' ', '  '])}{value}")
+                else:
+                    lines.append(f"{rng.choice(['', '  '])}- {value}")
+            self.assertParity(lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
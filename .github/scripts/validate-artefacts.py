@@ -0,0 +1,730 @@
+#!/usr/bin/env python3
+"""
+Batch validation of the JSON and CDDL artefacts shipped inside proposals.
+Every JSON file must parse and every JSON Schema must conform to its
+meta-schema; example documents next to a schema (`X.json` or `X.*.json`
+beside `X.schema.json`, or any JSON file beside a `schema.json`) must
+validate against it; every CDDL file must follow the RFC 8610 grammar.
+Results are cached by content hash, and schemas are compiled once and
+checked against their examples in a process pool.
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+import importlib.metadata
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
+
+try:
+    import jsonschema
+    from referencing import Registry, Resource
+    from referencing.exceptions import NoSuchResource, Unresolvable
+    from referencing.jsonschema import DRAFT7
+except ImportError:
+    print("Error: jsonschema library is required. Install it with: pip install jsonschema", file=sys.stderr)
+    sys.exit(1)
+
+from cps_validator import load_validator
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent.parent
+
+JSON_GLOBS = ['CIP-*/**/*.json', 'CPS-*/**/*.json']
+CDDL_GLOBS = ['CIP-*/**/*.cddl', 'CPS-*/**/*.cddl']
+
+DEFAULT_CACHE_PATH = REPO_ROOT / '.cache' / 'validate-artefacts.json'
+
+# Schemas that do not declare a dialect are read as draft-07, the dialect
+# most proposals that do declare one use
+DEFAULT_VALIDATOR = jsonschema.Draft7Validator
+DEFAULT_SPECIFICATION = DRAFT7
+
+# $refs to this repository on GitHub are resolved against the checkout
+GITHUB_FILE_URL_PATTERN = re.compile(
+    r'^https://(?:raw\.githubusercontent\.com/cardano-foundation/CIPs/[^/]+'
+    r'|github\.com/cardano-foundation/CIPs/(?:blob|raw)/[^/]+)/(.+)$')
+
+# Longest schema error message reported verbatim
+MAX_MESSAGE_LENGTH = 200
+
+JSON_SYNTAX_RULE = 'json-syntax'
+JSON_SCHEMA_RULE = 'json-schema'
+SCHEMA_EXAMPLE_RULE = 'schema-example'
+CDDL_SYNTAX_RULE = 'cddl-syntax'
+
+
+# CDDL (RFC 8610)
+
+class CddlSyntaxError(ValueError):
+    """A CDDL document does not follow the RFC 8610 grammar."""
+
+    def __init__(self, message: str, line: int):
+        super().__init__(f"line {line}: {message}")
+        self.message = message
+        self.line = line
+
+
+_CDDL_TOKEN_PATTERN = re.compile(r'''
+    (?P<space>[ \t\r\n]+|;[^\n]*)
+  | (?P<text>"(?:[^"\\]|\\.)*")
+  | (?P<bytes>(?:h|b64)?'(?:[^'\\]|\\.)*')
+  | (?P<number>-?(?:0x[0-9a-fA-F]+(?:\.[0-9a-fA-F]+)?(?:p[+-]?\d+)?|0b[01]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?))
+  | (?P<ctlop>\.[A-Za-z@_$](?:[-.]*[A-Za-z0-9@_$])*)
+  | (?P<id>[A-Za-z@_$](?:[-.]*[A-Za-z0-9@_$])*)
+  | (?P<punct>\.\.\.|\.\.|//=|/=|//|=>|[=/:,()\[\]{}<>~&#?*+^])
+''', re.VERBOSE)
+
+
+def tokenize_cddl(text: str) -> List[Tuple[str, str, int, int]]:
+    """Split CDDL into (kind, text, line, offset) tokens, dropping whitespace and comments.
+
+    Raises:
+        CddlSyntaxError: on a character that cannot start any token
+    """
+    tokens = []
+    position = 0
+    line = 1
+    while position < len(text):
+        match = _CDDL_TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise CddlSyntaxError(f"unexpected character {text[position]!r}", line)
+        kind = match.lastgroup
+        if kind != 'space':
+            tokens.append((kind, match.group(), line, position))
+        line += match.group().count('\n')
+        position = match.end()
+    return tokens
+
+
+class _CddlParser:
+    """Recursive-descent recogniser for the RFC 8610 (Appendix B) grammar.
+
+    Only syntax is checked: rule names are not resolved.
+    """
+
+    def __init__(self, text: str):
+        self.tokens = tokenize_cddl(text)
+        self.index = 0
+
+    # Token helpers
+
+    def peek(self, offset: int = 0) -> Tuple[str, str, int, int]:
+        i = self.index + offset
+        if i < len(self.tokens):
+            return self.tokens[i]
+        last_line = self.tokens[-1][2] if self.tokens else 1
+        return ('eof', '', last_line, -1)
+
+    def adjacent(self, offset: int = 0) -> bool:
+        """Whether token `offset` ends exactly where the following token starts."""
+        first, second = self.peek(offset), self.peek(offset + 1)
+        return second[0] != 'eof' and first[3] + len(first[1]) == second[3]
+
+    def at(self, *texts: str) -> bool:
+        kind, text, _, _ = self.peek()
+        return kind in ('punct', 'eof') and text in texts
+
+    def take(self, *texts: str) -> bool:
+        if self.at(*texts):
+            self.index += 1
+            return True
+        return False
+
+    def expect(self, text: str, context: str):
+        if not self.take(text):
+            self.fail(f"expected '{text}' {context}")
+
+    def fail(self, message: str):
+        kind, text, line, _ = self.peek()
+        found = 'end of file' if kind == 'eof' else repr(text)
+        raise CddlSyntaxError(f"{message}, found {found}", line)
+
+    # Grammar
+
+    def parse(self):
+        if not self.tokens:
+            raise CddlSyntaxError("no rules", 1)
+        while self.peek()[0] != 'eof':
+            self.rule()
+
+    def rule(self):
+        if self.peek()[0] != 'id':
+            self.fail("expected a rule name")
+        self.index += 1
+        if self.at('<'):
+            self.generic_parameters()
+        if self.take('/='):
+            self.type()
+        elif self.take('//='):
+            self.group_entry()
+        elif self.take('='):
+            # Type and group rules are indistinguishable without name resolution;
+            # a group entry covers both (a bare type is an entry without a key).
+            # Top-level group choices ('a = 0 // 2') are accepted like the cddl tool does.
+            self.group_entry()
+            while self.take('//'):
+                self.group_entry()
+        else:
+            self.fail("expected '=', '/=' or '//=' after the rule name")
+
+    def generic_parameters(self):
+        self.expect('<', "to open generic parameters")
+        while True:
+            if self.peek()[0] != 'id':
+                self.fail("expected a generic parameter name")
+            self.index += 1
+            if not self.take(','):
+                break
+        self.expect('>', "to close generic parameters")
+
+    def generic_arguments(self):
+        self.expect('<', "to open generic arguments")
+        while True:
+            self.type1()
+            if not self.take(','):
+                break
+        self.expect('>', "to close generic arguments")
+
+    def type(self):
+        self.type1()
+        while self.take('/'):
+            self.type1()
+
+    def type1(self):
+        self.type2()
+        kind, text, _, _ = self.peek()
+        if kind == 'punct' and text in ('..', '...'):
+            self.index += 1
+            self.type2()
+        elif kind == 'ctlop':
+            self.index += 1
+            self.type2()
+
+    def type2(self):
+        kind, text, _, _ = self.peek()
+        if kind in ('number', 'text', 'bytes'):
+            self.index += 1
+        elif self.at('<') and self.adjacent() and self.peek(1)[1] == '<':
+            # '<<type>>' embedded CBOR: not RFC 8610, but common in Cardano CDDL
+            self.index += 2
+            self.type()
+            self.expect('>', "to close embedded CBOR '>>'")
+            self.expect('>', "to close embedded CBOR '>>'")
+        elif kind == 'id':
+            self.index += 1
+            if self.at('<'):
+                self.generic_arguments()
+        elif self.take('('):
+            self.type()
+            self.expect(')', "to close a parenthesised type")
+        elif self.take('{'):
+            self.group('}')
+            self.expect('}', "to close a map")
+        elif self.take('['):
+            self.group(']')
+            self.expect(']', "to close an array")
+        elif self.take('~'):
+            if self.peek()[0] != 'id':
+                self.fail("expected a name after '~'")
+            self.index += 1
+            if self.at('<'):
+                self.generic_arguments()
+        elif self.take('&'):
+            if self.take('('):
+                self.group(')')
+                self.expect(')', "to close a choice-from-group")
+            elif self.peek()[0] == 'id':
+                self.index += 1
+                if self.at('<'):
+                    self.generic_arguments()
+            else:
+                self.fail("expected '(' or a group name after '&'")
+        elif self.take('#'):
+            # '#', '#6', '#6.32(type)', '#7.25'
+            kind, text, _, _ = self.peek()
+            if kind == 'number' and text[0].isdigit() and self.adjacent(-1):
+                self.index += 1
+                if self.take('('):
+                    self.type()
+                    self.expect(')', "to close a tagged type")
+        else:
+            self.fail("expected a type")
+
+    def group(self, closer: str):
+        self.group_choice(closer)
+        while self.take('//'):
+            self.group_choice(closer)
+
+    def group_choice(self, closer: str):
+        while not self.at(closer, '//') and self.peek()[0] != 'eof':
+            self.group_entry()
+            self.take(',')
+
+    def occurrence(self):
+        # Occurrence bounds are written without spaces ('1*3'); in '* 3 .. 255 => x'
+        # the 3 starts a member key instead
+        kind, text, _, _ = self.peek()
+        if self.at('?', '+'):
+            self.index += 1
+            return
+        if kind == 'number' and text.isdigit() and self.peek(1)[1] == '*' and self.adjacent():
+            self.index += 1
+        elif not self.at('*'):
+            return
+        self.index += 1
+        if self.peek()[0] == 'number' and self.peek()[1].isdigit() and self.adjacent(-1):
+            self.index += 1
+
+    def group_entry(self):
+        self.occurrence()
+        if self.take('('):
+            self.group(')')
+            self.expect(')', "to close a group")
+            return
+        kind = self.peek()[0]
+        if kind in ('id', 'text', 'bytes', 'number') and self.peek(1)[:2] == ('punct', ':'):
+            # Bareword or value member key
+            self.index += 2
+            self.type()
+            return
+        self.type1()
+        if self.take('^'):
+            self.expect('=>', "after '^' in a member key")
+            self.type()
+        elif self.take('=>'):
+            self.type()
+        else:
+            while self.take('/'):
+                self.type1()
+
+
+def check_cddl(text: str):
+    """Check that `text` is syntactically valid CDDL.
+
+    Raises:
+        CddlSyntaxError: with the line of the first syntax error
+    """
+    _CddlParser(text).parse()
+
+
+# JSON and JSON Schema
+
+def is_schema_document(path: Path, data) -> bool:
+    """Whether a JSON document is a JSON Schema (by file name or declared `$schema`)."""
+    if path.name == 'schema.json' or path.name.endswith('.schema.json'):
+        return True
+    return isinstance(data, dict) and 'json-schema.org' in str(data.get('$schema', ''))
+
+
+def example_paths(schema_path: Path) -> List[Path]:
+    """Example documents shipped beside a schema, by naming convention.
+
+    `X.schema.json` pairs with `X.json` and `X.<anything>.json`; a plain
+    `schema.json` pairs with every other JSON file in its directory.
+    Files that are schemas by name are never examples.
+    """
+    if schema_path.name == 'schema.json':
+        candidates = schema_path.parent.glob('*.json')
+    elif schema_path.name.endswith('.schema.json'):
+        stem = schema_path.name[:-len('.schema.json')]
+        candidates = [schema_path.parent / f"{stem}.json", *schema_path.parent.glob(f"{stem}.*.json")]
+    else:
+        return []
+    return sorted(
+        path for path in set(candidates)
+        if path.is_file() and path.name != 'schema.json' and not path.name.endswith('.schema.json')
+    )
+
+
+def local_schema_path(uri: str, root: Path = REPO_ROOT) -> Optional[Path]:
+    """Map a `$ref` target to a file in the checkout, or None if it is not local.
+
+    `file:` URIs and GitHub URLs into this repository are resolved. A GitHub
+    URL whose path no longer exists (files move when proposals are
+    reorganised) falls back to the file of the same name in the same
+    proposal, if there is exactly one.
+    """
+    parts = urlsplit(uri)
+    if parts.scheme == 'file':
+        path = Path(unquote(parts.path))
+    else:
+        match = GITHUB_FILE_URL_PATTERN.match(uri)
+        if match is None:
+            return None
+        relative = Path(unquote(match.group(1)))
+        path = root / relative
+        if not path.is_file() and len(relative.parts) > 1:
+            candidates = list((root / relative.parts[0]).rglob(relative.name))
+            if len(candidates) == 1:
+                path = candidates[0]
+    path = path.resolve()
+    if not path.is_file() or not path.is_relative_to(root.resolve()):
+        return None
+    return path
+
+
+def _retrieve_local(uri: str) -> Resource:
+    """referencing retrieve hook: load `$ref` targets from the checkout, never the network."""
+    path = local_schema_path(uri)
+    if path is None:
+        raise NoSuchResource(ref=uri)
+    with open(path, 'r', encoding='utf-8') as f:
+        contents = json.load(f)
+    return Resource.from_contents(contents, default_specification=DEFAULT_SPECIFICATION)
+
+
+def compile_schema(schema_path: Path, schema: Dict):
+    """Build a validator for a schema, resolving its `$ref`s against the checkout.
+
+    A schema without an absolute `$id` is given its file URI, so relative
+    `$ref`s resolve to neighbouring files.
+
+    Raises:
+        jsonschema.SchemaError: if the schema does not conform to its meta-schema
+    """
+    validator_class = jsonschema.validators.validator_for(schema, default=DEFAULT_VALIDATOR)
+    validator_class.check_schema(schema)
+    schema_id = schema.get('$id')
+    if not isinstance(schema_id, str) or not urlsplit(schema_id).scheme:
+        schema = {**schema, '$id': urljoin(schema_path.resolve().as_uri(), schema_id or '')}
+    return validator_class(schema, registry=Registry(retrieve=_retrieve_local))
+
+
+def _error_message(error) -> str:
+    # Messages embed the offending value, which can be a whole sub-schema;
+    # name the failed keyword instead
+    message = error.message
+    if len(message) > MAX_MESSAGE_LENGTH:
+        expected = json.dumps(error.validator_value, default=str)
+        if len(expected) > MAX_MESSAGE_LENGTH:
+            expected = expected[:MAX_MESSAGE_LENGTH - 3] + '...'
+        message = f"value fails '{error.validator}': {expected}"
+    return message + (f" (at '{error.json_path}')" if error.path else '')
+
+
+def _error_order(error) -> Tuple:
+    """Sort key putting errors in document order (array indices numerically)."""
+    return tuple((isinstance(part, str), part) for part in error.absolute_path), error.message
+
+
+def check_json(path: Path) -> List[Dict]:
+    """Parse a JSON file and, if it is a schema, check it against its meta-schema."""
+    try:
+        text = path.read_bytes().decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        return [{'rule': 'file-read', 'message': f"Cannot read file: {e}", 'line': None}]
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        return [{'rule': JSON_SYNTAX_RULE, 'message': f"Invalid JSON: {e.msg} (column {e.colno})", 'line': e.lineno}]
+    if not is_schema_document(path, data):
+        return []
+    if not isinstance(data, (dict, bool)):
+        return [{'rule': JSON_SCHEMA_RULE, 'message': "A schema must be a JSON object", 'line': None}]
+    validator_class = jsonschema.validators.validator_for(data, default=DEFAULT_VALIDATOR)
+    try:
+        validator_class.check_schema(data)
+    except jsonschema.SchemaError as e:
+        return [{'rule': JSON_SCHEMA_RULE, 'line': None,
+                 'message': f"Not a valid schema ({validator_class.__name__}): {_error_message(e)}"}]
+    return []
+
+
+def check_examples(schema_path: Path, examples: List[Path]) -> List[Tuple[Path, List[Dict]]]:
+    """Validate example documents against a schema compiled once.
+
+    Unreadable or invalid schemas and examples are skipped: check_json
+    reports those against the files themselves.
+    """
+    try:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            validator = compile_schema(schema_path, json.load(f))
+    except (OSError, ValueError, AttributeError, jsonschema.SchemaError):
+        return []
+
+    results = []
+    for example in examples:
+        try:
+            with open(example, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if is_schema_document(example, data):
+            continue
+        try:
+            messages = [_error_message(error) for error in sorted(validator.iter_errors(data), key=_error_order)]
+        except Unresolvable as e:
+            messages = [f"Cannot resolve $ref '{e.ref}' in the checkout"]
+        results.append((example, [
+            {'rule': SCHEMA_EXAMPLE_RULE, 'message': f"Does not match {schema_path.name}: {message}", 'line': None}
+            for message in messages
+        ]))
+    return results
+
+
+def check_cddl_file(path: Path) -> List[Dict]:
+    """Check a CDDL file's syntax."""
+    try:
+        text = path.read_bytes().decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        return [{'rule': 'file-read', 'message': f"Cannot read file: {e}", 'line': None}]
+    try:
+        check_cddl(text)
+    except CddlSyntaxError as e:
+        return [{'rule': CDDL_SYNTAX_RULE, 'message': f"Invalid CDDL: {e.message}", 'line': e.line}]
+    return []
+
+
+# Batch runs
+
+@dataclass(frozen=True)
+class Task:
+    """One unit of work for the pool: check a file, or a schema against its examples."""
+    kind: str  # 'json', 'cddl' or 'examples'
+    path: Path
+    examples: Tuple[Path, ...] = ()
+
+
+def run_task(task: Task) -> List[Tuple[Path, List[Dict]]]:
+    """Process pool entry point.
+
+    Findings travel as dicts: the Finding class lives in validate-cps.py,
+    which is not importable by name in the workers.
+    """
+    if task.kind == 'json':
+        return [(task.path, check_json(task.path))]
+    if task.kind == 'cddl':
+        return [(task.path, check_cddl_file(task.path))]
+    return check_examples(task.path, list(task.examples))
+
+
+def content_hash(path: Path) -> str:
+    """SHA-256 of the raw file bytes ('' if the file cannot be read)."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ''
+
+
+def compute_ruleset_hash() -> str:
+    """Hash this script and the jsonschema version, which decide every result."""
+    digest = hashlib.sha256()
+    digest.update(Path(__file__).read_bytes())
+    digest.update(importlib.metadata.version('jsonschema').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def schema_tree_digest(root: Path = REPO_ROOT) -> str:
+    """Hash every JSON file under the proposals.
+
+    Part of the cache key of example results: a schema's `$ref`s may pull in
+    any other schema in the checkout.
+    """
+    digest = hashlib.sha256()
+    for pattern in JSON_GLOBS:
+        for path in sorted(root.glob(pattern)):
+            digest.update(path.relative_to(root).as_posix().encode('utf-8'))
+            digest.update(content_hash(path).encode('ascii'))
+    return digest.hexdigest()
+
+
+def plan_tasks(files: List[Path]) -> List[Task]:
+    """Tasks to validate `files`, one per file plus one per schema with examples among them."""
+    tasks = []
+    selected = {path.resolve(): path for path in files}
+    for path in files:
+        tasks.append(Task('cddl' if path.suffix == '.cddl' else 'json', path))
+    for path in files:
+        if path.suffix != '.json':
+            continue
+        examples = tuple(selected[example] for example in example_paths(path.resolve()) if example in selected)
+        if examples:
+            tasks.append(Task('examples', path, examples))
+    return tasks
+
+
+def task_cache_keys(task: Task, hashes: Dict[Path, str], tree_digest: str) -> List[Tuple[Path, str]]:
+    """Cache keys of the results a task produces, as (path, key) pairs."""
+    if task.kind != 'examples':
+        return [(task.path, f"{task.kind}:{hashes[task.path]}")]
+    return [(example, f"example:{hashes[example]}:{hashes[task.path]}:{tree_digest}") for example in task.examples]
+
+
+def expand_pairs(files: List[Path]) -> List[Path]:
+    """Add the schema of each example and the examples of each schema in `files`.
+
+    A changed schema must be re-checked against its unchanged examples and a
+    changed example against its unchanged schema.
+    """
+    cwd = Path.cwd()
+    found = {path.resolve(): path for path in files}
+    schemas = set()
+    for directory in {path.resolve().parent for path in files if path.suffix == '.json'}:
+        schemas.update(directory.glob('*schema.json'))
+    for schema in sorted(schemas):
+        examples = example_paths(schema)
+        if schema in found or any(example in found for example in examples):
+            for path in (schema, *examples):
+                if path not in found:
+                    try:
+                        found[path] = path.relative_to(cwd)
+                    except ValueError:
+                        found[path] = path
+    return sorted(found.values())
+
+
+def iter_artefact_results(files: List[Path], jobs: int = 1, cache=None, validator=None):
+    """Validate artefacts, yielding a FileResult per file in the order of `files`.
+
+    Cached results are reused; the remaining tasks run in a process pool
+    when jobs > 1.
+    """
+    validator = validator or load_validator()
+    tasks = plan_tasks(files)
+    findings: Dict[Path, List] = {path: [] for path in files}
+    cached_paths = set(files)
+
+    misses = []
+    keys: Dict[Task, List[Tuple[Path, str]]] = {}
+    if cache is not None:
+        hashes = {path: content_hash(path) for path in files}
+        tree_digest = schema_tree_digest()
+        for task in tasks:
+            keys[task] = task_cache_keys(task, hashes, tree_digest)
+            hits = [cache.get(key) for _, key in keys[task]]
+            if all(hit is not None for hit in hits):
+                for (path, _), hit in zip(keys[task], hits):
+                    findings[path].extend(hit)
+            else:
+                misses.append(task)
+    else:
+        misses = tasks
+
+    if jobs <= 1 or len(misses) <= 1:
+        outcomes = map(run_task, misses)
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(misses)))
+        outcomes = executor.map(run_task, misses)
+    try:
+        for task, outcome in zip(misses, outcomes):
+            produced = {}
+            for path, dicts in outcome:
+                produced[path] = [validator.Finding.from_dict(d) for d in dicts]
+                findings[path].extend(produced[path])
+                cached_paths.discard(path)
+            cached_paths.discard(task.path)
+            if cache is not None:
+                for path, key in keys[task]:
+                    if path in produced and not any(f.rule == 'file-read' for f in produced[path]):
+                        cache.put(key, produced[path])
+    finally:
+        if jobs > 1 and len(misses) > 1:
+            executor.shutdown()
+
+    for path in files:
+        yield validator.FileResult(path, findings[path], cached=path in cached_paths)
+
+
+def discover_changed_artefacts(ref: str, validator, root: Path = REPO_ROOT) -> List[Path]:
+    """Artefacts added or modified since `ref` (see validate-cps.py's git_changes).
+
+    A change to this script selects every artefact.
+    """
+    changes = validator.git_changes(ref, root)
+    script = Path(__file__).resolve().relative_to(root).as_posix()
+    if any(path == script for _, path in changes):
+        return validator.discover_files(JSON_GLOBS + CDDL_GLOBS, root)
+    cwd = Path.cwd()
+    files = []
+    for status, path in sorted(set(changes), key=lambda change: change[1]):
+        absolute = root / path
+        if status == 'D' or absolute.suffix not in ('.json', '.cddl') or not absolute.is_file():
+            continue
+        if not any(absolute.match(pattern) for pattern in JSON_GLOBS + CDDL_GLOBS):
+            continue
+        try:
+            files.append(absolute.relative_to(cwd))
+        except ValueError:
+            files.append(absolute)
+    return files
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Validate the JSON schemas, JSON examples and CDDL files shipped in proposals.")
+    parser.add_argument('files', nargs='*', type=Path,
+                        help="artefacts to validate (default: every .json and .cddl file under CIP-*/ and CPS-*/)")
+    parser.add_argument('--changed-since', metavar='REF',
+                        help="validate the artefacts changed since the merge-base of REF and HEAD")
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help="number of worker processes (0 = one per CPU, default: 1)")
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE_PATH, metavar='PATH',
+                        help="validation cache file (default: .cache/validate-artefacts.json)")
+    parser.add_argument('--no-cache', action='store_true', help="always re-validate every artefact")
+    parser.add_argument('--format', choices=('text', 'json'), default='text',
+                        help="'text' prints errors to stderr; 'json' prints every finding to stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the artefact validation script."""
+    args = parse_arguments(argv)
+    validator = load_validator()
+
+    if args.changed_since:
+        try:
+            files = discover_changed_artefacts(args.changed_since, validator)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not files:
+            print(f"No artefacts changed since {args.changed_since}", file=sys.stderr)
+            sys.exit(0)
+    elif args.files:
+        files = list(args.files)
+        missing = [path for path in files if not path.is_file()]
+        if missing:
+            for path in missing:
+                print(f"Error: File not found: {path}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        files = validator.discover_files(JSON_GLOBS + CDDL_GLOBS)
+    files = expand_pairs(files)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    cache = None if args.no_cache else validator.ValidationCache(args.cache, compute_ruleset_hash())
+    results = list(iter_artefact_results(files, jobs, cache, validator))
+
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"Warning: could not write validation cache: {e}", file=sys.stderr)
+
+    failed = [result for result in results if not result.is_valid]
+    if args.format == 'json':
+        print(validator.format_json(results))
+    else:
+        for result in failed:
+            print(f"\nValidation failed for {result.path}:", file=sys.stderr)
+            for finding in result.findings:
+                location = f"line {finding.line}: " if finding.line else ''
+                print(f"  - {location}{finding.message}", file=sys.stderr)
+
+    if failed:
+        print(f"\nValidation failed for {len(failed)} of {len(results)} artefact(s)", file=sys.stderr)
+        sys.exit(1)
+    print(f"\nAll {len(results)} artefact(s) passed validation", file=sys.stderr)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Validation script for the CIP-0010 transaction metadata label registry.
+Validates each registry entry against registry.schema.json and checks that
+labels are unique and in ascending order.
+"""
+
+import sys
+import json
+import hashlib
+import argparse
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+try:
+    import jsonschema
+except ImportError:
+    print("Error: jsonschema library is required. Install it with: pip install jsonschema", file=sys.stderr)
+    sys.exit(1)
+
+
+# Repository root (this script lives in .github/scripts/)
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+REGISTRY_PATH = REPO_ROOT / 'CIP-0010' / 'registry.json'
+REGISTRY_SCHEMA_PATH = REPO_ROOT / 'CIP-0010' / 'registry.schema.json'
+LABEL_FIELD = 'transaction_metadatum_label'
+
+# Bytes read from the registry per step while streaming
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class RegistryFormatError(ValueError):
+    """The registry is not a well-formed JSON array."""
+
+
+class RegistryPathError(ValueError):
+    """The registry is outside the checkout, so it has no base revision."""
+
+
+def iter_json_array(stream: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Tuple[int, object]]:
+    """Stream the elements of a top-level JSON array.
+
+    Only one chunk plus the element being decoded is held in memory.
+
+    Yields:
+        Tuples of (1-based line where the element starts, decoded element)
+
+    Raises:
+        RegistryFormatError: if the document is not a JSON array, or has
+            anything but whitespace after it
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    line = 1
+    eof = False
+    started = False
+    closed = False
+    expect_value = True
+    seen_value = False
+
+    def fill() -> bool:
+        nonlocal buffer, position, eof
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    while True:
+        # Skip whitespace, counting lines
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                if buffer[position] == '\n':
+                    line += 1
+                position += 1
+            if position < len(buffer) or not fill():
+                break
+        if position >= len(buffer):
+            if closed:
+                return
+            raise RegistryFormatError(f"Unexpected end of file at line {line}")
+
+        char = buffer[position]
+        if closed:
+            raise RegistryFormatError(f"Unexpected data after the array at line {line}")
+        if not started:
+            if char != '[':
+                raise RegistryFormatError(f"Registry must be a JSON array (line {line})")
+            started = True
+            position += 1
+            continue
+        if char == ']':
+            if expect_value and seen_value:
+                raise RegistryFormatError(f"Unexpected ']' after ',' at line {line}")
+            closed = True
+            position += 1
+            continue
+        if char == ',':
+            if expect_value:
+                raise RegistryFormatError(f"Unexpected ',' at line {line}")
+            expect_value = True
+            position += 1
+            continue
+        if not expect_value:
+            raise RegistryFormatError(f"Expected ',' or ']' at line {line}")
+
+        # Decode one element, reading more input until it is complete. A number
+        # split across chunks decodes as a shorter number, so only accept a
+        # value once the following separator has been read (or at EOF).
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+                if eof or buffer[end:].lstrip(' \t\r\n')[:1] in (',', ']'):
+                    break
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise RegistryFormatError(f"Invalid JSON at line {line}: {e.msg}") from None
+            fill()
+
+        yield line, value
+        line += buffer.count('\n', position, end)
+        position = end
+        expect_value = False
+        seen_value = True
+
+
+@dataclass
+class RegistryReport:
+    """Outcome of validating the registry."""
+    entries: int = 0
+    errors: List[Tuple[Optional[int], str]] = field(default_factory=list)  # (label, message)
+    added: List[int] = field(default_factory=list)
+    changed: List[int] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+
+
+class RegistrySchema:
+    """The registry schema, compiled once and applied while streaming.
+
+    Entries are validated against `items` as they are read, with `$ref`
+    resolved against the whole schema (so `definitions`/`$defs` and
+    pointers into the root work as they do for the whole document). The
+    array-level keywords are checked once the array has been read; the
+    ones that would need the whole array in memory are refused.
+    """
+
+    ARRAY_KEYWORDS = {'type', 'minItems', 'maxItems', 'uniqueItems', 'contains', 'minContains', 'maxContains'}
+    # Keywords that do not constrain the array itself
+    ROOT_KEYWORDS = {'$schema', '$id', 'id', '$comment', 'title', 'description', 'default', 'examples',
+                     'definitions', '$defs', 'items'}
+
+    def __init__(self, schema: Dict):
+        """Check and compile `schema`.
+
+        Raises:
+            jsonschema.SchemaError: if the schema is invalid, or constrains the
+                array with a keyword that cannot be checked while streaming
+        """
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        unsupported = sorted(set(schema) - self.ARRAY_KEYWORDS - self.ROOT_KEYWORDS)
+        if not isinstance(schema.get('items', {}), dict):
+            unsupported.insert(0, 'items (as a list)')
+        if unsupported:
+            raise jsonschema.SchemaError(f"cannot check {', '.join(unsupported)} at the root of the registry "
+                                         f"schema while streaming")
+        # Evolved validators keep the root's reference resolver
+        root = validator_class(schema)
+        self.schema = schema
+        self.entry = root.evolve(schema=schema.get('items', {}))
+        self.root_type = root.evolve(schema={'type': schema['type']}) if 'type' in schema else None
+        self.contains = root.evolve(schema=schema['contains']) if 'contains' in schema else None
+
+    def iter_entry_errors(self, entry) -> Iterator[jsonschema.ValidationError]:
+        """Errors of one entry against `items`."""
+        return self.entry.iter_errors(entry)
+
+    def array_errors(self, entries: int, matching: int,
+                     duplicates: List[Tuple[Tuple[int, int], Tuple[int, int]]]) -> List[str]:
+        """Errors of the array-level keywords.
+
+        Args:
+            entries: number of entries in the registry
+            matching: number of entries valid against `contains`
+            duplicates: ((number, line), (number, line) of the first equal entry)
+                of repeated entries, numbered from 1
+        """
+        schema = self.schema
+        errors = []
+        if self.root_type is not None and not self.root_type.is_valid([]):
+            errors.append(f"Registry is an array, but the schema expects type {schema['type']!r}")
+        if entries < schema.get('minItems', 0):
+            errors.append(f"Registry has {entries} entries, fewer than minItems ({schema['minItems']})")
+        if 'maxItems' in schema and entries > schema['maxItems']:
+            errors.append(f"Registry has {entries} entries, more than maxItems ({schema['maxItems']})")
+        if schema.get('uniqueItems'):
+            errors.extend(f"Entry {number} (line {line}) is identical to entry {first} (line {first_line}) "
+                          f"(uniqueItems)" for (number, line), (first, first_line) in duplicates)
+        if self.contains is not None:
+            if matching < schema.get('minContains', 1):
+                errors.append(f"Registry has {matching} entries matching 'contains', "
+                              f"fewer than {schema.get('minContains', 1)}")
+            if 'maxContains' in schema and matching > schema['maxContains']:
+                errors.append(f"Registry has {matching} entries matching 'contains', "
+                              f"more than maxContains ({schema['maxContains']})")
+        return errors
+
+
+def _canonical(value):
+    """`value` with the JSON equality of uniqueItems: 1 == 1.0, but True != 1."""
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _digest(entry) -> bytes:
+    """Fingerprint of an entry for uniqueItems, so that entries need not be kept."""
+    canonical = json.dumps(_canonical(entry), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).digest()
+
+
+def load_base_entries(ref: str, registry_path: Path = REGISTRY_PATH) -> Dict[int, Dict]:
+    """Registry entries at a git revision, keyed by label (empty if the file did not exist).
+
+    Raises:
+        RegistryPathError: if `registry_path` is outside the repository
+        subprocess.CalledProcessError: if `ref` cannot be resolved
+    """
+    resolved = registry_path.resolve()
+    if not resolved.is_relative_to(REPO_ROOT):
+        raise RegistryPathError(f"{registry_path} is outside the repository ({REPO_ROOT})")
+    relative = resolved.relative_to(REPO_ROOT).as_posix()
+    subprocess.run(['git', 'rev-parse', '--verify', '--quiet', f"{ref}^{{commit}}"],
+                   cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)
+    shown = subprocess.run(['git', 'show', f"{ref}:{relative}"], cwd=REPO_ROOT,
+                           capture_output=True, text=True)
+    if shown.returncode != 0:
+        return {}
+    base = {}
+    for entry in json.loads(shown.stdout):
+        if isinstance(entry, dict) and isinstance(entry.get(LABEL_FIELD), int):
+            base[entry[LABEL_FIELD]] = entry
+    return base
+
+
+def validate_registry(stream: TextIO, registry_schema: RegistrySchema,
+                      base: Optional[Dict[int, Dict]] = None) -> RegistryReport:
+    """Validate the registry in a single streaming pass.
+
+    Each entry is checked against the compiled entry schema, and a label index
+    is built as entries go by to report duplicate labels and ordering breaks.
+    The array-level keywords of the schema are checked at the end. With
+    `base` (entries of the base revision), only problems involving added or
+    changed labels are reported; array-level errors are always reported.
+
+    Raises:
+        RegistryFormatError: if the registry is not a JSON array
+    """
+    report = RegistryReport()
+    index: Dict[int, int] = {}  # label -> line of first occurrence
+    previous_label = None
+    touched: Set[int] = set()
+    matching = 0
+    seen: Dict[bytes, Tuple[int, int]] = {}  # entry digest -> (number, line) of first occurrence (uniqueItems only)
+    duplicates: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+
+    def is_touched(label) -> bool:
+        return base is None or label in touched or not isinstance(label, int)
+
+    for line, entry in iter_json_array(stream):
+        report.entries += 1
+        label = entry.get(LABEL_FIELD) if isinstance(entry, dict) else None
+
+        if base is not None and isinstance(label, int):
+            if label not in base:
+                report.added.append(label)
+                touched.add(label)
+            elif base[label] != entry:
+                report.changed.append(label)
+                touched.add(label)
+
+        schema_errors = [
+            f"Entry at line {line}: {error.message}"
+            + (f" (at '{error.json_path}')" if error.path else '')
+            for error in registry_schema.iter_entry_errors(entry)
+        ]
+        if schema_errors and is_touched(label):
+            report.errors.extend((label, message) for message in schema_errors)
+        if registry_schema.contains is not None and registry_schema.contains.is_valid(entry):
+            matching += 1
+        if registry_schema.schema.get('uniqueItems'):
+            digest = _digest(entry)
+            if digest in seen:
+                duplicates.append(((report.entries, line), seen[digest]))
+            else:
+                seen[digest] = (report.entries, line)
+
+        if not isinstance(label, int) or isinstance(label, bool):
+            continue
+
+        if label in index:
+            # A repeated label is always new: the base registry had unique labels
+            report.errors.append((label, f"Duplicate label {label} at line {line} (first defined at line {index[label]})"))
+        else:
+            index[label] = line
+            if previous_label is not None and label < previous_label and (is_touched(label) or is_touched(previous_label)):
+                report.errors.append((label, f"Label {label} at line {line} is out of order (follows {previous_label}); "
+                                             f"labels must be in ascending order"))
+        previous_label = label
+
+    report.errors.extend((None, message) for message in registry_schema.array_errors(report.entries, matching, duplicates))
+    if base is not None:
+        report.removed = sorted(set(base) - set(index))
+    return report
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Validate the CIP-0010 metadata label registry.")
+    parser.add_argument('--registry', type=Path, default=REGISTRY_PATH, help="registry JSON file")
+    parser.add_argument('--schema', type=Path, default=REGISTRY_SCHEMA_PATH, help="registry JSON Schema")
+    parser.add_argument('--base', metavar='REF',
+                        help="git revision to diff against; only added or changed labels are reported")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the validation script."""
+    args = parse_arguments(argv)
+
+    try:
+        with open(args.schema, 'r', encoding='utf-8') as f:
+            registry_schema = RegistrySchema(json.load(f))
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot load schema {args.schema}: {e}", file=sys.stderr)
+        sys.exit(1)
+    except jsonschema.SchemaError as e:
+        print(f"Schema error: {e.message}", file=sys.stderr)
+        sys.exit(1)
+
+    base = None
+    if args.base:
+        try:
+            base = load_base_entries(args.base, args.registry)
+        except subprocess.CalledProcessError:
+            print(f"Error: unknown base revision '{args.base}'", file=sys.stderr)
+            sys.exit(1)
+        except RegistryPathError as e:
+            print(f"Error: cannot compare with base revision '{args.base}': {e}", file=sys.stderr)
+            sys.exit(1)
+        except ValueError as e:
+            print(f"Error: cannot parse registry at base revision '{args.base}': {e}", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        with open(args.registry, 'r', encoding='utf-8') as f:
+            report = validate_registry(f, registry_schema, base)
+    except (OSError, RegistryFormatError) as e:
+        print(f"\nValidation failed for {args.registry}:\n  - {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if base is not None:
+        for title, labels in (('Added', report.added), ('Changed', report.changed), ('Removed', report.removed)):
+            if labels:
+                print(f"{title} labels: {', '.join(map(str, labels))}", file=sys.stderr)
+
+    if report.errors:
+        print(f"\nValidation failed for {args.registry}:", file=sys.stderr)
+        for _, message in report.errors:
+            print(f"  - {message}", file=sys.stderr)
+        print(f"\n{len(report.errors)} error(s) in {report.entries} entries", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"\nAll {report.entries} registry entries passed validation", file=sys.stderr)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Lightweight client for the validate-cps.py watch daemon.
+Uses only the standard library so editor integrations and pre-commit hooks
+avoid importing yaml/jsonschema on every call. Falls back to running
+validate-cps.py directly when no daemon is listening.
+"""
+
+import os
+import sys
+import json
+import socket
+import argparse
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent.parent
+DEFAULT_SOCKET_PATH = REPO_ROOT / '.cache' / 'validate-cps.sock'
+
+
+def query(socket_path: Path, request: dict, timeout: float = 10.0):
+    """Send one request to the daemon; None if no daemon is listening."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            buffer = b''
+            while not buffer.endswith(b'\n'):
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+        return json.loads(buffer.decode('utf-8'))
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate CPS README.md files through a running validate-cps.py --watch daemon.")
+    parser.add_argument('files', nargs='*', help="CPS README.md files to validate")
+    parser.add_argument('--socket', type=Path, default=DEFAULT_SOCKET_PATH, help="daemon socket")
+    parser.add_argument('--stdin', metavar='PATH', help="validate content read from stdin as if it were PATH (unsaved buffer)")
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help="report format")
+    args = parser.parse_args()
+
+    if args.stdin:
+        request = {'cmd': 'validate', 'path': str(Path(args.stdin).resolve()), 'content': sys.stdin.read()}
+    elif args.files:
+        request = {'cmd': 'validate', 'paths': [str(Path(f).resolve()) for f in args.files]}
+    else:
+        parser.error("give files to validate or --stdin PATH")
+
+    response = query(args.socket, request)
+    if response is None or 'results' not in response:
+        if args.stdin:
+            print("Error: no validate-cps.py daemon is listening; --stdin needs one", file=sys.stderr)
+            sys.exit(2)
+        # No daemon: do the work ourselves
+        validator = str(SCRIPT_DIR / 'validate-cps.py')
+        extra = ['--format', 'json'] if args.format == 'json' else []
+        os.execv(sys.executable, [sys.executable, validator, *extra, *args.files])
+
+    results = response['results']
+    failed = [r for r in results if not r['valid']]
+    if args.format == 'json':
+        print(json.dumps(response, indent=2))
+    else:
+        for result in failed:
+            print(f"\nValidation failed for {result['path']}:", file=sys.stderr)
+            for finding in result['findings']:
+                location = f"line {finding['line']}: " if finding.get('line') else ''
+                print(f"  - {location}{finding['message']}", file=sys.stderr)
+        if failed:
+            print(f"\nValidation failed for {len(failed)} file(s)", file=sys.stderr)
+        else:
+            print(f"\nAll {len(results)} file(s) passed validation", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
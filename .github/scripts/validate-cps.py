@@ -5,11 +5,25 @@ Validates YAML headers and required sections.
 """
 
 import sys
+import os
 import re
 import json
+import time
+import socket
+import struct
+import hashlib
+import argparse
+import tempfile
+import selectors
+import subprocess
+import ctypes
+import ctypes.util
 import yaml
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple, Optional
 
 try:
     import jsonschema
@@ -45,118 +59,393 @@ CPS_OPTIONAL_SECTIONS = {
     'Acknowledgements'
 }
 
+# Repository root (this script lives in .github/scripts/)
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Documents discovered by --all, relative to the repository root
+CPS_DOCUMENT_GLOB = 'CPS-*/README.md'
+
 # Load CPS header schema
 SCHEMA_PATH = Path(__file__).parent.parent / 'schemas' / 'cps-header.schema.json'
 with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
     CPS_HEADER_SCHEMA = json.load(f)
 
+# Incremental validation cache (see ValidationCache)
+DEFAULT_CACHE_PATH = REPO_ROOT / '.cache' / 'validate-cps.json'
+DEFAULT_CACHE_MAX_ENTRIES = 4096
 
-def parse_frontmatter(content: str) -> Tuple[Optional[Dict], Optional[str], Optional[List[str]]]:
-    """Parse YAML frontmatter from markdown content.
+# Proposal directories at the repository root (see ProposalTree)
+PROPOSAL_DIR_PATTERN = re.compile(r'^(CIP|CPS)-(\d+)$')
+CIP_LABEL_PATTERN = re.compile(r'^CIP-(\d+)(\?)?$')
+MERGED_CIP_URL_PATTERN = re.compile(r'https://github\.com/cardano-foundation/CIPs/(?:tree|blob)/[^/]+/(CIP-[^/#?]+)')
 
-    Returns:
-        Tuple of (frontmatter_dict, remaining_content, raw_lines) or (None, content, None) if no frontmatter
+# Watch mode (see ValidationDaemon)
+DEFAULT_SOCKET_PATH = REPO_ROOT / '.cache' / 'validate-cps.sock'
+WATCH_DOCUMENT_GLOBS = [CPS_DOCUMENT_GLOB, 'CIP-*/README.md']
+
+
+# Patterns used by the document scanner
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
+# A backtick fence's info string may not itself contain backticks (CommonMark)
+FENCE_OPEN_PATTERN = re.compile(r'^ {0,3}(`{3,}(?=[^`]*$)|~{3,})')
+UNASSIGNED_VALUE_PATTERN = re.compile(r'^[A-Za-z][A-Za-z ]*:\s+\?+\s*$')
+UNASSIGNED_VALUE_SUB_PATTERN = re.compile(r':\s+(\?+)\s*$')
+CPS_LEADING_ZERO_PATTERN = re.compile(r'^CPS:\s+0\d+')
+# Per-file rule opt-out, e.g. <!-- validate-cps: skip sections, no-h1 -->
+SKIP_DIRECTIVE_PATTERN = re.compile(r'^<!--\s*validate-cps:\s*skip\s+([A-Za-z0-9_,\s-]+?)\s*-->\s*$')
+
+
+@dataclass
+class Heading:
+    """An ATX heading found outside fenced code blocks."""
+    level: int
+    text: str
+    line: int  # 1-based line number in the file
+
+
+@dataclass
+class Document:
+    """Single-pass scan of a markdown document, shared by all checks.
+
+    `lines` are newline-normalised (as when reading in text mode); the raw
+    line-ending facts are kept separately in `has_crlf` / `has_cr`.
     """
-    # Check for frontmatter delimiters - must start with ---
-    if not content.startswith('---'):
-        return None, content, None
+    path: Optional[Path]
+    lines: List[str]
+    has_crlf: bool = False
+    has_cr: bool = False
+    crlf_line: Optional[int] = None  # 1-based line of the first CRLF
+    cr_line: Optional[int] = None  # 1-based line of the first bare CR
+    frontmatter_lines: Optional[List[str]] = None
+    body_start: int = 0  # index into `lines` of the first line after the frontmatter
+    headings: List[Heading] = field(default_factory=list)
+    skipped_rules: Set[str] = field(default_factory=set)
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+    @property
+    def body(self) -> str:
+        return '\n'.join(self.lines[self.body_start:])
+
+    def headings_at(self, level: int) -> List[str]:
+        return [h.text for h in self.headings if h.level == level]
+
+    def header_key_line(self, key: str) -> Optional[int]:
+        """1-based file line of a top-level header key, if present."""
+        prefix = f"{key}:"
+        for i, line in enumerate(self.frontmatter_lines or []):
+            if line.startswith(prefix):
+                return i + 2  # Line 1 is the opening ---
+        return None
+
+    def header_item_lines(self, key: str) -> List[int]:
+        """1-based file lines of the `- item` entries under a header key."""
+        key_line = self.header_key_line(key)
+        if key_line is None:
+            return []
+        item_lines = []
+        for i in range(key_line - 1, len(self.frontmatter_lines)):
+            line = self.frontmatter_lines[i]
+            if line.lstrip().startswith('- '):
+                item_lines.append(i + 2)
+            elif line and not line[0].isspace():
+                break
+        return item_lines
+
+
+def _scan_body(lines: List[str], start: int = 0) -> Tuple[List[Heading], Set[str]]:
+    """Collect headings and skip directives from lines[start:], ignoring fenced code blocks."""
+    headings = []
+    skipped_rules = set()
+    fence = None
+    for i in range(start, len(lines)):
+        line = lines[i]
+        if fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(fence) and stripped.strip(fence[0]) == '':
+                fence = None
+            continue
+        if line.startswith('#'):
+            match = HEADING_PATTERN.match(line)
+            if match:
+                headings.append(Heading(len(match.group(1)), match.group(2).strip(), i + 1))
+            continue
+        if line.startswith('<!--'):
+            match = SKIP_DIRECTIVE_PATTERN.match(line)
+            if match:
+                skipped_rules.update(n for n in re.split(r'[\s,]+', match.group(1)) if n)
+            continue
+        fence_match = FENCE_OPEN_PATTERN.match(line)
+        if fence_match:
+            fence = fence_match.group(1)
+    return headings, skipped_rules
 
-    # Find the closing delimiter (--- on its own line)
-    # Split on '\n---\n' or '\n---' at end of content
-    lines = content.split('\n')
-    if lines[0] != '---':
-        return None, content, None
 
-    # Find the closing ---
-    end_idx = None
+def scan_text(text: str, path: Optional[Path] = None, has_crlf: bool = False, has_cr: bool = False) -> Document:
+    """Scan already-decoded, newline-normalised markdown text into a Document."""
+    lines = text.split('\n')
+    doc = Document(path=path, lines=lines, has_crlf=has_crlf, has_cr=has_cr)
+
+    if not text.startswith('---') or lines[0] != '---':
+        doc.headings, doc.skipped_rules = _scan_body(lines)
+        return doc
+
+    # Find the closing --- of the frontmatter, then keep walking for headings
     for i in range(1, len(lines)):
         if lines[i] == '---':
-            end_idx = i
-            break
+            doc.frontmatter_lines = lines[1:i]
+            doc.body_start = i + 1
+            doc.headings, doc.skipped_rules = _scan_body(lines, i + 1)
+            return doc
 
-    if end_idx is None:
-        return None, content, None
+    # Unterminated frontmatter: treat the whole file as body
+    doc.headings, doc.skipped_rules = _scan_body(lines)
+    return doc
+
+
+def scan_document(file_path: Path) -> Document:
+    """Read a file once and scan it into a Document.
+
+    Raises:
+        OSError, UnicodeDecodeError: if the file cannot be read as UTF-8
+    """
+    return scan_bytes(file_path.read_bytes(), file_path)
+
+
+def scan_bytes(content_bytes: bytes, path: Optional[Path] = None) -> Document:
+    """Scan raw file content into a Document, recording line-ending facts.
+
+    Raises:
+        UnicodeDecodeError: if the content is not valid UTF-8
+    """
+    text = content_bytes.decode('utf-8')
+    crlf_line = cr_line = None
+    crlf_at = text.find('\r\n')
+    if crlf_at >= 0:
+        crlf_line = text.count('\n', 0, crlf_at) + 1
+        text = text.replace('\r\n', '\n')
+    cr_at = text.find('\r')
+    if cr_at >= 0:
+        cr_line = text.count('\n', 0, cr_at) + 1
+        text = text.replace('\r', '\n')
+    doc = scan_text(text, path=path, has_crlf=crlf_line is not None, has_cr=cr_line is not None)
+    doc.crlf_line = crlf_line
+    doc.cr_line = cr_line
+    return doc
+
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Shapes understood by the restricted header parser (see _parse_simple_header)
+SIMPLE_KEY_PATTERN = re.compile(r'^([A-Za-z][A-Za-z -]*[A-Za-z]|[A-Za-z]):(?: +(.*?))? *$')
+SIMPLE_ITEM_PATTERN = re.compile(r'^( *)- +(.*?) *$')
+UNASSIGNED_PATTERN = re.compile(r'^\?+$')
+# Characters YAML reads as line breaks or whitespace ('\r', '\x85', U+2028,
+# U+2029, tab), rejects as non-printable, or strips (the BOM), and whitespace
+# other than ' ' (which the '?' preprocessing matches as \s): lines with any
+# of them are left to full YAML
+UNSAFE_HEADER_CHARS = re.compile('[^ \\S]|[^\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]')
+# First characters that make a plain YAML scalar mean something else
+_YAML_INDICATORS = frozenset('-?:,[]{}#&*!|>\'"%@`')
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_YAML_CONSTRUCTOR = yaml.constructor.SafeConstructor()
+
+
+class _UnsupportedHeader(Exception):
+    """Raised by the restricted header parser when full YAML is needed."""
+
+
+def _simple_scalar(text: str):
+    """Resolve a plain scalar exactly as PyYAML's safe loader would."""
+    if (not text or text[0] in _YAML_INDICATORS or text.endswith(':')
+            or ': ' in text or ' #' in text or '\t' in text):
+        raise _UnsupportedHeader(text)
+    tag = _YAML_RESOLVER.resolve(yaml.nodes.ScalarNode, text, (True, False))
+    if tag == _YAML_STR_TAG:
+        return text
+    # Same constructors as the safe loader, so e.g. 'Created' becomes a date
+    # (and invalid dates raise ValueError). Tags with no scalar constructor
+    # ('=' is tag:yaml.org,2002:value, '<<' a merge key) are left to full YAML
+    constructor = _YAML_CONSTRUCTOR.yaml_constructors.get(tag)
+    if constructor is None:
+        raise _UnsupportedHeader(text)
+    return constructor(_YAML_CONSTRUCTOR, yaml.nodes.ScalarNode(tag, text))
+
+
+def _simple_key(text: str) -> str:
+    if _YAML_RESOLVER.resolve(yaml.nodes.ScalarNode, text, (True, False)) != _YAML_STR_TAG:
+        raise _UnsupportedHeader(text)
+    return text
+
+
+def _parse_simple_header(frontmatter_lines: List[str]) -> Optional[Dict]:
+    """Parse the common CPS/CIP header shapes without a YAML parser.
+
+    Handles `Key: value`, `Key: ?`, `Key: []` and `Key:` followed by
+    `- item` / `- Label: URL` lines. Anything else raises _UnsupportedHeader
+    so the caller can fall back to full YAML.
+    """
+    header: Dict = {}
+    current_list: Optional[List] = None
+    item_indent = None
+
+    for line in frontmatter_lines:
+        if UNSAFE_HEADER_CHARS.search(line):
+            raise _UnsupportedHeader(line)
+        if not line.strip():
+            continue
+        key_match = SIMPLE_KEY_PATTERN.match(line)
+        if key_match:
+            key = _simple_key(key_match.group(1))
+            value = key_match.group(2)
+            current_list = None
+            item_indent = None
+            if value is None or value == '':
+                # Either a block sequence follows, or the value is null
+                header[key] = None
+                current_list = []
+                pending_key = key
+            elif value == '[]':
+                header[key] = []
+            elif UNASSIGNED_PATTERN.match(value):
+                header[key] = value
+            else:
+                header[key] = _simple_scalar(value)
+            continue
+
+        item_match = SIMPLE_ITEM_PATTERN.match(line)
+        if item_match and current_list is not None:
+            indent = len(item_match.group(1))
+            if item_indent is None:
+                item_indent = indent
+                header[pending_key] = current_list
+            elif indent != item_indent:
+                raise _UnsupportedHeader(line)
+            item = item_match.group(2)
+            label, sep, url = item.partition(': ')
+            if sep:
+                # "- Label: URL" is a single-entry mapping in YAML
+                current_list.append({_simple_scalar_text(label): _simple_scalar(url.strip())})
+            else:
+                current_list.append(_simple_scalar(item))
+            continue
+
+        raise _UnsupportedHeader(line)
+
+    return header or None
+
+
+def _simple_scalar_text(text: str) -> str:
+    """Check that `text` is a plain string scalar (e.g. a mapping key) and return it."""
+    text = text.strip()
+    if _simple_scalar(text) != text:
+        raise _UnsupportedHeader(text)
+    return text
 
-    # Extract frontmatter (lines between the two --- markers)
-    frontmatter_lines = lines[1:end_idx]
 
+def _load_yaml_header(frontmatter_lines: List[str], loader=None) -> Optional[Dict]:
+    """Full YAML fallback for headers the restricted parser does not handle.
+
+    `loader` overrides the PyYAML loader class (default: YAML_LOADER).
+    """
     # Preprocess: quote standalone '?' values (YAML interprets '?' as explicit key indicator)
     processed_lines = []
     for line in frontmatter_lines:
         # Match lines like "CPS: ?" or "Category: ?" and quote the ?
-        if re.match(r'^[A-Za-z][A-Za-z ]*:\s+\?+\s*$', line):
-            line = re.sub(r':\s+(\?+)\s*$', r': "\1"', line)
+        if UNASSIGNED_VALUE_PATTERN.match(line):
+            line = UNASSIGNED_VALUE_SUB_PATTERN.sub(r': "\1"', line)
         processed_lines.append(line)
 
     frontmatter_text = '\n'.join(processed_lines)
 
-    # Extract remaining content (everything after the closing ---)
-    remaining_lines = lines[end_idx + 1:]
-    remaining_content = '\n'.join(remaining_lines)
+    # libyaml is more lenient than the pure-Python loader about tabs, odd
+    # line breaks, control characters and '?' in flow collections; keep
+    # results identical by only using it when there are none. It is also
+    # stricter about some flow collections, so its errors are confirmed by
+    # the pure-Python loader
+    if loader is None:
+        unsafe = (any(UNSAFE_HEADER_CHARS.search(line) for line in processed_lines)
+                  or ('?' in frontmatter_text and ('[' in frontmatter_text or '{' in frontmatter_text)))
+        loader = yaml.SafeLoader if unsafe else YAML_LOADER
+    try:
+        return yaml.load(frontmatter_text, Loader=loader)
+    except yaml.YAMLError:
+        if loader is not yaml.SafeLoader:
+            return _load_yaml_header(frontmatter_lines, loader=yaml.SafeLoader)
+        return None
+    except ValueError:
+        # Catches invalid date values that YAML tries to parse (e.g., month 13)
+        return None
+
+
+def load_frontmatter(frontmatter_lines: List[str]) -> Optional[Dict]:
+    """Parse the lines between the two --- markers.
 
+    Common header shapes are handled by a restricted parser; anything else
+    falls back to full YAML (libyaml-accelerated when available). Both paths
+    produce the same result as `yaml.safe_load`.
+
+    Returns:
+        The header mapping, or None if it is empty or not valid YAML
+    """
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if frontmatter is None:
-            return None, content, None
-        return frontmatter, remaining_content, frontmatter_lines
-    except yaml.YAMLError as e:
+        return _parse_simple_header(frontmatter_lines)
+    except (_UnsupportedHeader, ValueError):
+        # ValueError: an invalid date (e.g., month 13); let YAML decide
+        # whether the header is invalid or the value was part of something else
+        return _load_yaml_header(frontmatter_lines)
+
+
+def parse_frontmatter(content: str) -> Tuple[Optional[Dict], Optional[str], Optional[List[str]]]:
+    """Parse YAML frontmatter from markdown content.
+
+    Returns:
+        Tuple of (frontmatter_dict, remaining_content, raw_lines) or (None, content, None) if no frontmatter
+    """
+    doc = scan_text(content)
+    if doc.frontmatter_lines is None:
         return None, content, None
-    except ValueError as e:
-        # Catches invalid date values that YAML tries to parse (e.g., month 13)
+
+    frontmatter = load_frontmatter(doc.frontmatter_lines)
+    if frontmatter is None:
         return None, content, None
+    return frontmatter, doc.body, doc.frontmatter_lines
 
 
 def extract_h2_headers(content: str) -> List[str]:
-    """Extract all H2 headers (##) from markdown content."""
-    h2_pattern = r'^##\s+(.+)$'
-    headers = []
-    for line in content.split('\n'):
-        match = re.match(h2_pattern, line)
-        if match:
-            headers.append(match.group(1).strip())
-    return headers
+    """Extract all H2 headers (##) from markdown content, ignoring fenced code."""
+    return [h.text for h in _scan_body(content.split('\n'))[0] if h.level == 2]
 
 
 def extract_h1_headers(content: str) -> List[str]:
-    """Extract all H1 headers (#) from markdown content."""
-    h1_pattern = r'^#\s+(.+)$'
-    headers = []
-    for line in content.split('\n'):
-        match = re.match(h1_pattern, line)
-        if match:
-            headers.append(match.group(1).strip())
-    return headers
+    """Extract all H1 headers (#) from markdown content, ignoring fenced code."""
+    return [h.text for h in _scan_body(content.split('\n'))[0] if h.level == 1]
 
 
-def validate_line_endings(file_path: Path) -> List[str]:
+def validate_line_endings(doc: Document) -> List[str]:
     """Validate that file uses UNIX line endings (LF, not CRLF).
-    
+
     Returns:
         List of error messages (empty if valid)
     """
     errors = []
-    
-    try:
-        # Read file in binary mode to check line endings
-        with open(file_path, 'rb') as f:
-            content_bytes = f.read()
-        
-        # Check for CRLF (\r\n) - Windows line endings
-        if b'\r\n' in content_bytes:
-            errors.append("File uses Windows line endings (CRLF). Use UNIX line endings (LF) instead.")
-        
-        # Check for standalone \r without \n (old Mac line endings)
-        # Replace CRLF first, then check for remaining CR
-        content_without_crlf = content_bytes.replace(b'\r\n', b'')
-        if b'\r' in content_without_crlf:
-            errors.append("File uses old Mac line endings (CR). Use UNIX line endings (LF) instead.")
-    except Exception as e:
-        errors.append(f"Error checking line endings: {e}")
-    
+
+    # Check for CRLF (\r\n) - Windows line endings
+    if doc.has_crlf:
+        errors.append("File uses Windows line endings (CRLF). Use UNIX line endings (LF) instead.")
+
+    # Check for standalone \r without \n (old Mac line endings)
+    if doc.has_cr:
+        errors.append("File uses old Mac line endings (CR). Use UNIX line endings (LF) instead.")
+
     return errors
 
 
-def validate_no_h1_headings(content: str) -> List[str]:
+def validate_no_h1_headings(doc: Document) -> List[str]:
     """Validate that no H1 headings are present in the document.
     
     Returns:
@@ -164,7 +453,7 @@ def validate_no_h1_headings(content: str) -> List[str]:
     """
     errors = []
     
-    h1_headers = extract_h1_headers(content)
+    h1_headers = doc.headings_at(1)
     if h1_headers:
         errors.append(f"H1 headings are not allowed. Found: {', '.join(h1_headers)}")
     
@@ -198,93 +487,139 @@ def _validate_field_order(frontmatter: Dict) -> List[str]:
     return errors
 
 
-def validate_header(frontmatter: Dict) -> List[str]:
-    """Validate the YAML frontmatter header for CPSs.
+def _normalize_header_for_schema(frontmatter: Dict) -> Dict:
+    """Convert PyYAML-specific values into the plain JSON shapes the schema expects.
 
-    Returns:
-        List of error messages (empty if valid)
+    JSON Schema expects dates as strings, but PyYAML may parse them as date objects.
+    Dictionary entries in lists are normalized to strings (YAML parses "Label: URL" as dict).
     """
-    errors = []
+    frontmatter_for_schema = {}
+    for key, value in frontmatter.items():
+        if key == 'Created' and hasattr(value, 'isoformat'):
+            # Handle date objects from PyYAML (datetime.date or datetime.datetime)
+            frontmatter_for_schema[key] = value.isoformat()
+        elif key in ('Proposed Solutions', 'Discussions') and isinstance(value, list):
+            # Convert dictionary entries to string format "Label: URL"
+            normalized_list = []
+            for item in value:
+                if isinstance(item, dict):
+                    # Convert dict like {'Label': 'URL'} to string 'Label: URL'
+                    if len(item) == 1:
+                        label, url = next(iter(item.items()))
+                        normalized_list.append(f"{label}: {url}")
+                    else:
+                        # Multiple keys - join them
+                        normalized_list.append(": ".join(f"{k}: {v}" for k, v in item.items()))
+                elif isinstance(item, str):
+                    normalized_list.append(item)
+                else:
+                    normalized_list.append(str(item))
+            frontmatter_for_schema[key] = normalized_list
+        else:
+            frontmatter_for_schema[key] = value
+    return frontmatter_for_schema
 
-    # Validate field order
-    errors.extend(_validate_field_order(frontmatter))
 
-    # Validate header fields using JSON Schema
-    try:
-        # Convert date objects to strings for schema validation
-        # JSON Schema expects dates as strings, but PyYAML may parse them as date objects
-        # Also normalize dictionary entries in lists to strings (YAML parses "Label: URL" as dict)
-        frontmatter_for_schema = {}
-        for key, value in frontmatter.items():
-            if key == 'Created' and hasattr(value, 'isoformat'):
-                # Handle date objects from PyYAML (datetime.date or datetime.datetime)
-                frontmatter_for_schema[key] = value.isoformat()
-            elif key in ('Proposed Solutions', 'Discussions') and isinstance(value, list):
-                # Convert dictionary entries to string format "Label: URL"
-                normalized_list = []
-                for item in value:
-                    if isinstance(item, dict):
-                        # Convert dict like {'Label': 'URL'} to string 'Label: URL'
-                        if len(item) == 1:
-                            label, url = next(iter(item.items()))
-                            normalized_list.append(f"{label}: {url}")
-                        else:
-                            # Multiple keys - join them
-                            normalized_list.append(": ".join(f"{k}: {v}" for k, v in item.items()))
-                    elif isinstance(item, str):
-                        normalized_list.append(item)
-                    else:
-                        normalized_list.append(str(item))
-                frontmatter_for_schema[key] = normalized_list
-            else:
-                frontmatter_for_schema[key] = value
+# Compiled schema validators, keyed by schema hash (one per process)
+_VALIDATORS: Dict[str, object] = {}
+
+
+def schema_hash(schema: Dict) -> str:
+    """Stable hash of a JSON Schema document."""
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()
+
 
-        jsonschema.validate(instance=frontmatter_for_schema, schema=CPS_HEADER_SCHEMA)
-    except jsonschema.ValidationError as e:
-        # Format JSON Schema validation errors in a user-friendly way
-        error_path = '.'.join(str(p) for p in e.path) if e.path else 'root'
-        errors.append(f"Header validation error at '{error_path}': {e.message}")
+def get_schema_validator(schema: Dict = CPS_HEADER_SCHEMA):
+    """Return a compiled validator for `schema`, building it at most once per process.
+
+    The validator class is resolved from the schema's `$schema` and the schema
+    itself is checked once here rather than on every document.
+
+    Raises:
+        jsonschema.SchemaError: if the schema itself is invalid
+    """
+    key = schema_hash(schema)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        _VALIDATORS[key] = validator
+    return validator
+
+
+def iter_schema_errors(instance, schema: Dict = CPS_HEADER_SCHEMA) -> Iterator[Tuple[str, str]]:
+    """Yield (json_path, message) for every schema violation in `instance`.
+
+    For `oneOf`/`anyOf` failures the most relevant sub-error is reported,
+    as `jsonschema.validate` would.
+    """
+    validator = get_schema_validator(schema)
+    for error in validator.iter_errors(instance):
+        error = jsonschema.exceptions.best_match([error])
+        yield error.json_path, error.message
+
+
+def _validate_header_schema(frontmatter: Dict) -> List[str]:
+    """Validate header fields using JSON Schema, reporting every violation.
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    try:
+        return [
+            f"Header validation error at '{path}': {message}"
+            for path, message in iter_schema_errors(_normalize_header_for_schema(frontmatter))
+        ]
     except jsonschema.SchemaError as e:
-        errors.append(f"Schema error: {e.message}")
+        return [f"Schema error: {e.message}"]
 
-    # Validate CIP label semantic rules (label/URL relationship)
+
+def _validate_header_cip_labels(frontmatter: Dict) -> List[str]:
+    """Validate CIP label semantic rules (label/URL relationship).
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    errors = []
     if 'Proposed Solutions' in frontmatter:
         errors.extend(_validate_cip_label_entries(frontmatter['Proposed Solutions'], 'Proposed Solutions'))
     if 'Discussions' in frontmatter:
         errors.extend(_validate_cip_label_entries(frontmatter['Discussions'], 'Discussions'))
-
     return errors
 
 
-def _validate_cip_label_entries(entries: list, field_name: str) -> List[str]:
-    """Validate semantic rules for entries with CIP labels.
+def validate_header(frontmatter: Dict) -> List[str]:
+    """Validate the YAML frontmatter header for CPSs.
 
-    When a label matches CIP-NNNN pattern:
-    - URL must be a GitHub CIPs repository link (PR or merged CIP)
-    - Pull request URLs require '?' suffix on the CIP number (candidate)
-    - Merged CIP URLs must NOT have '?' suffix
+    Returns:
+        List of error messages (empty if valid)
+    """
+    errors = []
+    errors.extend(_validate_field_order(frontmatter))
+    errors.extend(_validate_header_schema(frontmatter))
+    errors.extend(_validate_header_cip_labels(frontmatter))
+    return errors
 
-    Other labels are allowed with any valid URL.
 
-    Args:
-        entries: List of label-URL entries
-        field_name: Name of the field for error messages
+def _validate_cip_label_entries(entries: list, field_name: str) -> List[str]:
+    """Validate semantic rules for entries with CIP labels (see _iter_cip_label_errors).
 
     Returns:
         List of error messages (empty if valid)
     """
-    errors = []
+    return [message for _, message in _iter_cip_label_errors(entries, field_name)]
 
-    if not isinstance(entries, list):
-        return errors
 
-    cip_label_pattern = re.compile(r'^(CIP-\d+)(\?)?$')
-    pr_pattern = re.compile(r'https://github\.com/cardano-foundation/CIPs/pull/\d+')
-    merged_pattern = re.compile(r'https://github\.com/cardano-foundation/CIPs/(tree|blob)/[^/]+/CIP-\d+')
-    github_cips_pattern = re.compile(r'^https://github\.com/cardano-foundation/CIPs/(pull/\d+|tree/[^/]+/CIP-\d+|blob/[^/]+/CIP-\d+)')
+def _iter_label_entries(entries: list) -> Iterator[Tuple[int, str, str]]:
+    """Normalize 'Label: URL' entries (mappings or strings) of a header list.
 
+    Yields:
+        Tuples of (entry index, label, URL); malformed entries are skipped
+    """
+    if not isinstance(entries, list):
+        return
     for i, entry in enumerate(entries):
-        # Normalize to label and URL
         if isinstance(entry, dict) and len(entry) == 1:
             label, url = next(iter(entry.items()))
         elif isinstance(entry, str):
@@ -295,10 +630,32 @@ def _validate_cip_label_entries(entries: list, field_name: str) -> List[str]:
             label, url = match.groups()
         else:
             continue
+        yield i, str(label).strip(), str(url).strip()
+
+
+def _iter_cip_label_errors(entries: list, field_name: str) -> Iterator[Tuple[int, str]]:
+    """Validate semantic rules for entries with CIP labels.
+
+    When a label matches CIP-NNNN pattern:
+    - URL must be a GitHub CIPs repository link (PR or merged CIP)
+    - Pull request URLs require '?' suffix on the CIP number (candidate)
+    - Merged CIP URLs must NOT have '?' suffix
+
+    Other labels are allowed with any valid URL.
 
-        label = label.strip()
-        url = url.strip()
+    Args:
+        entries: List of label-URL entries
+        field_name: Name of the field for error messages
+
+    Yields:
+        Tuples of (entry index, error message)
+    """
+    cip_label_pattern = re.compile(r'^(CIP-\d+)(\?)?$')
+    pr_pattern = re.compile(r'https://github\.com/cardano-foundation/CIPs/pull/\d+')
+    merged_pattern = re.compile(r'https://github\.com/cardano-foundation/CIPs/(tree|blob)/[^/]+/CIP-\d+')
+    github_cips_pattern = re.compile(r'^https://github\.com/cardano-foundation/CIPs/(pull/\d+|tree/[^/]+/CIP-\d+|blob/[^/]+/CIP-\d+)')
 
+    for i, label, url in _iter_label_entries(entries):
         # Check if label matches CIP pattern - only then apply extra validation
         label_match = cip_label_pattern.match(label)
         if not label_match:
@@ -309,7 +666,7 @@ def _validate_cip_label_entries(entries: list, field_name: str) -> List[str]:
 
         # For CIP labels, URL must be a GitHub CIPs repository link
         if not github_cips_pattern.match(url):
-            errors.append(
+            yield i, (
                 f"'{field_name}' entry {i+1}: CIP label '{label}' requires a GitHub CIPs repository URL "
                 f"(pull request or merged CIP). Got: {url}"
             )
@@ -319,105 +676,238 @@ def _validate_cip_label_entries(entries: list, field_name: str) -> List[str]:
         is_merged = merged_pattern.search(url) is not None
 
         if is_pr and not has_question_mark:
-            errors.append(
+            yield i, (
                 f"'{field_name}' entry {i+1}: Pull request URL requires '?' suffix on CIP number "
                 f"(use '{cip_number}?' instead of '{cip_number}' to indicate candidate status)"
             )
         elif is_merged and has_question_mark:
-            errors.append(
+            yield i, (
                 f"'{field_name}' entry {i+1}: Merged CIP should not have '?' suffix "
                 f"(use '{cip_number}' instead of '{cip_number}?' since this CIP is merged)"
             )
 
-    return errors
 
+# Header lists whose entries may carry CIP labels
+CIP_LABEL_FIELDS = ('Proposed Solutions', 'Discussions')
+
+
+@dataclass
+class CipReference:
+    """A CIP label in a CPS header."""
+    cps: str          # Directory of the referencing CPS, e.g. 'CPS-0021'
+    field_name: str   # Header field holding the entry
+    label: str        # As written, e.g. 'CIP-0161?'
+    candidate: bool   # Label carries the '?' suffix
+    url: str
+
+
+class ProposalTree:
+    """Index of the proposal directories in a checkout, built once per run.
+
+    Maps CIP and CPS numbers to their directory names so CIP labels resolve
+    in O(1). The reverse map from CIPs to the CPSs that reference them is
+    built on first use from the CPS headers.
+    """
+
+    def __init__(self, root: Path = REPO_ROOT):
+        self.root = root
+        self.cips: Dict[int, str] = {}
+        self.cpss: Dict[int, str] = {}
+        self._references: Optional[Dict[str, List[CipReference]]] = None
+        try:
+            names = sorted(entry.name for entry in os.scandir(root) if entry.is_dir())
+        except OSError:
+            names = []
+        for name in names:
+            match = PROPOSAL_DIR_PATTERN.match(name)
+            if match:
+                table = self.cips if match.group(1) == 'CIP' else self.cpss
+                table.setdefault(int(match.group(2)), name)
+
+    def fingerprint(self) -> List[str]:
+        """Directory names, for cache keys and change detection."""
+        return sorted([*self.cips.values(), *self.cpss.values()])
+
+    def cip_dir(self, number: int) -> Optional[str]:
+        """Directory of a merged CIP, or None if there is none in this checkout."""
+        return self.cips.get(number)
+
+    def references(self) -> Dict[str, List[CipReference]]:
+        """CIP directory name (e.g. 'CIP-0161') -> CIP labels in CPS headers that point at it.
+
+        Labels are keyed by number, so candidates ('CIP-0161?') and labels of
+        CIPs missing from this checkout are included as well.
+        """
+        if self._references is None:
+            self._references = {}
+            for number in sorted(self.cpss):
+                name = self.cpss[number]
+                try:
+                    doc = scan_document(self.root / name / 'README.md')
+                except (OSError, UnicodeDecodeError):
+                    continue
+                frontmatter = load_frontmatter(doc.frontmatter_lines) if doc.frontmatter_lines is not None else None
+                if not isinstance(frontmatter, dict):
+                    continue
+                for field_name in CIP_LABEL_FIELDS:
+                    for _, label, url in _iter_label_entries(frontmatter.get(field_name)):
+                        match = CIP_LABEL_PATTERN.match(label)
+                        if match:
+                            key = self.cip_dir(int(match.group(1))) or f"CIP-{int(match.group(1)):04d}"
+                            self._references.setdefault(key, []).append(
+                                CipReference(name, field_name, label, match.group(2) == '?', url))
+        return self._references
+
+
+_PROPOSAL_TREE: Optional[ProposalTree] = None
+
+
+def get_proposal_tree() -> ProposalTree:
+    """The ProposalTree of this checkout, scanned on first use."""
+    global _PROPOSAL_TREE
+    if _PROPOSAL_TREE is None:
+        _PROPOSAL_TREE = ProposalTree()
+    return _PROPOSAL_TREE
+
+
+def reset_proposal_tree():
+    """Forget the scanned tree (e.g. after proposal directories were added or removed)."""
+    global _PROPOSAL_TREE
+    _PROPOSAL_TREE = None
+
+
+def _iter_cip_reference_errors(entries: list, field_name: str, tree: ProposalTree) -> Iterator[Tuple[int, str]]:
+    """Resolve CIP labels against the local proposal directories.
+
+    - A merged label (CIP-NNNN) must name a CIP directory in this checkout
+    - A merged CIP URL must point at that same directory
+    - A candidate label (CIP-NNNN?) must not name a CIP that has since been merged
+
+    Yields:
+        Tuples of (entry index, error message)
+    """
+    for i, label, url in _iter_label_entries(entries):
+        match = CIP_LABEL_PATTERN.match(label)
+        if not match:
+            continue
+        directory = tree.cip_dir(int(match.group(1)))
+        if match.group(2) == '?':
+            if directory is not None:
+                yield i, (
+                    f"'{field_name}' entry {i+1}: Candidate '{label}' has been merged as {directory} "
+                    f"(use '{directory}' with a link to the merged CIP)"
+                )
+            continue
+        if directory is None:
+            yield i, f"'{field_name}' entry {i+1}: CIP label '{label}' does not match any merged CIP in this repository"
+            continue
+        url_match = MERGED_CIP_URL_PATTERN.search(url)
+        if url_match and url_match.group(1) != directory:
+            yield i, (
+                f"'{field_name}' entry {i+1}: CIP label '{label}' links to {url_match.group(1)} "
+                f"instead of {directory}"
+            )
+
+
+# Lookup tables for validate_sections, keyed by lowercase section name
+_EXPECTED_SECTION_CAPITALIZATION = {
+    section.lower(): section for section in (*CPS_REQUIRED_SECTIONS_ORDER, *sorted(CPS_OPTIONAL_SECTIONS))
+}
+_OPTIONAL_SECTIONS_LOWER = {s.lower() for s in CPS_OPTIONAL_SECTIONS}
+# Required sections that must not follow an optional section
+_REQUIRED_BEFORE_OPTIONAL = {s for s in CPS_REQUIRED_SECTIONS_ORDER if s != 'Copyright'}
 
-def validate_sections(content: str) -> List[str]:
+
+def validate_sections(doc: Document) -> List[str]:
     """Validate required sections exist at H2 level for CPSs.
 
     Returns:
         List of error messages (empty if valid)
     """
-    errors = []
+    return [message for message, _ in _section_errors(doc)]
 
-    h2_headers = extract_h2_headers(content)
-    found_sections = set(h2_headers)
 
-    # Normalize headers to lowercase for case-insensitive comparison
-    found_sections_lower = {h.lower() for h in found_sections}
-    required_sections_lower = {h.lower() for h in CPS_REQUIRED_SECTIONS}
-    optional_sections_lower = {h.lower() for h in CPS_OPTIONAL_SECTIONS}
+def _section_errors(doc: Document) -> List[Tuple[str, Optional[int]]]:
+    """Section checks behind validate_sections, with the line each error refers to.
 
-    # Check for missing required sections (case-insensitive)
-    missing_sections_lower = required_sections_lower - found_sections_lower
-    if missing_sections_lower:
-        # Map back to original case from required_sections for error message
-        missing_sections = {orig for orig in CPS_REQUIRED_SECTIONS
-                          if orig.lower() in missing_sections_lower}
-        errors.append(f"Missing required sections: {', '.join(sorted(missing_sections))}")
-
-    # Check for unknown sections (not in required or optional)
-    allowed_sections_lower = required_sections_lower | optional_sections_lower
-    for header in h2_headers:
-        if header.lower() not in allowed_sections_lower:
-            errors.append(f"Unknown section: '{header}'. Only required and optional sections are allowed.")
-
-    # Build a mapping from lowercase to expected capitalization
-    expected_capitalization = {}
-    for section in CPS_REQUIRED_SECTIONS:
-        expected_capitalization[section.lower()] = section
-    for section in CPS_OPTIONAL_SECTIONS:
-        expected_capitalization[section.lower()] = section
-
-    # Check for incorrect capitalization
-    for header in h2_headers:
-        header_lower = header.lower()
-        if header_lower in expected_capitalization:
-            expected = expected_capitalization[header_lower]
-            if header != expected:
-                errors.append(f"Section '{header}' has incorrect capitalization. Expected: '{expected}'")
+    All checks share a single walk over the H2 headers (plus one backwards
+    walk for optional-section placement), so cost is linear in the number
+    of headers.
+
+    Returns:
+        List of (error message, 1-based line or None) tuples
+    """
+    h2_headings = [h for h in doc.headings if h.level == 2]
 
-    # Check section order
-    # Map found headers to their canonical names (for order comparison)
+    unknown_errors = []
+    capitalization_errors = []
     canonical_headers = []
-    for header in h2_headers:
+    found_required = []  # (canonical name, line) of required sections, in document order
+    found_lower = set()
+
+    for heading in h2_headings:
+        header = heading.text
         header_lower = header.lower()
-        if header_lower in expected_capitalization:
-            canonical_headers.append(expected_capitalization[header_lower])
-        else:
+        found_lower.add(header_lower)
+        expected = _EXPECTED_SECTION_CAPITALIZATION.get(header_lower)
+        if expected is None:
+            # Unknown section (not in required or optional)
+            unknown_errors.append((
+                f"Unknown section: '{header}'. Only required and optional sections are allowed.",
+                heading.line,
+            ))
             canonical_headers.append(header)  # Keep unknown headers as-is
+            continue
+        if header != expected:
+            capitalization_errors.append((
+                f"Section '{header}' has incorrect capitalization. Expected: '{expected}'",
+                heading.line,
+            ))
+        canonical_headers.append(expected)
+        if expected in CPS_REQUIRED_SECTIONS:
+            found_required.append((expected, heading.line))
 
-    # Extract just the required sections in the order they appear
-    found_required_order = [h for h in canonical_headers if h in CPS_REQUIRED_SECTIONS]
+    errors = []
 
-    # Build expected order based on which required sections are present
-    expected_required_order = [s for s in CPS_REQUIRED_SECTIONS_ORDER if s in found_required_order]
+    # Check for missing required sections (case-insensitive)
+    missing_sections = [s for s in CPS_REQUIRED_SECTIONS_ORDER if s.lower() not in found_lower]
+    if missing_sections:
+        errors.append((f"Missing required sections: {', '.join(sorted(missing_sections))}", None))
+
+    errors.extend(unknown_errors)
+    errors.extend(capitalization_errors)
 
+    # Check section order: required sections present must follow CPS_REQUIRED_SECTIONS_ORDER
+    found_required_order = [name for name, _ in found_required]
+    found_required_set = set(found_required_order)
+    expected_required_order = [s for s in CPS_REQUIRED_SECTIONS_ORDER if s in found_required_set]
     if found_required_order != expected_required_order:
-        errors.append(
+        # Point at the first section that is out of place (duplicates make the lists differ in length)
+        first_wrong = next(
+            (line for (name, line), expected in zip(found_required, expected_required_order) if name != expected),
+            found_required[len(expected_required_order)][1] if len(found_required) > len(expected_required_order) else None,
+        )
+        errors.append((
             f"Sections are not in the correct order. "
             f"Expected: {', '.join(expected_required_order)}. "
-            f"Got: {', '.join(found_required_order)}"
-        )
-
-    # Check that optional sections appear only between "Open Questions" and "Copyright"
-    # Optional sections must not appear before any required section except Copyright
-    optional_sections_normalized = {s.lower() for s in CPS_OPTIONAL_SECTIONS}
-    required_before_optional = [s for s in CPS_REQUIRED_SECTIONS_ORDER if s != 'Copyright']
-
-    for i, header in enumerate(canonical_headers):
-        header_lower = header.lower()
-        if header_lower in optional_sections_normalized:
-            # This is an optional section - check what comes after it
-            for j in range(i + 1, len(canonical_headers)):
-                following_header = canonical_headers[j]
-                # If a required section (other than Copyright) follows an optional section, that's an error
-                if following_header in required_before_optional:
-                    errors.append(
-                        f"Optional section '{header}' appears before required section '{following_header}'. "
-                        f"Optional sections must appear after 'Open Questions' and before 'Copyright'."
-                    )
-                    break
+            f"Got: {', '.join(found_required_order)}",
+            first_wrong,
+        ))
+
+    # Check that optional sections appear only between "Open Questions" and "Copyright":
+    # walk backwards remembering the nearest following required section (other than Copyright)
+    optional_errors = []
+    next_required = None
+    for header, heading in zip(reversed(canonical_headers), reversed(h2_headings)):
+        if header.lower() in _OPTIONAL_SECTIONS_LOWER and next_required is not None:
+            optional_errors.append((
+                f"Optional section '{header}' appears before required section '{next_required}'. "
+                f"Optional sections must appear after 'Open Questions' and before 'Copyright'.",
+                heading.line,
+            ))
+        if header in _REQUIRED_BEFORE_OPTIONAL:
+            next_required = header
+    errors.extend(reversed(optional_errors))
 
     return errors
 
@@ -434,90 +924,1249 @@ def is_cps_file(file_path: Path) -> bool:
     return bool(re.search(r'(^|/)CPS-', normalized_path, re.IGNORECASE))
 
 
-def validate_file(file_path: Path) -> Tuple[bool, List[str]]:
-    """Validate a single CPS README.md file.
-    
-    Returns:
-        Tuple of (is_valid, list_of_errors)
+@dataclass
+class ValidationContext:
+    """Shared state handed to every rule: the scanned document and its parsed header."""
+    doc: Document
+    frontmatter: Optional[Dict] = None
+
+
+# A rule reports (error message, 1-based line or None) pairs
+RuleErrors = List[Tuple[str, Optional[int]]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A named check over a ValidationContext.
+
+    `needs` declares which parts of the parsed document the rule reads:
+    'line_endings', 'frontmatter_lines', 'header' (parsed YAML) or 'headings'.
+    'proposal_tree' marks rules that also read other proposals (see
+    ProposalTree), so their results depend on more than the document.
+    The YAML header is only parsed when a selected rule needs it. A `fatal`
+    rule that reports errors stops the remaining rules for that file.
     """
+    name: str
+    check: Callable[[ValidationContext], RuleErrors]
+    needs: FrozenSet[str]
+    description: str
+    fatal: bool = False
+
+
+@dataclass
+class Finding:
+    """One validation error, attributed to the rule that reported it."""
+    rule: str
+    message: str
+    line: Optional[int] = None
+
+    def to_dict(self) -> Dict:
+        return {'rule': self.rule, 'message': self.message, 'line': self.line}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Finding':
+        return cls(data['rule'], data['message'], data.get('line'))
+
+
+# Findings that are not produced by a registered rule
+FILE_PATH_RULE = 'file-path'
+FILE_READ_RULE = 'file-read'
+
+# Registered rules, in execution order
+RULES: Dict[str, Rule] = {}
+
+
+def register_rule(name: str, needs: Iterable[str], description: str, fatal: bool = False):
+    """Decorator adding a check to RULES."""
+    def decorator(check: Callable[[ValidationContext], RuleErrors]):
+        RULES[name] = Rule(name, check, frozenset(needs), description, fatal)
+        return check
+    return decorator
+
+
+@register_rule('line-endings', needs=['line_endings'],
+               description="UNIX line endings (LF) only")
+def _rule_line_endings(ctx: ValidationContext) -> RuleErrors:
+    doc = ctx.doc
     errors = []
-    
+    for message in validate_line_endings(doc):
+        errors.append((message, doc.crlf_line if 'CRLF' in message else doc.cr_line))
+    return errors
+
+
+@register_rule('frontmatter', needs=['header'], fatal=True,
+               description="valid YAML frontmatter between '---' delimiters")
+def _rule_frontmatter(ctx: ValidationContext) -> RuleErrors:
+    if ctx.frontmatter is None:
+        return [("Missing or invalid YAML frontmatter (must start with '---' and end with '---')", 1)]
+    return []
+
+
+@register_rule('cps-leading-zeros', needs=['frontmatter_lines'],
+               description="CPS number without leading zeros")
+def _rule_cps_leading_zeros(ctx: ValidationContext) -> RuleErrors:
+    # YAML loses this information, so check the raw header lines
+    for i, line in enumerate(ctx.doc.frontmatter_lines or []):
+        if CPS_LEADING_ZERO_PATTERN.match(line):
+            return [("CPS number must not have leading zeros", i + 2)]
+    return []
+
+
+@register_rule('header-order', needs=['header'],
+               description="header fields in the required order")
+def _rule_header_order(ctx: ValidationContext) -> RuleErrors:
+    if ctx.frontmatter is None:
+        return []
+    return [(message, 2) for message in _validate_field_order(ctx.frontmatter)]
+
+
+@register_rule('header-schema', needs=['header'],
+               description="header fields match cps-header.schema.json")
+def _rule_header_schema(ctx: ValidationContext) -> RuleErrors:
+    if ctx.frontmatter is None:
+        return []
+    instance = _normalize_header_for_schema(ctx.frontmatter)
+    errors = []
+    try:
+        for path, message in iter_schema_errors(instance):
+            # '$.Title' or "$['Proposed Solutions'][0]": locate the top-level key
+            match = re.match(r"^\$(?:\.([^.\[]+)|\['([^']+)'\])", path)
+            line = ctx.doc.header_key_line(match.group(1) or match.group(2)) if match else None
+            errors.append((f"Header validation error at '{path}': {message}", line or 2))
+    except jsonschema.SchemaError as e:
+        errors.append((f"Schema error: {e.message}", None))
+    return errors
+
+
+@register_rule('cip-labels', needs=['header'],
+               description="CIP-NNNN labels point at matching GitHub CIPs URLs")
+def _rule_cip_labels(ctx: ValidationContext) -> RuleErrors:
+    if ctx.frontmatter is None:
+        return []
+    return _label_rule_errors(ctx, _iter_cip_label_errors)
+
+
+@register_rule('cip-refs', needs=['header', 'proposal_tree'],
+               description="CIP-NNNN labels resolve to CIP directories in this checkout")
+def _rule_cip_refs(ctx: ValidationContext) -> RuleErrors:
+    if ctx.frontmatter is None:
+        return []
+    tree = get_proposal_tree()
+    return _label_rule_errors(ctx, lambda entries, field_name: _iter_cip_reference_errors(entries, field_name, tree))
+
+
+def _label_rule_errors(ctx: ValidationContext, check: Callable[[list, str], Iterator[Tuple[int, str]]]) -> RuleErrors:
+    """Run a per-entry label check over CIP_LABEL_FIELDS, locating each entry's line."""
+    errors = []
+    for field_name in CIP_LABEL_FIELDS:
+        if field_name not in ctx.frontmatter:
+            continue
+        item_lines = ctx.doc.header_item_lines(field_name)
+        for i, message in check(ctx.frontmatter[field_name], field_name):
+            line = item_lines[i] if i < len(item_lines) else ctx.doc.header_key_line(field_name)
+            errors.append((message, line))
+    return errors
+
+
+@register_rule('no-h1', needs=['headings'],
+               description="no H1 headings in the document body")
+def _rule_no_h1(ctx: ValidationContext) -> RuleErrors:
+    first_h1 = next((h.line for h in ctx.doc.headings if h.level == 1), None)
+    return [(message, first_h1) for message in validate_no_h1_headings(ctx.doc)]
+
+
+@register_rule('sections', needs=['headings'],
+               description="required and optional H2 sections, capitalization and order")
+def _rule_sections(ctx: ValidationContext) -> RuleErrors:
+    return _section_errors(ctx.doc)
+
+
+def select_rules(names: Optional[Iterable[str]] = None, skip: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+    """Resolve a rule selection to registered rule names in execution order.
+
+    Raises:
+        ValueError: if an unknown rule name is given
+    """
+    requested = set(RULES) if names is None else set(names)
+    excluded = set(skip or ())
+    unknown = (requested | excluded) - set(RULES)
+    if unknown:
+        raise ValueError(f"Unknown rule(s): {', '.join(sorted(unknown))}. Available: {', '.join(RULES)}")
+    return tuple(name for name in RULES if name in requested and name not in excluded)
+
+
+# Profile entries that are not rules
+PROFILE_SCAN = 'scan (read + walk)'
+PROFILE_FRONTMATTER = 'parse frontmatter'
+
+
+def run_rules(doc: Document, rule_names: Iterable[str], timings: Optional[Dict[str, float]] = None) -> List[Finding]:
+    """Run the named rules over a scanned document, honouring per-file skip directives.
+
+    When `timings` is given, the wall time of the header parse and of each
+    rule is added to it (in seconds, keyed by step name).
+
+    Returns:
+        List of findings (empty if valid)
+    """
+    clock = time.perf_counter
+    active = [RULES[name] for name in rule_names if name not in doc.skipped_rules]
+
+    ctx = ValidationContext(doc)
+    if doc.frontmatter_lines is not None and any('header' in rule.needs for rule in active):
+        start = clock()
+        ctx.frontmatter = load_frontmatter(doc.frontmatter_lines)
+        if timings is not None:
+            timings[PROFILE_FRONTMATTER] = timings.get(PROFILE_FRONTMATTER, 0.0) + clock() - start
+
+    findings = []
+    for rule in active:
+        start = clock()
+        rule_errors = rule.check(ctx)
+        if timings is not None:
+            timings[rule.name] = timings.get(rule.name, 0.0) + clock() - start
+        findings.extend(Finding(rule.name, message, line) for message, line in rule_errors)
+        if rule.fatal and rule_errors:
+            break
+    return findings
+
+
+def check_file(file_path: Path, rules: Optional[Iterable[str]] = None,
+               timings: Optional[Dict[str, float]] = None,
+               content: Optional[bytes] = None) -> List[Finding]:
+    """Validate a single CPS README.md file, returning structured findings.
+
+    Args:
+        file_path: Path of the document
+        rules: Names of the rules to run (default: all registered rules)
+        timings: If given, accumulates per-step wall time (see run_rules)
+        content: Validate these bytes instead of reading `file_path`
+            (e.g. an unsaved editor buffer)
+
+    Returns:
+        List of findings (empty if valid)
+    """
     # Check if this is a CPS file
     if not is_cps_file(file_path):
-        return False, [f"File path does not indicate a CPS document: {file_path}"]
-    
-    # Validate line endings (must check raw file bytes)
-    line_ending_errors = validate_line_endings(file_path)
-    errors.extend(line_ending_errors)
-    
-    # Read file content
+        return [Finding(FILE_PATH_RULE, f"File path does not indicate a CPS document: {file_path}")]
+
+    # Read and scan the file once; every rule works on the scan
+    start = time.perf_counter()
     try:
-        content = file_path.read_text(encoding='utf-8')
+        doc = scan_document(file_path) if content is None else scan_bytes(content, file_path)
     except Exception as e:
-        return False, [f"Error reading file: {e}"]
-    
-    # Parse frontmatter
-    frontmatter, remaining_content, raw_lines = parse_frontmatter(content)
-    if frontmatter is None:
-        errors.append("Missing or invalid YAML frontmatter (must start with '---' and end with '---')")
-        return False, errors
-
-    # Check for leading zeros in CPS field (YAML loses this information)
-    if raw_lines:
-        for line in raw_lines:
-            if re.match(r'^CPS:\s+0\d+', line):
-                errors.append("CPS number must not have leading zeros")
-                break
+        return [Finding(FILE_READ_RULE, f"Error reading file: {e}")]
+    if timings is not None:
+        timings[PROFILE_SCAN] = timings.get(PROFILE_SCAN, 0.0) + time.perf_counter() - start
 
-    # Validate header
-    header_errors = validate_header(frontmatter)
-    errors.extend(header_errors)
-    
-    # Validate no H1 headings
-    h1_errors = validate_no_h1_headings(remaining_content)
-    errors.extend(h1_errors)
-    
-    # Validate sections
-    section_errors = validate_sections(remaining_content)
-    errors.extend(section_errors)
-    
-    is_valid = len(errors) == 0
-    return is_valid, errors
+    return run_rules(doc, select_rules(rules), timings)
+
+
+def validate_file(file_path: Path, rules: Optional[Iterable[str]] = None) -> Tuple[bool, List[str]]:
+    """Validate a single CPS README.md file.
+
+    Args:
+        file_path: Path of the document
+        rules: Names of the rules to run (default: all registered rules)
+
+    Returns:
+        Tuple of (is_valid, list_of_errors)
+    """
+    findings = check_file(file_path, rules)
+    return len(findings) == 0, [finding.message for finding in findings]
+
+
+@dataclass
+class FileResult:
+    """Validation outcome for one file, as streamed back by iter_results."""
+    path: Path
+    findings: List[Finding]
+    timings: Optional[Dict[str, float]] = None
+    cached: bool = False
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.findings
+
+    @property
+    def errors(self) -> List[str]:
+        return [finding.message for finding in self.findings]
+
+
+def compute_ruleset_hash() -> str:
+    """Hash everything that can change the outcome of validating a given document.
+
+    Covers this script's source, the header schema, the rule constants and the
+    proposal directories CIP labels resolve against, so cached results are
+    invalidated automatically whenever any of them change.
+    """
+    digest = hashlib.sha256()
+    digest.update(Path(__file__).read_bytes())
+    digest.update(SCHEMA_PATH.read_bytes())
+    rules = {
+        'fields': CPS_REQUIRED_FIELDS_ORDER,
+        'sections': CPS_REQUIRED_SECTIONS_ORDER,
+        'optional': sorted(CPS_OPTIONAL_SECTIONS),
+        'proposals': get_proposal_tree().fingerprint(),
+    }
+    digest.update(json.dumps(rules, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def content_hash(file_path: Path) -> str:
+    """SHA-256 of the raw file bytes."""
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+class ValidationCache:
+    """Persistent on-disk cache of validation results keyed by content hash.
+
+    Entries are only valid for the ruleset they were produced with; loading a
+    cache written under a different ruleset hash discards it. When more than
+    `max_entries` results are stored, the least recently used are evicted.
+    Hits only refresh the in-memory `used` times, which are written along
+    with the next addition or eviction: a warm run that changes nothing
+    leaves the file untouched.
+    """
+
+    def __init__(self, path: Path, ruleset: str, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ruleset = ruleset
+        self.max_entries = max_entries
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('ruleset') != self.ruleset:
+            # Script, schema or rules changed: start afresh
+            self.dirty = True
+            return
+        entries = data.get('entries')
+        if isinstance(entries, dict):
+            self.entries = entries
+
+    def get(self, key: str) -> Optional[List[Finding]]:
+        """Return the cached findings for a content hash, if any."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        entry['used'] = time.time()
+        return [Finding.from_dict(f) for f in entry['findings']]
+
+    def put(self, key: str, findings: List[Finding]):
+        self.entries[key] = {'findings': [f.to_dict() for f in findings], 'used': time.time()}
+        self.dirty = True
+
+    def _evict(self):
+        excess = len(self.entries) - self.max_entries
+        if excess <= 0:
+            return
+        oldest = sorted(self.entries, key=lambda k: self.entries[k]['used'])[:excess]
+        for key in oldest:
+            del self.entries[key]
+
+    def save(self):
+        """Write the cache atomically, so concurrent runs never see a partial file.
+
+        Nothing is written unless entries were added or discarded, or need evicting.
+        """
+        if not self.dirty and len(self.entries) <= self.max_entries:
+            return
+        self._evict()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix='.validate-cps-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'ruleset': self.ruleset, 'entries': self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.dirty = False
+
+
+def iter_cached_results(files: List[Path], jobs: int = 1, cache: Optional[ValidationCache] = None,
+                        rules: Optional[Tuple[str, ...]] = None, profile: bool = False) -> Iterator[FileResult]:
+    """Like iter_results, but serve unchanged documents from `cache`.
+
+    Only cache misses are validated (in parallel when jobs > 1); results are
+    still yielded in the order of `files`.
+    """
+    if cache is None:
+        yield from iter_results(files, jobs, rules, profile)
+        return
+
+    # Results depend on which rules ran, so the selection is part of the key
+    rule_key = ','.join(select_rules(rules))
+
+    keys: Dict[Path, Optional[str]] = {}
+    cached: Dict[Path, List[Finding]] = {}
+    misses = []
+    for file_path in files:
+        # Path-dependent checks are not part of the content hash, so only
+        # documents that pass them are eligible for caching
+        key = None
+        if is_cps_file(file_path):
+            try:
+                key = f"{content_hash(file_path)}:{rule_key}"
+            except OSError:
+                key = None
+        keys[file_path] = key
+        hit = cache.get(key) if key is not None else None
+        if hit is not None:
+            cached[file_path] = hit
+        else:
+            misses.append(file_path)
+
+    fresh = iter_results(misses, jobs, rules, profile)
+    for file_path in files:
+        if file_path in cached:
+            yield FileResult(file_path, cached[file_path], cached=True)
+            continue
+        result = next(fresh)
+        key = keys[file_path]
+        if key is not None and not any(f.rule == FILE_READ_RULE for f in result.findings):
+            cache.put(key, result.findings)
+        yield result
+
+
+def discover_files(patterns: List[str], root: Path = REPO_ROOT) -> List[Path]:
+    """Expand glob patterns relative to the repository root.
+
+    Returns:
+        Sorted, de-duplicated list of matching files
+    """
+    cwd = Path.cwd()
+    found = set()
+    for pattern in patterns:
+        for path in root.glob(pattern):
+            if not path.is_file():
+                continue
+            # Prefer short, cwd-relative paths in messages when possible
+            try:
+                path = path.relative_to(cwd)
+            except ValueError:
+                pass
+            found.add(path)
+    return sorted(found)
+
+
+def _git(args: List[str], root: Path) -> str:
+    """Run a git command in `root` and return its output.
+
+    Raises:
+        ValueError: if git fails (unknown ref, not a repository, shallow history)
+    """
+    try:
+        completed = subprocess.run(['git', *args], cwd=root, capture_output=True, text=True, check=True)
+    except FileNotFoundError:
+        raise ValueError("git is not available") from None
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"git {' '.join(args)} failed: {e.stderr.strip()}") from None
+    return completed.stdout
+
+
+def git_changes(ref: str, root: Path = REPO_ROOT) -> List[Tuple[str, str]]:
+    """Files changed since the merge-base of `ref` and HEAD, including uncommitted and untracked files.
+
+    Renames are detected, so a moved document is reported at its new path
+    (status 'R') and its old path (status 'D').
+
+    Returns:
+        List of (status letter, repository-relative POSIX path)
+
+    Raises:
+        ValueError: if the merge-base cannot be computed (e.g. `ref` unknown or history too shallow)
+    """
+    base = _git(['merge-base', ref, 'HEAD'], root).strip()
+    fields = _git(['diff', '--name-status', '-z', '-M', base], root).split('\0')
+    changes = []
+    i = 0
+    while i < len(fields) - 1:
+        status = fields[i][:1]
+        if status in ('R', 'C'):
+            old, new = fields[i + 1], fields[i + 2]
+            if status == 'R':
+                changes.append(('D', old))
+            changes.append((status, new))
+            i += 3
+        else:
+            changes.append((status, fields[i + 1]))
+            i += 2
+    untracked = _git(['ls-files', '--others', '--exclude-standard', '-z'], root).split('\0')
+    changes.extend(('A', path) for path in untracked if path)
+    return changes
+
+
+def discover_changed_files(ref: str, rules: Iterable[str], root: Path = REPO_ROOT) -> List[Path]:
+    """CPS documents to validate for the changes since `ref` (see git_changes).
+
+    Changed CPS documents are always included. When a selected rule reads
+    other proposals ('proposal_tree'), so are the CPSs whose headers reference
+    a CIP directory that was added, removed or renamed. A change to this
+    script or to the header schema selects every CPS.
+
+    Returns:
+        Sorted list of existing files, cwd-relative when possible
+    """
+    changes = git_changes(ref, root)
+    validator_inputs = {
+        path.resolve().relative_to(root).as_posix()
+        for path in (Path(__file__), SCHEMA_PATH)
+        if path.resolve().is_relative_to(root)
+    }
+    if any(path in validator_inputs for _, path in changes):
+        return discover_files([CPS_DOCUMENT_GLOB], root)
+
+    targets = set()
+    touched_cips = set()
+    for status, path in changes:
+        parts = path.split('/')
+        match = PROPOSAL_DIR_PATTERN.match(parts[0])
+        if match is None:
+            continue
+        if match.group(1) == 'CPS' and parts[1:] == ['README.md'] and status != 'D':
+            targets.add(path)
+        elif match.group(1) == 'CIP' and status in ('A', 'C', 'D', 'R'):
+            # Only additions and removals can create or delete a CIP directory
+            touched_cips.add(int(match.group(2)))
+
+    if touched_cips and any('proposal_tree' in RULES[name].needs for name in rules):
+        tree = ProposalTree(root)
+        references = tree.references()
+        for number in touched_cips:
+            for reference in references.get(tree.cip_dir(number) or f"CIP-{number:04d}", []):
+                targets.add(f"{reference.cps}/README.md")
+
+    cwd = Path.cwd()
+    files = []
+    for target in sorted(targets):
+        path = root / target
+        if not path.is_file():
+            continue
+        try:
+            path = path.relative_to(cwd)
+        except ValueError:
+            pass
+        files.append(path)
+    return files
+
+
+def _init_worker():
+    """Process pool initializer: compile the header schema and scan the proposal tree once per worker."""
+    get_proposal_tree()
+    try:
+        get_schema_validator()
+    except jsonschema.SchemaError:
+        pass  # Reported per document by the header-schema rule
+
+
+def _validate_worker(file_path: Path, rules: Optional[Tuple[str, ...]] = None, profile: bool = False) -> FileResult:
+    """Process pool entry point: validate one file and tag the result with its path."""
+    timings = {} if profile else None
+    findings = check_file(file_path, rules, timings)
+    return FileResult(file_path, findings, timings)
 
 
-def main():
+def iter_results(files: List[Path], jobs: int = 1, rules: Optional[Tuple[str, ...]] = None,
+                 profile: bool = False) -> Iterator[FileResult]:
+    """Validate files, yielding a FileResult per file in input order.
+
+    With jobs > 1 the files are fanned out across a process pool; results are
+    streamed back as they complete but always yielded in the order of `files`,
+    so output is deterministic regardless of scheduling.
+    """
+    if jobs <= 1 or len(files) <= 1:
+        for file_path in files:
+            yield _validate_worker(file_path, rules, profile)
+        return
+
+    workers = min(jobs, len(files))
+    # Small chunks keep workers busy while still amortising IPC overhead
+    chunksize = max(1, len(files) // (workers * 4))
+    # Compile in the parent first so forked workers inherit the validator
+    _init_worker()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        yield from executor.map(partial(_validate_worker, rules=rules, profile=profile), files, chunksize=chunksize)
+
+
+def _all_rule_descriptions() -> Dict[str, str]:
+    """Descriptions of every rule id that can appear in findings."""
+    descriptions = {name: rule.description for name, rule in RULES.items()}
+    descriptions[FILE_PATH_RULE] = "file lives in a CPS-* directory"
+    descriptions[FILE_READ_RULE] = "file can be read as UTF-8"
+    return descriptions
+
+
+def format_json(results: List[FileResult]) -> str:
+    """Render results as JSON: one entry per file with its findings."""
+    files = [
+        {
+            'path': result.path.as_posix(),
+            'valid': result.is_valid,
+            'cached': result.cached,
+            'findings': [finding.to_dict() for finding in result.findings],
+        }
+        for result in results
+    ]
+    summary = {
+        'files': len(results),
+        'failed': sum(1 for result in results if not result.is_valid),
+        'findings': sum(len(result.findings) for result in results),
+    }
+    return json.dumps({'files': files, 'summary': summary}, indent=2)
+
+
+def format_sarif(results: List[FileResult]) -> str:
+    """Render results as a SARIF 2.1.0 log (e.g. for GitHub code scanning)."""
+    rules = [
+        {'id': rule_id, 'shortDescription': {'text': description}}
+        for rule_id, description in _all_rule_descriptions().items()
+    ]
+    sarif_results = []
+    for result in results:
+        for finding in result.findings:
+            location = {'artifactLocation': {'uri': result.path.as_posix()}}
+            if finding.line is not None:
+                location['region'] = {'startLine': finding.line}
+            sarif_results.append({
+                'ruleId': finding.rule,
+                'level': 'error',
+                'message': {'text': finding.message},
+                'locations': [{'physicalLocation': location}],
+            })
+    log = {
+        '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {'name': 'validate-cps', 'rules': rules}},
+            'results': sarif_results,
+        }],
+    }
+    return json.dumps(log, indent=2)
+
+
+def format_profile(results: List[FileResult]) -> str:
+    """Aggregate per-step timings into a hot-path table, slowest first."""
+    totals: Dict[str, float] = {}
+    calls: Dict[str, int] = {}
+    profiled = 0
+    for result in results:
+        if result.timings is None:
+            continue
+        profiled += 1
+        for step, seconds in result.timings.items():
+            totals[step] = totals.get(step, 0.0) + seconds
+            calls[step] = calls.get(step, 0) + 1
+
+    grand_total = sum(totals.values())
+    lines = [
+        f"Profile of {profiled} validated file(s)",
+        f"{'step':24} {'calls':>7} {'total ms':>10} {'mean us':>10} {'share':>7}",
+    ]
+    for step in sorted(totals, key=totals.get, reverse=True):
+        total = totals[step]
+        share = total / grand_total * 100 if grand_total else 0.0
+        lines.append(f"{step:24} {calls[step]:7d} {total * 1e3:10.2f} {total / calls[step] * 1e6:10.1f} {share:6.1f}%")
+    lines.append(f"{'total':24} {'':7} {grand_total * 1e3:10.2f}")
+    return '\n'.join(lines)
+
+
+class _Inotify:
+    """Minimal Linux inotify binding (ctypes), used by watch mode when available."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    FILE_EVENTS = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    _EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library('c')
+        if not sys.platform.startswith('linux') or libc_name is None:
+            raise OSError("inotify is not available on this platform")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, Path] = {}
+
+    def add_watch(self, directory: Path, mask: int = FILE_EVENTS):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.watches[wd] = directory
+
+    def read_events(self) -> List[Tuple[Path, int]]:
+        """Drain pending events as (path, mask) pairs."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b'\0')
+            offset += name_length
+            directory = self.watches.get(wd)
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+            if directory is not None:
+                events.append((directory / os.fsdecode(name) if name else directory, mask))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _DaemonClient:
+    """A daemon connection: the request read so far and the response left to send."""
+
+    def __init__(self, connection: socket.socket, deadline: float):
+        self.connection = connection
+        self.deadline = deadline
+        self.buffer = b''
+        self.output = b''
+
+
+class ValidationDaemon:
+    """Long-running validator for editor integrations and pre-commit hooks.
+
+    Keeps the compiled schema and the latest result for every watched
+    document in memory, revalidates documents as they change (inotify on
+    Linux, mtime polling elsewhere) and answers newline-delimited JSON
+    requests on a Unix socket:
+
+        {"cmd": "validate", "paths": [...]}          validate files (served from memory when unchanged)
+        {"cmd": "validate", "path": p, "content": s} validate an unsaved buffer
+        {"cmd": "failures"}                          every watched document that currently fails
+        {"cmd": "status"}                            counts and uptime
+        {"cmd": "shutdown"}                          stop the daemon
+    """
+
+    # Seconds a client has to send its request and read the response
+    CLIENT_TIMEOUT = 5.0
+    # Largest request line (an unsaved buffer included)
+    MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, socket_path: Path, patterns: List[str], rules: Tuple[str, ...],
+                 root: Path = REPO_ROOT, poll_interval: float = 1.0):
+        self.socket_path = socket_path
+        self.patterns = patterns
+        self.rules = rules
+        self.root = root
+        self.poll_interval = poll_interval
+        # Absolute path -> (stat key, result); result is None for watched non-CPS documents
+        self.state: Dict[Path, Tuple[Tuple[int, int], Optional[FileResult]]] = {}
+        self.started = time.time()
+        self.running = False
+        self.inotify: Optional[_Inotify] = None
+
+    def _matches(self, path: Path) -> bool:
+        try:
+            relative = path.relative_to(self.root)
+        except ValueError:
+            return False
+        return any(relative.match(pattern) for pattern in self.patterns)
+
+    def refresh(self, path: Path) -> Optional[FileResult]:
+        """Bring one document up to date, revalidating only if it changed on disk."""
+        try:
+            stat = path.stat()
+        except OSError:
+            self.state.pop(path, None)
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+        known = self.state.get(path)
+        if known is not None and known[0] == key:
+            return known[1]
+        result = None
+        if is_cps_file(path):
+            result = FileResult(path, check_file(path, self.rules))
+            was_valid = known is not None and known[1] is not None and known[1].is_valid
+            if known is not None and (result.is_valid != was_valid or not result.is_valid):
+                status = "passes" if result.is_valid else f"fails ({len(result.findings)} finding(s))"
+                print(f"{self._display(path)} {status}", file=sys.stderr)
+        self.state[path] = (key, result)
+        return result
+
+    def _display(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def _check_tree(self) -> bool:
+        """Rescan the proposal directories; if they changed, mark every CPS for revalidation.
+
+        CIP labels resolve against the tree, so a merged or removed CIP can
+        change the result of documents that did not change themselves.
+        """
+        previous = get_proposal_tree().fingerprint()
+        reset_proposal_tree()
+        if get_proposal_tree().fingerprint() == previous:
+            return False
+        for path, (_, result) in list(self.state.items()):
+            if result is not None:
+                self.state[path] = ((-1, -1), result)
+        return True
+
+    def scan_all(self):
+        """(Re)discover every watched document and bring it up to date."""
+        self._check_tree()
+        seen = set()
+        for pattern in self.patterns:
+            for path in self.root.glob(pattern):
+                if path.is_file():
+                    seen.add(path)
+                    self.refresh(path)
+        for path in set(self.state) - seen:
+            if self._matches(path):
+                del self.state[path]
+
+    def _setup_watches(self):
+        try:
+            self.inotify = _Inotify()
+        except OSError:
+            self.inotify = None
+            return
+        # New proposal directories appear at the root; documents change inside them
+        self.inotify.add_watch(self.root, _Inotify.IN_CREATE | _Inotify.IN_MOVED_TO | _Inotify.IN_DELETE | _Inotify.IN_MOVED_FROM)
+        for directory in {path.parent for path in self.state}:
+            self.inotify.add_watch(directory)
+
+    def _handle_fs_events(self):
+        for path, mask in self.inotify.read_events():
+            if mask & _Inotify.IN_ISDIR and path.parent == self.root:
+                if mask & (_Inotify.IN_CREATE | _Inotify.IN_MOVED_TO) and path.is_dir():
+                    # A new proposal directory: watch it and pick up any documents already in it
+                    self.inotify.add_watch(path)
+                    for child in path.iterdir():
+                        if self._matches(child):
+                            self.refresh(child)
+                if self._check_tree():
+                    self.scan_all()
+            elif self._matches(path):
+                self.refresh(path)
+
+    @staticmethod
+    def _check_request(request) -> None:
+        """Raise ValueError unless the request's fields have the documented types."""
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        rules = request.get('rules')
+        if rules is not None and not (isinstance(rules, list) and all(isinstance(r, str) for r in rules)):
+            raise ValueError("'rules' must be a list of strings")
+        if 'content' in request:
+            if not isinstance(request['content'], str) or not isinstance(request.get('path'), str):
+                raise ValueError("'path' and 'content' must be strings")
+        paths = request.get('paths', [])
+        if not (isinstance(paths, list) and all(isinstance(p, str) for p in paths)):
+            raise ValueError("'paths' must be a list of strings")
+
+    def handle_request(self, request: Dict) -> Dict:
+        """Answer one client request.
+
+        Raises:
+            ValueError: if the request is not an object or a field has the wrong type
+        """
+        self._check_request(request)
+        command = request.get('cmd')
+        if command == 'validate':
+            rules = tuple(request['rules']) if request.get('rules') is not None else self.rules
+            if 'content' in request:
+                path = Path(request['path'])
+                findings = check_file(path, rules, content=request['content'].encode('utf-8'))
+                return {'results': [_result_to_dict(FileResult(path, findings))]}
+            results = []
+            for raw_path in request.get('paths', []):
+                # Normalised so that '..' cannot pass for a watched document
+                path = Path(os.path.normpath(self.root / raw_path))
+                # Only watched documents enter the state; anything else is validated and forgotten
+                if rules == self.rules and self._matches(path):
+                    result = self.refresh(path)
+                    if result is None:
+                        result = FileResult(path, check_file(path, rules))
+                else:
+                    result = FileResult(path, check_file(path, rules))
+                results.append(_result_to_dict(result))
+            return {'results': results}
+        if command == 'failures':
+            failing = [r for _, r in self.state.values() if r is not None and not r.is_valid]
+            return {'results': [_result_to_dict(r) for r in sorted(failing, key=lambda r: r.path)]}
+        if command == 'status':
+            validated = [r for _, r in self.state.values() if r is not None]
+            return {
+                'documents': len(self.state),
+                'validated': len(validated),
+                'failing': sum(1 for r in validated if not r.is_valid),
+                'watcher': 'inotify' if self.inotify is not None else 'polling',
+                'uptime': time.time() - self.started,
+            }
+        if command == 'shutdown':
+            self.running = False
+            return {'ok': True}
+        return {'error': f"Unknown command: {command!r}"}
+
+    def _respond(self, data: bytes) -> bytes:
+        """The encoded response line to one request line; never raises."""
+        try:
+            response = self.handle_request(json.loads(data.decode('utf-8')))
+        except (ValueError, KeyError, TypeError) as e:
+            response = {'error': f"Bad request: {e}"}
+        except Exception as e:
+            # A bug in a rule must not take down every editor relying on the daemon
+            response = {'error': f"Internal error: {type(e).__name__}: {e}"}
+        return json.dumps(response).encode('utf-8') + b'\n'
+
+    def _serve_client(self, selector: selectors.BaseSelector, client: '_DaemonClient', events: int):
+        """Advance one client connection without blocking the event loop.
+
+        The request is read as it arrives, answered once its line is
+        complete (or the client stops sending), and the response written as
+        the socket accepts it. Any socket error closes this connection only.
+        """
+        try:
+            if events & selectors.EVENT_READ:
+                chunk = client.connection.recv(65536)
+                client.buffer += chunk
+                if not chunk or b'\n' in client.buffer or len(client.buffer) > self.MAX_REQUEST_BYTES:
+                    client.output = self._respond(client.buffer.split(b'\n', 1)[0])
+                    selector.modify(client.connection, selectors.EVENT_WRITE, client)
+            elif events & selectors.EVENT_WRITE:
+                sent = client.connection.send(client.output)
+                client.output = client.output[sent:]
+                if not client.output:
+                    self._close_client(selector, client)
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._close_client(selector, client)
+
+    @staticmethod
+    def _close_client(selector: selectors.BaseSelector, client: '_DaemonClient'):
+        try:
+            selector.unregister(client.connection)
+        except (KeyError, ValueError):
+            pass
+        client.connection.close()
+
+    def serve_forever(self):
+        """Run until a shutdown request or KeyboardInterrupt."""
+        get_schema_validator()
+        self.scan_all()
+        self._setup_watches()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self.socket_path))
+        server.listen()
+        server.setblocking(False)
+
+        selector = selectors.DefaultSelector()
+        selector.register(server, selectors.EVENT_READ, 'client')
+        if self.inotify is not None:
+            selector.register(self.inotify.fd, selectors.EVENT_READ, 'fs')
+
+        validated = [r for _, r in self.state.values() if r is not None]
+        failing = sum(1 for r in validated if not r.is_valid)
+        print(f"Watching {len(self.state)} document(s) ({len(validated)} validated, {failing} failing) "
+              f"with {'inotify' if self.inotify else 'polling'}; listening on {self.socket_path}", file=sys.stderr)
+
+        self.running = True
+        last_poll = time.monotonic()
+        try:
+            while self.running:
+                for key, events in selector.select(timeout=self.poll_interval):
+                    if key.data == 'fs':
+                        self._handle_fs_events()
+                    elif key.data == 'client':
+                        try:
+                            connection, _ = server.accept()
+                        except OSError:
+                            continue
+                        connection.setblocking(False)
+                        client = _DaemonClient(connection, time.monotonic() + self.CLIENT_TIMEOUT)
+                        selector.register(connection, selectors.EVENT_READ, client)
+                    else:
+                        self._serve_client(selector, key.data, events)
+                # Drop clients that stalled mid-request or stopped reading
+                now = time.monotonic()
+                for key in list(selector.get_map().values()):
+                    if isinstance(key.data, _DaemonClient) and key.data.deadline < now:
+                        self._close_client(selector, key.data)
+                if self.inotify is None and time.monotonic() - last_poll >= self.poll_interval:
+                    self.scan_all()
+                    last_poll = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            for key in list(selector.get_map().values()):
+                if isinstance(key.data, _DaemonClient):
+                    # Answered requests (the shutdown one included) still get their response
+                    if key.data.output:
+                        try:
+                            key.data.connection.settimeout(1.0)
+                            key.data.connection.sendall(key.data.output)
+                        except OSError:
+                            pass
+                    self._close_client(selector, key.data)
+            selector.close()
+            server.close()
+            if self.inotify is not None:
+                self.inotify.close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+
+def _result_to_dict(result: FileResult) -> Dict:
+    return {
+        'path': str(result.path),
+        'valid': result.is_valid,
+        'findings': [finding.to_dict() for finding in result.findings],
+    }
+
+
+def query_daemon(socket_path: Path, request: Dict, timeout: float = 10.0) -> Optional[Dict]:
+    """Send one request to a running daemon; None if no daemon is listening."""
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            buffer = b''
+            while not buffer.endswith(b'\n'):
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+    except OSError:
+        return None
+    try:
+        return json.loads(buffer.decode('utf-8'))
+    except ValueError:
+        return None
+
+
+def _results_from_daemon(socket_path: Path, files: List[Path], rules: Tuple[str, ...]) -> Optional[List[FileResult]]:
+    """Validate `files` through a running daemon, or return None to validate locally."""
+    request = {'cmd': 'validate', 'paths': [str(f.resolve()) for f in files], 'rules': list(rules)}
+    response = query_daemon(socket_path, request)
+    if response is None or 'results' not in response:
+        return None
+    entries = response['results']
+    if not isinstance(entries, list) or len(entries) != len(files):
+        print("Warning: the watch daemon answered for a different set of files; validating locally", file=sys.stderr)
+        return None
+    try:
+        return [
+            FileResult(file_path, [Finding.from_dict(f) for f in entry['findings']], cached=True)
+            for file_path, entry in zip(files, entries)
+        ]
+    except (KeyError, TypeError):
+        print("Warning: malformed response from the watch daemon; validating locally", file=sys.stderr)
+        return None
+
+
+def print_references(cips: List[str], output_format: str = 'text'):
+    """Print which CPSs reference each CIP (every referenced CIP if `cips` is empty)."""
+    tree = get_proposal_tree()
+    references = tree.references()
+    if cips:
+        keys = []
+        for cip in cips:
+            match = re.search(r'(\d+)$', cip)
+            if not match:
+                print(f"Error: not a CIP number: {cip}", file=sys.stderr)
+                sys.exit(1)
+            number = int(match.group(1))
+            keys.append(tree.cip_dir(number) or f"CIP-{number:04d}")
+    else:
+        keys = sorted(references)
+
+    if output_format != 'text':
+        print(json.dumps({key: [vars(ref) for ref in references.get(key, [])] for key in keys}, indent=2))
+        return
+    for key in keys:
+        merged = '' if tree.cip_dir(int(key[4:])) else ' (not merged)'
+        print(f"{key}{merged}")
+        for ref in references.get(key, []):
+            candidate = ' as candidate' if ref.candidate else ''
+            print(f"  {ref.cps}  {ref.field_name}{candidate}")
+        if not references.get(key):
+            print("  (no CPS references)")
+
+
+def _comma_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Validate CPS README.md files (YAML header and required sections)."
+    )
+    parser.add_argument('files', nargs='*', type=Path, help="CPS README.md files to validate")
+    parser.add_argument('--all', action='store_true',
+                        help=f"validate every document matching '{CPS_DOCUMENT_GLOB}' in the repository")
+    parser.add_argument('--glob', action='append', default=[], metavar='PATTERN',
+                        help="validate every document matching PATTERN (relative to the repository root); repeatable")
+    parser.add_argument('--changed-since', metavar='REF',
+                        help="validate the CPSs changed since the merge-base of REF and HEAD (plus those referencing changed CIPs)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help="number of worker processes (0 = one per CPU, default: 1)")
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE_PATH, metavar='PATH',
+                        help="incremental validation cache file (default: .cache/validate-cps.json)")
+    parser.add_argument('--cache-max-entries', type=int, default=DEFAULT_CACHE_MAX_ENTRIES, metavar='N',
+                        help=f"evict least recently used results beyond N entries (default: {DEFAULT_CACHE_MAX_ENTRIES})")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always re-validate every document")
+    parser.add_argument('--rules', type=_comma_list, metavar='NAMES',
+                        help="comma-separated rules to run (default: all, see --list-rules)")
+    parser.add_argument('--skip-rules', type=_comma_list, default=[], metavar='NAMES',
+                        help="comma-separated rules not to run")
+    parser.add_argument('--list-rules', action='store_true',
+                        help="list available rules and exit")
+    parser.add_argument('--references', nargs='*', metavar='CIP',
+                        help="list the CPSs whose headers reference each given CIP (all CIPs if none given) and exit")
+    parser.add_argument('--format', choices=['text', 'json', 'sarif'], default='text',
+                        help="report format: human-readable text on stderr (default), or JSON / SARIF on stdout")
+    parser.add_argument('--profile', action='store_true',
+                        help="time each validation step and print an aggregate table to stderr "
+                             "(validates every document, bypassing the cache and the daemon)")
+    parser.add_argument('--watch', action='store_true',
+                        help="run as a daemon: watch CPS/CIP READMEs, revalidate on change and answer queries on --socket")
+    parser.add_argument('--socket', type=Path, default=DEFAULT_SOCKET_PATH, metavar='PATH',
+                        help="Unix socket of the watch daemon (default: .cache/validate-cps.sock)")
+    parser.add_argument('--use-daemon', action='store_true',
+                        help="ask a running watch daemon for results, validating locally if none answers")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point for the validation script."""
-    if len(sys.argv) < 2:
-        print("Usage: validate-cps.py <file1> [file2] ...", file=sys.stderr)
+    args = parse_arguments(argv)
+
+    if args.list_rules:
+        for rule in RULES.values():
+            print(f"{rule.name:20} {rule.description}")
+        sys.exit(0)
+
+    if args.references is not None:
+        print_references(args.references, args.format)
+        sys.exit(0)
+
+    try:
+        rules = select_rules(args.rules, args.skip_rules)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
-    
-    files_to_validate = [Path(f) for f in sys.argv[1:]]
+
+    if args.watch:
+        if not hasattr(socket, 'AF_UNIX'):
+            print("Error: --watch requires Unix domain sockets", file=sys.stderr)
+            sys.exit(1)
+        ValidationDaemon(args.socket, WATCH_DOCUMENT_GLOBS + list(args.glob), rules).serve_forever()
+        sys.exit(0)
+
+    patterns = list(args.glob)
+    if args.all:
+        patterns.append(CPS_DOCUMENT_GLOB)
+
+    files_to_validate = list(args.files)
+    if patterns:
+        seen = set(files_to_validate)
+        files_to_validate.extend(f for f in discover_files(patterns) if f not in seen)
+    if args.changed_since:
+        try:
+            changed = discover_changed_files(args.changed_since, rules)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        seen = set(files_to_validate)
+        files_to_validate.extend(f for f in changed if f not in seen)
+        if not files_to_validate:
+            print(f"No CPS documents changed since {args.changed_since}", file=sys.stderr)
+            sys.exit(0)
+
+    if not files_to_validate:
+        print("Usage: validate-cps.py [--all] [--glob PATTERN] [--changed-since REF] [-j N] <file1> [file2] ...", file=sys.stderr)
+        sys.exit(1)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    text_output = args.format == 'text'
     all_valid = True
-    all_errors = []
-    
+    results = []
+
+    existing_files = []
     for file_path in files_to_validate:
         if not file_path.exists():
             print(f"Error: File not found: {file_path}", file=sys.stderr)
             all_valid = False
             continue
-        
-        is_valid, errors = validate_file(file_path)
-        
-        if not is_valid:
+        existing_files.append(file_path)
+
+    cache = None
+    result_stream = None
+    # Cached and daemon results carry no timings: a profile validates every document here
+    if args.use_daemon and not args.profile:
+        result_stream = _results_from_daemon(args.socket, existing_files, rules)
+    if result_stream is None and not args.no_cache and not args.profile:
+        cache = ValidationCache(args.cache, compute_ruleset_hash(), args.cache_max_entries)
+    if result_stream is None:
+        result_stream = iter_cached_results(existing_files, jobs, cache, rules, args.profile)
+
+    for result in result_stream:
+        results.append(result)
+        if not result.is_valid:
             all_valid = False
-            print(f"\nValidation failed for {file_path}:", file=sys.stderr)
-            for error in errors:
-                print(f"  - {error}", file=sys.stderr)
-            all_errors.append((file_path, errors))
-    
+            if text_output:
+                print(f"\nValidation failed for {result.path}:", file=sys.stderr)
+                for error in result.errors:
+                    print(f"  - {error}", file=sys.stderr)
+
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"Warning: could not write validation cache: {e}", file=sys.stderr)
+
+    if args.format == 'json':
+        print(format_json(results))
+    elif args.format == 'sarif':
+        print(format_sarif(results))
+
+    if args.profile:
+        print(f"\n{format_profile(results)}", file=sys.stderr)
+
     if not all_valid:
-        print(f"\nValidation failed for {len(all_errors)} file(s)", file=sys.stderr)
+        failed = sum(1 for result in results if not result.is_valid)
+        print(f"\nValidation failed for {failed} file(s)", file=sys.stderr)
         sys.exit(1)
-    
+
     print(f"\nAll {len(files_to_validate)} file(s) passed validation", file=sys.stderr)
     sys.exit(0)
 
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,71 @@
+#!/usr/bin/python
+
+# Exact counts of grinding attempts, shared by the forking scripts.
+# Kept in its own module so that joblib workers import the memoised
+# rows instead of receiving a pickled copy of the script's globals.
+
+import functools
+import numpy as np
+
+# Number of binomial rows kept in memory; row x holds x+1 integers of up to
+# x bits, so keeping every row is too costly for large windows
+row_cache_size = 64
+
+# Prefix sums of the binomial row x: P_x(k) = Sum_{i=0}^{k} (i out of x)
+# The row is built with exact integers, (i+1 out of x) = (i out of x) * (x-i) / (i+1),
+# and memoised: it serves S(w, x) for every w and every stake
+@functools.lru_cache(maxsize=row_cache_size)
+def binomial_prefix_sums(x):
+ sums = []
+ acc = 0
+ binom = 1
+ for i in range(x+1):
+  acc += binom
+  sums.append(acc)
+  binom = binom * (x-i) // (i+1)
+ return tuple(sums)
+
+# Number of grinding attempts for an interval of size w blocks
+# and x blocks controlled by the adversary, as an exact integer:
+# S(w, x) = Sum_{i >= w-x}^{x} (i out of x) = P_x(x) - P_x(w-x-1)
+def number_attempts_adv_exact(w, x):
+ low = w-x
+ if low > x:
+  return 0
+ sums = binomial_prefix_sums(x)
+ return sums[x] - (sums[low-1] if low > 0 else 0)
+
+# S(w, x) for x = ceil(w/2)..w, window after window (w = 1, 2, ...), as
+# (w, {x: S(w, x)}). Moving from w to w+1 only subtracts (w-x out of x) from
+# each S(w, x), so a window costs O(w) integer additions and only the
+# current window is kept in memory
+def iter_attempt_windows():
+ front = {}  # x -> [S(w, x), (w-x out of x)]
+ w = 0
+ while True:
+  for x in list(front):
+   counts = front[x]
+   k = w - x
+   if k + 1 > x:
+    # x < (w+1)/2: no longer part of the window
+    del front[x]
+    continue
+   counts[0] -= counts[1]
+   counts[1] = counts[1] * (x-k) // (k+1)
+  w += 1
+  front[w] = [2**w, 1]
+  yield w, {x: counts[0] for (x, counts) in front.items()}
+
+# S(w, x) as floats, in a read-only (n, n) table indexed [w, x] for w < n
+# (zero where x < w/2), for the simulations. S(w, x) <= 2^w, so n must stay
+# below 1024 for the table to fit in float64
+@functools.lru_cache(maxsize=4)
+def attempt_weights(n):
+ table = np.zeros((n, n))
+ for (w, attempts) in iter_attempt_windows():
+  if w >= n:
+   break
+  for (x, count) in attempts.items():
+   table[w, x] = count
+ table.flags.writeable = False
+ return table
@@ -2,12 +2,20 @@
 
 import sys
 import math
+import time
 import scipy
-from decimal import Decimal
+import numpy as np
+from decimal import Decimal, getcontext, localcontext
+from fractions import Fraction
 from joblib import Parallel, delayed
 import scipy.special
 import argparse
 from tabulate import tabulate
+import attempt_counts
+from attempt_counts import number_attempts_adv_exact, iter_attempt_windows
+import sweeps
+import result_cache
+import numeric_backends
 
 
 # Considered adversaral stakes in percentage
@@ -16,18 +24,18 @@ nb_stakes = len(stakes)
 
 # Probability to have x out of w blocks, with stake s: 
 # B_{w, s}(x) = (x out of w) * s^x * (1-s)^{w-x}
-# This function uses decimal to work with small numbers
+# This function uses decimal to work with small numbers, and an exact binomial
+# (scipy's float binomial overflows for w > 1029)
 def proba_attempts(w,x,s):
-  return Decimal(scipy.special.binom(w,x)) * Decimal(s)**x * Decimal(1-s)**(w-x)
+  return Decimal(math.comb(w,x)) * Decimal(s)**x * Decimal(1-s)**(w-x)
 
 # Number of grinding attempts for an interval of size w blocks
 # and x blocks controlled by the adversary: 
 # S(w, x) = Sum_{i >= w-x}^{x} (i out of x)
+# Computed exactly from memoised binomial prefix sums (see attempt_counts.py),
+# the conversion from an integer to Decimal is exact
 def number_attempts_adv(w, x):
- acc = Decimal(0)
- for i in range(w-x, x+1):
-  acc += Decimal(scipy.special.binom(x, i))
- return acc
+ return Decimal(number_attempts_adv_exact(w, x))
 
 # Total number of grinding attempts for an interval of w blocks:
 # S(w) = Sum_{x = w/2}^w S(w,x)
@@ -47,28 +55,210 @@ def expectation(w,x,s):
 # The expected number of grinding attempt for an interval of size d
 # and an adversary with s stake:
 # C(w, s) = Sum_{d=1}^w ( Sum_{x=d/2}^d B_{d,s}(x) * S(d,x) )
-# For Praos, s ~= 21600 * 4 / 10, but this number is too high for scipy
+# For Praos, s ~= 21600 * 4 / 10, which is too high for Decimal (see log_egs)
 # This function can still be used to show the convergence with increasingly high s however
 def eg(s, precision=10, cores=2):
- p = Decimal(0)
- for w in range(1, precision):
-  results = Parallel(n_jobs=cores)(delayed(expectation)(w, x, s) for x in range(math.ceil(w/2),w+1))
-  for res in results:
-    p += res
- return (s, Decimal(1-s) * p)  
+ return eg_values([s], precision, cores)[0]
+
+# Estimated cost of expectation(w, x, s), in arbitrary units: its integers
+# and Decimal powers grow with the window w
+def expectation_cost(w, x):
+ return w
+
+# Splits the (stake, x, w) grid of E(g) into batches of similar cost, a few
+# per core so that uneven batches even out. A batch is a list of
+# (stake, x, first w, last w) segments. The (w, x) pairs are visited x first
+# (w <= 2x <=> x >= w/2) so that each binomial row is built once per segment.
+def eg_batches(stakes, precision, cores=1):
+ segments = [(s, x, x, min(2*x, precision-1)) for s in stakes for x in range(1, precision)]
+ total = sum(expectation_cost(w, x) for (_, x, lo, hi) in segments for w in range(lo, hi+1))
+ target = max(1, total / (4 * cores))
+ batches, batch, acc = [], [], 0
+ for (s, x, lo, hi) in segments:
+  while lo <= hi:
+   # Take windows from this segment until the batch is full
+   w = lo
+   while w <= hi and acc < target:
+    acc += expectation_cost(w, x)
+    w += 1
+   if w > lo:
+    batch.append((s, x, lo, w-1))
+    lo = w
+   if acc >= target:
+    batches.append(batch)
+    batch, acc = [], 0
+ if batch:
+  batches.append(batch)
+ return batches
+
+# Sums expectation(w, x, s) over the segments of a batch, per stake
+def eg_batch(batch, expectation=expectation):
+ sums = {}
+ for (s, x, lo, hi) in batch:
+  acc = sums.get(s, 0)
+  for w in range(lo, hi+1):
+   acc += expectation(w, x, s)
+  sums[s] = acc
+ return list(sums.items())
+
+# E(g) of several stakes as (stake, Decimal) pairs: the whole task grid runs
+# on one pool (pass `parallel` to reuse an open joblib Parallel), and the
+# partial sums are reduced per stake, in batch order. The workers compute at
+# the precision of the current Decimal context or, with exact, in rationals
+# (see numeric_backends.py) rounded to it at the end
+def eg_values(stakes, precision=10, cores=1, parallel=None, exact=False):
+ if parallel is None:
+  parallel = Parallel(n_jobs=cores)
+ batches = eg_batches(stakes, precision, cores)
+ if exact:
+  tasks = (delayed(eg_batch)(batch, numeric_backends.ExactBackend().expectation) for batch in batches)
+ else:
+  tasks = (delayed(with_digits)(getcontext().prec, eg_batch, batch) for batch in batches)
+ totals = {s: 0 for s in stakes}
+ for partial in parallel(tasks):
+  for (s, p) in partial:
+   totals[s] += p
+ if exact:
+  return [(s, decimal_from_fraction((1 - Fraction(s)) * totals[s])) for s in stakes]
+ return [(s, Decimal(1-s) * totals[s]) for s in stakes]
+
+# fn(*args) in a Decimal context of the given precision: the workers do not
+# inherit the context of the main process
+def with_digits(digits, fn, *args):
+ with localcontext() as ctx:
+  ctx.prec = digits
+  return fn(*args)
+
+# A Fraction rounded to the precision of the current Decimal context
+def decimal_from_fraction(value):
+ return Decimal(value.numerator) / Decimal(value.denominator)
+
+# Window size of Praos' grinding opportunity, 21600 * 4 / 10 blocks
+praos_window = 21600 * 4 // 10
+
+# Same C(w, s) as eg, for all stakes at once, in float64 log-space.
+# Returns the natural logarithms of C(precision, s), so that windows in the
+# tens of thousands do not overflow (see log_eg_windows)
+def log_egs(stakes, precision=10):
+ return log_eg_windows(stakes, [precision])[0]
+
+# log C(w, s) for several windows w at once, of shape (len(windows), len(stakes)).
+# For each x, the windows w = x..2x are evaluated together and vectorised
+# over the stakes:
+#  log B_{w,s}(x) = log (x out of w) + x log(s) + (w-x) log(1-s)
+#  log S(w,x)     = logsumexp_{i >= w-x} log (i out of x), a suffix sum of row x
+# and gathered per window; C(P, s) sums the windows w < P, so the running
+# logsumexp over the windows gives every P in one pass
+def log_eg_windows(stakes, windows):
+ windows = np.asarray(windows)
+ top = int(windows.max())
+ s = np.asarray(stakes, dtype=np.float64)
+ log_s = np.log(s)[:, None]
+ log_1s = np.log1p(-s)
+ # log n! for n = 0..top
+ log_fact = scipy.special.gammaln(np.arange(top+1) + 1.0)
+ # [:, w] -> log Sum_{x=w/2}^w B_{w,s}(x) * S(w,x)
+ per_window = np.full((len(s), top), -np.inf)
+ for x in range(1, top):
+  # k = w - x, for the windows w = x..min(2x, top-1)
+  k = np.arange(min(x, top-1-x) + 1)
+  i = np.arange(x+1)
+  row = log_fact[x] - log_fact[i] - log_fact[x-i]
+  log_attempts = np.logaddexp.accumulate(row[::-1])[::-1][:len(k)]
+  log_binom = log_fact[x+k] - log_fact[x] - log_fact[k]
+  terms = (log_binom + log_attempts)[None, :] + x * log_s + k[None, :] * log_1s[:, None]
+  per_window[:, x:x+len(k)] = np.logaddexp(per_window[:, x:x+len(k)], terms)
+ cumulative = np.logaddexp.accumulate(per_window, axis=1)
+ return (log_1s[:, None] + cumulative[:, windows-1]).T
+
+# Converts a natural logarithm to a Decimal, which unlike a float has no
+# exponent limit
+def decimal_from_log(log_value):
+ return Decimal(10) ** (Decimal(float(log_value)) / Decimal(10).ln())
+
+# Version of the code behind each cached computation (see result_cache.py),
+# with the Decimal precision the results were computed at
+def cache_version(name):
+ sources = {
+  'eg decimal': [eg_values, eg_batches, eg_batch, expectation, proba_attempts, number_attempts_adv, attempt_counts],
+  'eg log': [log_egs, log_eg_windows, decimal_from_log],
+  'eg exact': [eg_values, eg_batches, eg_batch, decimal_from_fraction, numeric_backends, attempt_counts],
+  'proba_diff decimal': [proba_diff],
+  'proba_diff exact': [exact_proba_diff, decimal_from_fraction, numeric_backends],
+  'proba_diff log': [log_proba_diffs, log_proba_diff_windows, decimal_from_log],
+  'eg adaptive': [eg_adaptive, iter_eg_terms, converge, attempt_counts],
+  'proba_diff adaptive': [proba_diff_adaptive, iter_proba_diff_terms, converge],
+ }
+ return "{}:{}".format(result_cache.code_version(*sources[name]), getcontext().prec)
+
+# E(g) of all stakes, as (stake, Decimal) pairs sorted by stake.
+# The 'decimal' and 'exact' engines run eg_values, the 'log' engine runs log_egs.
+# With a result cache, only the stakes it misses are computed
+def compute_egs(precision=10, cores=1, engine='decimal', parallel=None, cache=None):
+ results = {}
+ if cache is not None:
+  version = cache_version('eg ' + engine)
+  key = lambda s: ['eg', engine, version, s, precision]
+  results = {s: cache.get(key(s)) for s in stakes}
+  results = {s: v for (s, v) in results.items() if v is not None}
+ missing = [s for s in stakes if s not in results]
+ if missing:
+  if engine == 'log':
+   computed = [(s, decimal_from_log(v)) for (s, v) in zip(missing, log_egs(missing, precision))]
+  else:
+   computed = eg_values(missing, precision, cores, parallel, engine == 'exact')
+  for (s, v) in computed:
+   results[s] = v
+   if cache is not None:
+    cache.put(key(s), v)
+ return sorted(results.items(), key=lambda x : x[0])
 
 # Computes and print the expectation of grinding attempts for all adversaries
-def all_egs(precision=10, cores=1):
- results = Parallel(n_jobs=cores)(delayed(eg)(s, precision) for s in stakes)
- res = sorted(results, key=lambda x : x[0])
+def all_egs(precision=10, cores=1, engine='decimal', parallel=None, cache=None):
+ res = compute_egs(precision, cores, engine, parallel, cache)
  # Printing tables (use tabulate's option tablefmt="plain" to have no lines)
  headers = ["stake (%)"] + ["{:.1f}%".format(s*100) for s in stakes]
  table = [["E(g)"] + ["{0:.2E}".format(r[1]) for r in res]]
+ # tabulate reads numbers as floats, which overflow past 1E+308
+ numparse = all(abs(r[1].adjusted()) < 300 for r in res)
  print("\nTable of grinding attempts")
- print(tabulate(table, headers, tablefmt='orgtbl'))
+ print(tabulate(table, headers, tablefmt='orgtbl', disable_numparse=not numparse))
 
+# Cross-checks the log-space engine against the Decimal one (at small windows)
+def cross_check(precision=10, cores=1):
+ exact = compute_egs(precision, cores, 'decimal')
+ approx = compute_egs(precision, cores, 'log')
+ headers = ["stake (%)"] + ["{:.1f}%".format(s*100) for s in stakes]
+ table = [
+  ["E(g), decimal"] + ["{0:.6E}".format(r[1]) for r in exact],
+  ["E(g), log"] + ["{0:.6E}".format(r[1]) for r in approx],
+  ["relative error"] + ["{0:.1E}".format(abs(a[1] - e[1]) / e[1]) for (e, a) in zip(exact, approx)],
+ ]
+ print("\nCross-check of the E(g) engines")
+ print(tabulate(table, headers, tablefmt='orgtbl', disable_numparse=True))
+ # Largest relative error of proba_diff and log_proba_diffs against the reference
+ pows = table_diffs()
+ logs = log_proba_diffs(pows, stakes, precision)
+ table = []
+ for (k, p) in enumerate(pows):
+  reference = Parallel(n_jobs=cores)(delayed(proba_diff_reference)(p, s, precision) for s in stakes)
+  row = [p]
+  for (i, s) in enumerate(stakes):
+   exact = reference[i][1]
+   error_dp = abs(proba_diff(p, s, precision)[1] - exact) / exact
+   error_log = abs(decimal_from_log(logs[k][i]) - exact) / exact
+   row.append("{0:.1E} / {1:.1E}".format(error_dp, error_log))
+  table.append(row)
+ print("\nCross-check of |Xa - Xh| probabilities against the reference (relative error, decimal / log)")
+ print(tabulate(table, ["|Xa - Xh| vs stake"] + headers[1:], tablefmt='orgtbl', disable_numparse=True))
 
-def proba_diff(diff, s, precision=10):
+
+# Probability of an advantage |Xa - Xh| = diff, summed over the first
+# precision+1 steps. Reference implementation, O(precision^3): step i starts
+# from a_i = (i out of diff+2i) (s(1-s))^i s^diff and subtracts the paths
+# already counted at the steps j < i, p_i = a_i - Sum_{j<i} p_j c_{i-j} with
+# c_k = (k out of 2k) (s(1-s))^k
+def proba_diff_reference(diff, s, precision=10):
  ps = []
  for i in range(precision+1):
   acc = Decimal(1)
@@ -84,14 +274,101 @@ def proba_diff(diff, s, precision=10):
   ps.append(acc)
  return (s, sum(ps))
 
-def tables(precision=10, cores=1):
+# Same as proba_diff_reference in O(precision). The recurrence above is the
+# series division P(z) = A(z) / C(z), whose terms are the ballot numbers
+#  p_i = diff / (2i+diff) * (i out of 2i+diff) * (s(1-s))^i * s^diff
+# so each term follows from the previous one with a single exact ratio:
+#  p_{i+1} = p_i * s(1-s) * (2i+diff) (2i+diff+1) / ((i+1) (i+diff+1))
+def proba_diff(diff, s, precision=10):
+ q = Decimal(s) * Decimal(1-s)
+ p = Decimal(s)**diff
+ acc = p
+ for i in range(precision):
+  p = p * q * Decimal((2*i+diff) * (2*i+diff+1)) / Decimal((i+1) * (i+diff+1))
+  acc += p
+ return (s, acc)
+
+# fn(*args), which returns (s, results...), taking the results from the
+# result cache when one is given (run by the workers: the cache is safe to
+# share between processes)
+def cached_call(cache, key, s, fn, *args):
+ if cache is None:
+  return fn(*args)
+ values = cache.get(key)
+ if values is None:
+  values = tuple(fn(*args)[1:])
+  cache.put(key, values)
+ return (s,) + values
+
+# proba_diff in exact rationals (see numeric_backends.py), rounded to the
+# precision of the current Decimal context
+def exact_proba_diff(diff, s, precision=10):
+ return (s, decimal_from_fraction(numeric_backends.ExactBackend().proba_diff(diff, s, precision)))
+
+# proba_diff for every diff and stake at once, in float64 log-space: returns
+# the natural logarithms, of shape (len(diffs), len(stakes)). The running
+# product is vectorised over both axes, and steps go on for as long as the
+# precision, so large diffs and precisions neither overflow nor underflow.
+def log_proba_diffs(diffs, stakes, precision=10):
+ return log_proba_diff_windows(diffs, stakes, [precision])[0]
+
+# log_proba_diffs for several precisions at once, of shape
+# (len(precisions), len(diffs), len(stakes)): the running sum is recorded
+# as it reaches each precision
+def log_proba_diff_windows(diffs, stakes, precisions):
+ d = np.asarray(diffs, dtype=np.float64)[:, None]
+ s = np.asarray(stakes, dtype=np.float64)[None, :]
+ log_q = np.log(s) + np.log1p(-s)
+ log_p = d * np.log(s)
+ acc = log_p
+ out = np.empty((len(precisions), d.shape[0], s.shape[1]))
+ for i in range(max(precisions)+1):
+  if i > 0:
+   log_p = log_p + log_q + np.log((2*i-2+d) * (2*i-1+d)) - np.log(i * (i+d))
+   acc = np.logaddexp(acc, log_p)
+  for (j, p) in enumerate(precisions):
+   if p == i:
+    out[j] = acc
+ return out
+
+# Advantages |Xa - Xh| shown in the tables: powers of 2 up to max_diff
+def table_diffs(max_diff=256):
+ return [2**k for k in range(max_diff.bit_length()) if 2**k <= max_diff]
+
+def tables(precision=10, cores=1, parallel=None, engine='decimal', max_diff=256, cache=None):
+ if parallel is None:
+  parallel = Parallel(n_jobs=cores)
  # Computing the tables of probabilities
  table = []
- pows = [1,2,4,8,16,32,64,128,256]
- for p in pows:
-  results = Parallel(n_jobs=cores)(delayed(proba_diff)(p, s, precision) for s in stakes)
-  row = sorted(results, key=lambda x: x[0])
-  table.append([r[1] for r in row])
+ pows = table_diffs(max_diff)
+ version = cache_version('proba_diff ' + engine) if cache is not None else None
+ key = lambda p, s: ['proba_diff', engine, version, p, s, precision]
+ if engine == 'log':
+  # Cells missing from the cache are computed in one vectorised call
+  cells = {}
+  if cache is not None:
+   for p in pows:
+    for s in stakes:
+     value = cache.get(key(p, s))
+     if value is not None:
+      cells[(p, s)] = value[0]
+  missing_pows = [p for p in pows if any((p, s) not in cells for s in stakes)]
+  missing_stakes = [s for s in stakes if any((p, s) not in cells for p in pows)]
+  if missing_pows:
+   for (p, row) in zip(missing_pows, log_proba_diffs(missing_pows, missing_stakes, precision)):
+    for (s, log_value) in zip(missing_stakes, row):
+     if (p, s) not in cells:
+      cells[(p, s)] = decimal_from_log(log_value)
+      if cache is not None:
+       cache.put(key(p, s), (cells[(p, s)],))
+  table = [[cells[(p, s)] for s in sorted(stakes)] for p in pows]
+ else:
+  fn = exact_proba_diff if engine == 'exact' else proba_diff
+  digits = getcontext().prec
+  for p in pows:
+   results = parallel(delayed(cached_call)(cache, key(p, s), s, with_digits, digits, fn, p, s, precision) for s in stakes)
+   row = sorted(results, key=lambda x: x[0])
+   table.append([r[1] for r in row])
  # Printing tables (use tabulate's option tablefmt="plain" to have no lines)
  headers = ["|Xa - Xh| vs stake"] + ["{:.1f}%".format(s*100) for s in stakes]
  # Printing the tables of probabilities
@@ -104,19 +381,186 @@ def tables(precision=10, cores=1):
  print(tabulate(table_year, headers, tablefmt='orgtbl'))
 
 
+# Adaptive precision: the series are extended term by term, and each stops
+# once what is left of it is negligible
+
+# Terms (1-s) * Sum_{x=w/2}^w B_{w,s}(x) * S(w,x) of C(w, s), for w = 1, 2, ...
+# Each window updates the previous one: S from iter_attempt_windows, and
+# B_{w+1,s}(x) = B_{w,s}(x) * (w+1) / (w+1-x) * (1-s)
+def iter_eg_terms(s):
+ s_d, r_d = Decimal(s), Decimal(1-s)
+ probas = {}  # x -> B_{w,s}(x)
+ for (w, attempts) in iter_attempt_windows():
+  probas = {x: b * w / (w-x) * r_d for (x, b) in probas.items() if x in attempts}
+  probas[w] = s_d**w
+  yield r_d * sum(probas[x] * attempts[x] for x in attempts)
+
+# Terms p_0, p_1, ... of proba_diff
+def iter_proba_diff_terms(diff, s):
+ q = Decimal(s) * Decimal(1-s)
+ p = Decimal(s)**diff
+ i = 0
+ while True:
+  yield p
+  p = p * q * Decimal((2*i+diff) * (2*i+diff+1)) / Decimal((i+1) * (i+diff+1))
+  i += 1
+
+# Sums terms until the estimated relative residual falls below tol, or
+# max_terms terms. Once the terms decrease with ratio r < 1 the tail is
+# bounded like a geometric series, term * r / (1 - r).
+# Returns (sum, number of terms, relative residual), with a residual of None
+# when the terms were still growing
+def converge(terms, tol=1e-10, max_terms=1000):
+ tol = Decimal(tol)
+ total, previous, n, residual = Decimal(0), None, 0, None
+ for term in terms:
+  total += term
+  n += 1
+  residual = None
+  if previous and total and term < previous:
+   ratio = term / previous
+   residual = term * ratio / (1 - ratio) / total
+   if residual < tol:
+    break
+  previous = term
+  if n >= max_terms:
+   break
+ return (total, n, residual)
+
+# E(g) with adaptive precision: (stake, E(g), precision reached, residual)
+def eg_adaptive(s, tol=1e-10, max_precision=1000):
+ (total, n, residual) = converge(iter_eg_terms(s), tol, max_precision-1)
+ return (s, total, n+1, residual)
+
+# proba_diff with adaptive precision: (stake, probability, precision reached, residual)
+def proba_diff_adaptive(diff, s, tol=1e-10, max_precision=1000):
+ (total, n, residual) = converge(iter_proba_diff_terms(diff, s), tol, max_precision+1)
+ return (s, total, n-1, residual)
+
+def format_residual(residual):
+ return "{0:.1E}".format(residual) if residual is not None else "growing"
+
+# Computes and print E(g) and the tables, each stake and diff stopping at the
+# precision where it converged (up to max_precision)
+def adaptive_tables(max_precision=1000, tol=1e-10, cores=1, parallel=None, max_diff=256, no_tables=False, cache=None):
+ if parallel is None:
+  parallel = Parallel(n_jobs=cores)
+ eg_version = cache_version('eg adaptive') if cache is not None else None
+ diff_version = cache_version('proba_diff adaptive') if cache is not None else None
+ headers = ["stake (%)"] + ["{:.1f}%".format(s*100) for s in stakes]
+ digits = getcontext().prec
+ res = sorted(parallel(delayed(cached_call)(cache, ['eg adaptive', eg_version, s, tol, max_precision], s, with_digits, digits, eg_adaptive, s, tol, max_precision) for s in stakes), key=lambda x: x[0])
+ table = [
+  ["E(g)"] + ["{0:.2E}".format(r[1]) for r in res],
+  ["precision"] + [r[2] for r in res],
+  ["residual"] + [format_residual(r[3]) for r in res],
+ ]
+ print("\nTable of grinding attempts (tolerance {:.0E})".format(tol))
+ print(tabulate(table, headers, tablefmt='orgtbl', disable_numparse=True))
+ if no_tables:
+  return
+ pows = table_diffs(max_diff)
+ table_proba, table_precision = [], []
+ for p in pows:
+  row = sorted(parallel(delayed(cached_call)(cache, ['proba_diff adaptive', diff_version, p, s, tol, max_precision], s, with_digits, digits, proba_diff_adaptive, p, s, tol, max_precision) for s in stakes), key=lambda x: x[0])
+  table_proba.append([p] + ["{:.3E}".format(r[1]) for r in row])
+  table_precision.append([p] + ["{} ({})".format(r[2], format_residual(r[3])) for r in row])
+ headers = ["|Xa - Xh| vs stake"] + headers[1:]
+ print("\nTable of probabilities (tolerance {:.0E})".format(tol))
+ print(tabulate(table_proba, headers, tablefmt='orgtbl', disable_numparse=True))
+ print("\nTable of precisions reached (residual)")
+ print(tabulate(table_precision, headers, tablefmt='orgtbl', disable_numparse=True))
+
+
+# Dense sweep: log E(g) over (windows, stakes) and the log |Xa - Xh|
+# probabilities over (precisions, diffs, stakes), the precisions being the
+# same windows, for nb_sweep_stakes stakes in (0, 0.5). Chunks of stakes are
+# computed in parallel and written to the arrays as they come (see sweeps.py).
+# C(1, s) is an empty sum: window 1, when swept, has log E(g) = -inf
+# (which is why the default windows start at 2)
+def sweep(path, nb_sweep_stakes, windows, diffs, fmt='npy', cores=1, parallel=None):
+ if parallel is None:
+  parallel = Parallel(n_jobs=cores)
+ sweep_stakes = sweeps.sweep_stakes(nb_sweep_stakes)
+ chunks = [sweep_stakes[i:i+sweeps.stake_chunk] for i in range(0, len(sweep_stakes), sweeps.stake_chunk)]
+ sweeps.create_sweep(path, {'stakes': sweep_stakes, 'windows': windows, 'diffs': diffs})
+ axes = [('window', windows), ('stake', sweep_stakes)]
+ log_eg = sweeps.open_array(path, 'log_eg', (len(windows), len(sweep_stakes)), fmt)
+ for (i, values) in enumerate(parallel(delayed(log_eg_windows)(chunk, windows) for chunk in chunks)):
+  log_eg[:, i*sweeps.stake_chunk:i*sweeps.stake_chunk+len(chunks[i])] = values
+ sweeps.close_array(path, 'log_eg', log_eg, axes, fmt)
+ axes = [('precision', windows), ('diff', diffs), ('stake', sweep_stakes)]
+ log_proba = sweeps.open_array(path, 'log_proba_diff', (len(windows), len(diffs), len(sweep_stakes)), fmt)
+ for (i, values) in enumerate(parallel(delayed(log_proba_diff_windows)(diffs, chunk, windows) for chunk in chunks)):
+  log_proba[:, :, i*sweeps.stake_chunk:i*sweeps.stake_chunk+len(chunks[i])] = values
+ sweeps.close_array(path, 'log_proba_diff', log_proba, axes, fmt)
+ print("Wrote a sweep of {} stakes, {} windows and {} diffs to {}".format(len(sweep_stakes), len(windows), len(diffs), path))
+
+# Evaluates proba_attempts, number_attempts_adv and expectation over the
+# (w, x) pairs of E(g) (w < precision, x >= w/2), and proba_diff over the
+# table's diffs, for all stakes in every backend (see numeric_backends.py).
+# Prints the largest relative error of each backend against the exact one,
+# and the time each took
+def compare_backends(precision=10, digits=28, max_diff=256):
+ pairs = [(w, x) for w in range(1, precision) for x in range(math.ceil(w/2), w+1)]
+ calls = {
+  'proba_attempts': [(w, x, s) for (w, x) in pairs for s in stakes],
+  'number_attempts_adv': pairs,
+  'expectation': [(w, x, s) for (w, x) in pairs for s in stakes],
+  'proba_diff': [(d, s, precision) for d in table_diffs(max_diff) for s in stakes],
+ }
+ backends = numeric_backends.all_backends(digits)
+ reference = backends[-1]
+ table = []
+ for (name, args) in calls.items():
+  start = time.perf_counter()
+  exact = [getattr(reference, name)(*a) for a in args]
+  exact_time = time.perf_counter() - start
+  row = [name]
+  for backend in backends[:-1]:
+   start = time.perf_counter()
+   values = [getattr(backend, name)(*a) for a in args]
+   elapsed = time.perf_counter() - start
+   error = max(backend.relative_error(v, e) for (v, e) in zip(values, exact))
+   row.append("{0:.1E} ({1:.3f}s)".format(error, elapsed))
+  row.append("reference ({0:.3f}s)".format(exact_time))
+  table.append(row)
+ headers = ["largest relative error (time)"] + [b.name for b in backends]
+ print("\nNumeric backends against the exact one, precision={}".format(precision))
+ print(tabulate(table, headers, tablefmt='orgtbl', disable_numparse=True))
+
+
 def parseArguments():
     # Create argument parser
     parser = argparse.ArgumentParser()
 
     # Optional arguments
     parser.add_argument("-c", "--cores", help="number of threads", type=int, default=1)
-    parser.add_argument("-p", "--precision", help="interval to compute E(g) on", type=int, default=32)
+    parser.add_argument("-p", "--precision", help="interval to compute E(g) on (Praos: {})".format(praos_window), type=int, default=32)
+    parser.add_argument("-e", "--engine", help="engine: Decimal sums (see --digits), exact rationals as a reference, or float64 log-space for large intervals; the sweep is always in log-space (default: decimal)", choices=["decimal", "exact", "log"])
+    parser.add_argument("--cross-check", help="compare the E(g) engines at the given precision and exit", action="store_true")
+    parser.add_argument("--no-tables", help="only print E(g), not the |Xa - Xh| tables", action="store_true")
+    parser.add_argument("-t", "--tolerance", help="adaptive precision: extend each series until its relative residual is below TOLERANCE, up to --precision", type=float)
+    parser.add_argument("-d", "--max-diff", help="largest |Xa - Xh| in the tables (powers of 2 up to it)", type=int, default=256)
+    parser.add_argument("--compare-backends", help="compare the float64 log-space, Decimal and exact backends at the given precision and exit", action="store_true")
+    parser.add_argument("--digits", help="significant digits of the Decimal engine and backend", type=int, default=28)
+    parser.add_argument("--cache", help="directory of the persistent result cache, reused by later runs (default: no cache)")
+    parser.add_argument("--cache-max-entries", help="keep at most N cached results, evicting the least recently used", type=int, default=result_cache.default_max_entries, metavar="N")
+    parser.add_argument("--sweep", help="write a dense sweep of log E(g) and of the log |Xa - Xh| probabilities to the directory SWEEP and exit", metavar="SWEEP")
+    parser.add_argument("--sweep-stakes", help="number of stakes swept, evenly spread over (0, 0.5)", type=int, default=1000)
+    parser.add_argument("--sweep-windows", help="windows (and precisions) swept: first:last[:step] or a,b,c (default: 2:precision; window 1 has E(g) = 0, so log E(g) = -inf)", type=sweeps.parse_range)
+    parser.add_argument("--sweep-diffs", help="|Xa - Xh| swept: first:last[:step] or a,b,c (default: 1:max-diff)", type=sweeps.parse_range)
+    parser.add_argument("--sweep-format", help="one memory-mappable .npy file per array, or long-format CSV", choices=["npy", "csv"], default="npy")
 
     # Print version
     parser.add_argument("--version", action="version", version='%(prog)s - Version 1.0')
 
     # Parse arguments
     args = parser.parse_args()
+    if args.sweep and args.engine not in (None, 'log'):
+        parser.error("the sweep is computed in float64 log-space, not with --engine {}".format(args.engine))
+    if args.engine is None:
+        args.engine = 'decimal'
 
     return args
 
@@ -124,11 +568,38 @@ if __name__ == '__main__':
   # Parse arguments
   args = parseArguments()
   precision = args.precision
-  cores = min(args.cores, nb_stakes)
+  cores = args.cores
+  getcontext().prec = args.digits
+  if args.cross_check:
+    cross_check(precision, cores)
+    sys.exit(0)
+  if args.compare_backends:
+    compare_backends(precision, args.digits, args.max_diff)
+    sys.exit(0)
+  if args.sweep:
+    windows = args.sweep_windows or list(range(2, max(precision, 2)+1))
+    diffs = args.sweep_diffs or list(range(1, args.max_diff+1))
+    with Parallel(n_jobs=cores) as parallel:
+      sweep(args.sweep, args.sweep_stakes, windows, diffs, args.sweep_format, cores, parallel)
+    sys.exit(0)
+  cache = result_cache.ResultCache(args.cache, args.cache_max_entries) if args.cache else None
+  if args.tolerance is not None:
+    print("Printing forking's figures with precision up to {}".format(precision))
+    with Parallel(n_jobs=cores) as parallel:
+      adaptive_tables(precision, args.tolerance, cores, parallel, args.max_diff, args.no_tables, cache)
+    if cache is not None:
+      cache.evict()
+    sys.exit(0)
   print("Printing forking's figures with precision={}".format(precision))
-  
-  # Run function
-  all_egs(precision, cores)
-  
-  # Run tables
-  tables(precision, cores)
+
+  # One pool of workers for every computation
+  with Parallel(n_jobs=cores) as parallel:
+    # Run function
+    all_egs(precision, cores, args.engine, parallel, cache)
+
+    # Run tables
+    if not args.no_tables:
+      tables(precision, cores, parallel, args.engine, args.max_diff, cache)
+
+  if cache is not None:
+    cache.evict()
@@ -0,0 +1,232 @@
+#!/usr/bin/python
+
+# Monte Carlo cross-check of forking_probabilities.py: simulates sequences of
+# slot leaders, each block being the adversary's with probability s, and
+# estimates E(g) and the |Xa - Xh| probabilities with confidence intervals.
+
+import sys
+import time
+import argparse
+import numpy as np
+import scipy.stats
+from joblib import Parallel, delayed
+from tabulate import tabulate
+from attempt_counts import attempt_weights
+from forking_probabilities import stakes, nb_stakes, log_egs, log_proba_diffs, table_diffs
+
+
+# Blocks simulated at once, bounding the size of the (samples, blocks) arrays
+chunk_blocks = 2**20
+
+# Largest simulated interval: S(w, x) <= 2^w, and its square (for the
+# variance) must fit in a float64
+max_simulated_precision = 500
+
+# Count, mean and sum of squared deviations of two sets of samples, merged
+# (Chan et al.'s parallel variance)
+def merge_stats(a, b):
+ (n_a, mean_a, m2_a), (n_b, mean_b, m2_b) = a, b
+ n = n_a + n_b
+ if n == 0:
+  return a
+ delta = mean_b - mean_a
+ return (n, mean_a + delta * n_b / n, m2_a + m2_b + delta**2 * n_a * n_b / n)
+
+# A window of w blocks with x of them adversarial, followed by an honest
+# block, has probability (1-s) * B_{w,s}(x) and gives S(w,x) grinding attempts:
+# C(precision, s) = E[ Sum_{w=1}^{precision-1} [block w+1 is honest] * S(w, X_w) ]
+# with X_w the number of adversarial blocks among the first w.
+# Returns the (count, mean, sum of squared deviations) of the samples
+def simulate_eg(s, precision, samples, rng):
+ weights = attempt_weights(precision)
+ windows = np.arange(1, precision)
+ stats = (0, 0.0, 0.0)
+ m = max(1, chunk_blocks // precision)
+ for start in range(0, samples, m):
+  adversarial = rng.random((min(m, samples - start), precision)) < s
+  xs = np.cumsum(adversarial, axis=1)
+  ys = (weights[windows, xs[:, :-1]] * ~adversarial[:, 1:]).sum(axis=1)
+  stats = merge_stats(stats, (len(ys), ys.mean(), ((ys - ys.mean())**2).sum()))
+ return stats
+
+# proba_diff sums the probabilities that the walk Xa - Xh (+1 for an
+# adversarial block, -1 for an honest one) first reaches diff after diff + 2i
+# blocks, for i = 0..precision: it is the probability that the walk reaches
+# diff within its first diff + 2*precision blocks.
+# Returns the number of walks reaching each diff
+def simulate_diffs(s, diffs, precision, samples, rng):
+ diffs = np.asarray(diffs)
+ lengths = diffs + 2*precision
+ n = int(lengths.max())
+ hits = np.zeros(len(diffs), dtype=np.int64)
+ m = max(1, chunk_blocks // n)
+ for start in range(0, samples, m):
+  steps = np.where(rng.random((min(m, samples - start), n)) < s, 1, -1)
+  highs = np.maximum.accumulate(np.cumsum(steps, axis=1), axis=1)
+  hits += (highs[:, lengths-1] >= diffs).sum(axis=0)
+ return hits
+
+# One batch of samples for one stake, from its own random stream.
+# Returns (stake, E(g) statistics, hits per diff, simulated blocks)
+def simulate_batch(s, precision, diffs, samples, seed):
+ eg_seed, diffs_seed = seed.spawn(2)
+ stats = simulate_eg(s, precision, samples, np.random.default_rng(eg_seed))
+ hits = simulate_diffs(s, diffs, precision, samples, np.random.default_rng(diffs_seed))
+ blocks = samples * (precision + max(diffs) + 2*precision)
+ return (s, stats, hits, blocks)
+
+# Confidence interval of a mean, from (count, mean, sum of squared deviations)
+def mean_interval(stats, z):
+ (n, mean, m2) = stats
+ half = z * np.sqrt(m2 / (n-1) / n) if n > 1 else np.inf
+ return (mean - half, mean + half)
+
+# Wilson score interval of a proportion k / n, which stays within [0, 1] and
+# is still meaningful when k = 0
+def wilson_interval(k, n, z):
+ p = k / n
+ denominator = 1 + z**2 / n
+ centre = (p + z**2 / (2*n)) / denominator
+ half = z * np.sqrt(p * (1-p) / n + z**2 / (4 * n**2)) / denominator
+ return (centre - half, centre + half)
+
+# Widest interval, relative to its estimate. Probabilities never hit are left
+# out: resolving a probability p takes ~1/p samples, which for large diffs is
+# beyond any simulation
+def widest_interval(eg_stats, hits, n, z):
+ widths = []
+ for s in stakes:
+  (lo, hi) = mean_interval(eg_stats[s], z)
+  mean = eg_stats[s][1]
+  widths.append((hi - lo) / 2 / mean if mean > 0 else np.inf)
+  seen = hits[s] > 0
+  (lo, hi) = wilson_interval(hits[s][seen], n, z)
+  widths.extend((hi - lo) / 2 / (hits[s][seen] / n))
+ return max(widths)
+
+# Prints the estimates so far: E(g) with the half-width of its interval, and
+# the probability of each diff
+def print_partial(diffs, eg_stats, hits, n, z):
+ headers = ["estimate vs stake"] + ["{:.1f}%".format(s*100) for s in stakes]
+ row = ["E(g)"]
+ for s in stakes:
+  (lo, hi) = mean_interval(eg_stats[s], z)
+  row.append("{:.3E} +/-{:.1E}".format(eg_stats[s][1], (hi - lo) / 2))
+ table = [row] + [["|Xa - Xh| = {}".format(d)] + ["{:.3E}".format(hits[s][k] / n) for s in stakes] for (k, d) in enumerate(diffs)]
+ print(tabulate(table, headers, tablefmt='orgtbl', disable_numparse=True), flush=True)
+
+# Runs rounds of one batch per core and stake, printing the partial estimates
+# after each, until the intervals are within rtol of their estimates or
+# max_samples samples per stake have been simulated. An interrupt (Ctrl-C)
+# ends the run with the rounds completed so far.
+# Returns (E(g) statistics, hits per diff, samples, blocks, seconds)
+def simulate(precision, diffs, max_samples, batch_size, rtol, z, seed, cores=1, parallel=None):
+ if parallel is None:
+  parallel = Parallel(n_jobs=cores)
+ root = np.random.SeedSequence(seed)
+ eg_stats = {s: (0, 0.0, 0.0) for s in stakes}
+ hits = {s: np.zeros(len(diffs), dtype=np.int64) for s in stakes}
+ n, blocks, start = 0, 0, time.perf_counter()
+ while n < max_samples:
+  round_samples = min(cores * batch_size, max_samples - n)
+  sizes = [min(batch_size, round_samples - k) for k in range(0, round_samples, batch_size)]
+  tasks = [(s, size) for s in stakes for size in sizes]
+  seeds = root.spawn(len(tasks))
+  try:
+   results = parallel(delayed(simulate_batch)(s, precision, diffs, size, seed) for ((s, size), seed) in zip(tasks, seeds))
+  except KeyboardInterrupt:
+   print("Interrupted, keeping the {} samples per stake of the completed rounds".format(n), flush=True)
+   break
+  for (s, stats, h, b) in results:
+   eg_stats[s] = merge_stats(eg_stats[s], stats)
+   hits[s] += h
+   blocks += b
+  n += round_samples
+  elapsed = time.perf_counter() - start
+  widest = widest_interval(eg_stats, hits, n, z)
+  print("\n{} samples per stake, {:.2E} blocks/s, widest interval +/-{:.1%}".format(n, blocks / elapsed, widest), flush=True)
+  print_partial(diffs, eg_stats, hits, n, z)
+  if widest <= rtol:
+   break
+ return (eg_stats, hits, n, blocks, time.perf_counter() - start)
+
+# Where the computed value lies relative to the simulated interval
+def locate(value, interval):
+ (lo, hi) = interval
+ if value < lo:
+  return "below"
+ if value > hi:
+  return "above"
+ return "in"
+
+# Prints the simulated estimates next to the computed ones
+def report(precision, diffs, eg_stats, hits, n, z, confidence):
+ headers = ["stake (%)"] + ["{:.1f}%".format(s*100) for s in stakes]
+ computed = np.exp(log_egs(stakes, precision))
+ intervals = [mean_interval(eg_stats[s], z) for s in stakes]
+ table = [
+  ["E(g), computed"] + ["{:.3E}".format(c) for c in computed],
+  ["E(g), simulated"] + ["{:.3E}".format(eg_stats[s][1]) for s in stakes],
+  ["{:.0%} interval, low".format(confidence)] + ["{:.3E}".format(lo) for (lo, _) in intervals],
+  ["{:.0%} interval, high".format(confidence)] + ["{:.3E}".format(hi) for (_, hi) in intervals],
+  ["computed vs interval"] + [locate(c, i) for (c, i) in zip(computed, intervals)],
+ ]
+ print("\nSimulated grinding attempts")
+ print(tabulate(table, headers, tablefmt='orgtbl', disable_numparse=True))
+ computed = np.exp(log_proba_diffs(diffs, stakes, precision))
+ intervals = {s: wilson_interval(hits[s], n, z) for s in stakes}
+ headers = ["|Xa - Xh| vs stake"] + headers[1:]
+ table_proba, table_check = [], []
+ outside = 0
+ for (k, d) in enumerate(diffs):
+  table_proba.append([d] + ["{:.3E}".format(hits[s][k] / n) for s in stakes])
+  row = [locate(computed[k][i], (intervals[s][0][k], intervals[s][1][k])) for (i, s) in enumerate(stakes)]
+  outside += sum(r != "in" for r in row)
+  table_check.append([d] + row)
+ print("\nSimulated probabilities")
+ print(tabulate(table_proba, headers, tablefmt='orgtbl', disable_numparse=True))
+ print("\nComputed probabilities vs {:.0%} intervals".format(confidence))
+ print(tabulate(table_check, headers, tablefmt='orgtbl', disable_numparse=True))
+ print("\n{} of {} computed probabilities outside their interval (about {:.0%} expected)".format(outside, len(diffs) * nb_stakes, 1 - confidence))
+
+
+def parseArguments():
+    # Create argument parser
+    parser = argparse.ArgumentParser()
+
+    # Optional arguments
+    parser.add_argument("-c", "--cores", help="number of worker processes", type=int, default=1)
+    parser.add_argument("-p", "--precision", help="interval to simulate E(g) and |Xa - Xh| on (at most {})".format(max_simulated_precision), type=int, default=32)
+    parser.add_argument("-d", "--max-diff", help="largest |Xa - Xh| simulated (powers of 2 up to it)", type=int, default=256)
+    parser.add_argument("-n", "--samples", help="largest number of samples per stake", type=int, default=10**6)
+    parser.add_argument("-b", "--batch-size", help="samples per batch", type=int, default=10**5)
+    parser.add_argument("-r", "--rtol", help="stop once every interval is within RTOL of its estimate", type=float, default=0.01)
+    parser.add_argument("--confidence", help="confidence level of the intervals", type=float, default=0.95)
+    parser.add_argument("--seed", help="seed of the random streams", type=int, default=0)
+
+    # Print version
+    parser.add_argument("--version", action="version", version='%(prog)s - Version 1.0')
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    return args
+
+if __name__ == '__main__':
+  # Parse arguments
+  args = parseArguments()
+  precision = args.precision
+  cores = args.cores
+  if not 1 <= precision <= max_simulated_precision:
+    sys.exit("precision must be between 1 and {}".format(max_simulated_precision))
+  diffs = table_diffs(args.max_diff)
+  z = scipy.stats.norm.ppf(0.5 + args.confidence / 2)
+  print("Simulating forking's figures with precision={}".format(precision))
+
+  with Parallel(n_jobs=cores) as parallel:
+    (eg_stats, hits, n, blocks, elapsed) = simulate(precision, diffs, args.samples, args.batch_size, args.rtol, z, args.seed, cores, parallel)
+
+  if n == 0:
+    sys.exit("No round completed")
+  print("\nSimulated {:.3E} blocks in {:.1f}s ({:.2E} blocks/s)".format(blocks, elapsed, blocks / elapsed))
+  report(precision, diffs, eg_stats, hits, n, z, args.confidence)
@@ -4,11 +4,13 @@ import sys
 import math
 import time
 import scipy
+import numpy as np
 from decimal import Decimal
 from joblib import Parallel, delayed
 import scipy.special
 import argparse
 from tabulate import tabulate
+import sweeps
 
 # Considered adversarial stakes in percentage
 stakes = [0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.25, 0.3, 0.33, 0.4, 0.45, 0.49] 
@@ -19,15 +21,52 @@ nb_stakes = len(stakes)
 def proba_attempts(x,s):
   return s, Decimal(s)**x * Decimal(1-s)
 
-def eg(w,s):
+# Window size, in blocks, the expectations are computed on
+default_window = 21600
+
+# Expected number of grinding attempts over a window of w blocks:
+# E(w, s) = Sum_{x=0}^{w} x * s^x * (1-s)
+# Reference implementation, recomputing s^x for every x
+def eg_reference(w,s):
  acc = Decimal(0)
  for x in range(w+1):
   acc += Decimal(x) * proba_attempts(x,s)[1]
  return s, acc
 
+# Same sum, with s^x carried from one term to the next
+def eg_running(w,s):
+ s_d = Decimal(s)
+ acc = Decimal(0)
+ p = Decimal(1-s)
+ for x in range(1, w+1):
+  p *= s_d
+  acc += x * p
+ return s, acc
+
+# Closed form of the same sum, in O(log w):
+# Sum_{x=0}^{w} x s^x (1-s) = s (1 - (w+1) s^w + w s^{w+1}) / (1-s)
+def eg(w,s):
+ s_d = Decimal(s)
+ s_w = s_d**w
+ return s, s_d * (1 - (w+1)*s_w + w*s_w*s_d) / (1 - s_d)
+
+# Closed form for all stakes at once, in float64 (s^w underflows to 0, which
+# is its limit, for large windows)
+def egs(w, stakes):
+ s = np.asarray(stakes, dtype=np.float64)
+ s_w = s**w
+ return s * (1 - (w+1)*s_w + w*s_w*s) / (1-s)
+
+# log of proba_attempts for every x and stake at once, of shape
+# (len(xs), len(stakes)): log(s^x * (1-s)) = x log(s) + log(1-s)
+def log_proba_attempts(xs, stakes):
+ x = np.asarray(xs, dtype=np.float64)[:, None]
+ s = np.asarray(stakes, dtype=np.float64)[None, :]
+ return x * np.log(s) + np.log1p(-s)
+
 # Computes and print the expectation of grinding attempts for all adversaries
-def all_egs(cores=1):
- results = Parallel(n_jobs=cores)(delayed(eg)(21600, s) for s in stakes)
+def all_egs(cores=1, window=default_window):
+ results = Parallel(n_jobs=cores)(delayed(eg)(window, s) for s in stakes)
  res = sorted(results, key=lambda x : x[0])
  # Printing tables (use tabulate's option tablefmt="plain" to have no lines)
  headers = ["stake (%)"] + ["{:.1f}%".format(s*100) for s in stakes]
@@ -36,6 +75,18 @@ def all_egs(cores=1):
  print(tabulate(table, headers, tablefmt='orgtbl'))
 
 
+# Compares the closed form and the running product with the reference loop
+def cross_check(cores=1, window=default_window):
+ exact = sorted(Parallel(n_jobs=cores)(delayed(eg_reference)(window, s) for s in stakes), key=lambda x : x[0])
+ headers = ["stake (%)"] + ["{:.1f}%".format(s*100) for s in stakes]
+ table = [["E(g), reference"] + ["{0:.6E}".format(r[1]) for r in exact]]
+ for (name, values) in [("closed form", [eg(window, s)[1] for (s, _) in exact]),
+                        ("running product", [eg_running(window, s)[1] for (s, _) in exact]),
+                        ("float64", [Decimal(v) for v in egs(window, [s for (s, _) in exact])])]:
+  table.append(["relative error, " + name] + ["{0:.1E}".format(abs(v - r[1]) / r[1]) for (v, r) in zip(values, exact)])
+ print("\nCross-check of the E(g) computations (window={})".format(window))
+ print(tabulate(table, headers, tablefmt='orgtbl', disable_numparse=True))
+
 def tables(cores=1):
  table = []
  pows = [1,2,4,8,16,32,64,128,256]
@@ -54,12 +105,37 @@ def tables(cores=1):
  print("\nTable of frequencies (year)")
  print(tabulate(table_year, headers, tablefmt='orgtbl'))
 
+
+# Dense sweep: E(g) over (windows, stakes) and the log probabilities of
+# x trailing blocks over (blocks, stakes), for nb_sweep_stakes stakes in
+# (0, 0.5) (see sweeps.py)
+def sweep(path, nb_sweep_stakes, windows, xs, fmt='npy'):
+ sweep_stakes = sweeps.sweep_stakes(nb_sweep_stakes)
+ sweeps.create_sweep(path, {'stakes': sweep_stakes, 'windows': windows, 'blocks': xs})
+ eg_sweep = sweeps.open_array(path, 'eg', (len(windows), len(sweep_stakes)), fmt)
+ log_proba = sweeps.open_array(path, 'log_proba', (len(xs), len(sweep_stakes)), fmt)
+ for i in range(0, len(sweep_stakes), sweeps.stake_chunk):
+  chunk = sweep_stakes[i:i+sweeps.stake_chunk]
+  eg_sweep[:, i:i+len(chunk)] = egs(np.asarray(windows)[:, None], chunk)
+  log_proba[:, i:i+len(chunk)] = log_proba_attempts(xs, chunk)
+ sweeps.close_array(path, 'eg', eg_sweep, [('window', windows), ('stake', sweep_stakes)], fmt)
+ sweeps.close_array(path, 'log_proba', log_proba, [('blocks', xs), ('stake', sweep_stakes)], fmt)
+ print("Wrote a sweep of {} stakes, {} windows and {} trailing block counts to {}".format(len(sweep_stakes), len(windows), len(xs), path))
+
+
 def parseArguments():
     # Create argument parser
     parser = argparse.ArgumentParser()
 
     # Optional arguments
     parser.add_argument("-c", "--cores", help="number of threads", type=int, default=1)
+    parser.add_argument("-w", "--window", help="window, in blocks, to compute E(g) on", type=int, default=default_window)
+    parser.add_argument("--cross-check", help="compare the E(g) computations with the reference loop and exit", action="store_true")
+    parser.add_argument("--sweep", help="write a dense sweep of E(g) and of the log probabilities to the directory SWEEP and exit", metavar="SWEEP")
+    parser.add_argument("--sweep-stakes", help="number of stakes swept, evenly spread over (0, 0.5)", type=int, default=1000)
+    parser.add_argument("--sweep-windows", help="windows swept: first:last[:step] or a,b,c (default: window)", type=sweeps.parse_range)
+    parser.add_argument("--sweep-blocks", help="numbers of trailing blocks swept: first:last[:step] or a,b,c (default: 1:256)", type=sweeps.parse_range)
+    parser.add_argument("--sweep-format", help="one memory-mappable .npy file per array, or long-format CSV", choices=["npy", "csv"], default="npy")
 
     # Print version
     parser.add_argument("--version", action="version", version='%(prog)s - Version 1.0')
@@ -75,10 +151,16 @@ if __name__ == '__main__':
   
   # Optimize threads
   cores = min(args.cores, nb_stakes)
+  if args.cross_check:
+    cross_check(cores, args.window)
+    sys.exit(0)
+  if args.sweep:
+    sweep(args.sweep, args.sweep_stakes, args.sweep_windows or [args.window], args.sweep_blocks or list(range(1, 257)), args.sweep_format)
+    sys.exit(0)
   print("Printing self-mixing's figures")
 
   # Run function
-  all_egs(cores)
+  all_egs(cores, args.window)
 
   # Run tables
   tables(cores)
\ No newline at end of file
@@ -0,0 +1,124 @@
+#!/usr/bin/python
+
+# Numeric backends for the forking computations: proba_attempts,
+# number_attempts_adv, expectation and proba_diff (same arguments as in
+# forking_probabilities.py), in
+#  - float64 log-space: natural logarithms, fast, about 1e-15 relative error,
+#  - Decimal with a configurable number of significant digits,
+#  - exact rationals and integers, the reference of the other two.
+# Stakes are floats, converted exactly (as Decimal(s) does), and 1-s is
+# computed in the backend's own arithmetic.
+
+import math
+import numpy as np
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from attempt_counts import number_attempts_adv_exact
+
+# Relative error |value / exact - 1| of a value that should be zero
+def zero_error(is_zero):
+ return 0.0 if is_zero else math.inf
+
+class ExactBackend:
+ name = 'exact'
+
+ def proba_attempts(self, w, x, s):
+  s = Fraction(s)
+  return math.comb(w, x) * s**x * (1-s)**(w-x)
+
+ def number_attempts_adv(self, w, x):
+  return Fraction(number_attempts_adv_exact(w, x))
+
+ def expectation(self, w, x, s):
+  return self.proba_attempts(w, x, s) * self.number_attempts_adv(w, x)
+
+ def proba_diff(self, diff, s, precision=10):
+  s = Fraction(s)
+  q = s * (1-s)
+  p = s**diff
+  acc = p
+  for i in range(precision):
+   p = p * q * (2*i+diff) * (2*i+diff+1) / ((i+1) * (i+diff+1))
+   acc += p
+  return acc
+
+ def relative_error(self, value, exact):
+  return 0.0 if value == exact else float(abs(value / exact - 1))
+
+class DecimalBackend:
+ def __init__(self, digits=28):
+  self.digits = digits
+  self.name = 'decimal ({} digits)'.format(digits)
+
+ def proba_attempts(self, w, x, s):
+  with localcontext() as ctx:
+   ctx.prec = self.digits
+   s = Decimal(s)
+   return +Decimal(math.comb(w, x)) * s**x * (1-s)**(w-x)
+
+ def number_attempts_adv(self, w, x):
+  with localcontext() as ctx:
+   ctx.prec = self.digits
+   # Unary plus rounds the exact integer to the context's precision
+   return +Decimal(number_attempts_adv_exact(w, x))
+
+ def expectation(self, w, x, s):
+  with localcontext() as ctx:
+   ctx.prec = self.digits
+   return self.proba_attempts(w, x, s) * self.number_attempts_adv(w, x)
+
+ def proba_diff(self, diff, s, precision=10):
+  with localcontext() as ctx:
+   ctx.prec = self.digits
+   s = Decimal(s)
+   q = s * (1-s)
+   p = s**diff
+   acc = p
+   for i in range(precision):
+    p = p * q * Decimal((2*i+diff) * (2*i+diff+1)) / Decimal((i+1) * (i+diff+1))
+    acc += p
+   return acc
+
+ def relative_error(self, value, exact):
+  if exact == 0:
+   return zero_error(value == 0)
+  return float(abs(Fraction(value) / exact - 1))
+
+# Natural logarithm of a non-negative Fraction, -inf for 0; math.log takes
+# integers of any size
+def log_fraction(value):
+ if value == 0:
+  return -math.inf
+ return math.log(value.numerator) - math.log(value.denominator)
+
+class LogBackend:
+ name = 'float64 log-space'
+
+ def proba_attempts(self, w, x, s):
+  log_binom = math.lgamma(w+1) - math.lgamma(x+1) - math.lgamma(w-x+1)
+  return log_binom + x * math.log(s) + (w-x) * math.log1p(-s)
+
+ def number_attempts_adv(self, w, x):
+  count = number_attempts_adv_exact(w, x)
+  return math.log(count) if count else -math.inf
+
+ def expectation(self, w, x, s):
+  return self.proba_attempts(w, x, s) + self.number_attempts_adv(w, x)
+
+ def proba_diff(self, diff, s, precision=10):
+  log_q = math.log(s) + math.log1p(-s)
+  log_p = diff * math.log(s)
+  acc = log_p
+  for i in range(precision):
+   log_p += log_q + math.log((2*i+diff) * (2*i+diff+1)) - math.log((i+1) * (i+diff+1))
+   acc = np.logaddexp(acc, log_p)
+  return float(acc)
+
+ def relative_error(self, value, exact):
+  if exact == 0:
+   return zero_error(value == -math.inf)
+  return abs(math.expm1(value - log_fraction(exact)))
+
+# The backends, least precise first; the last one is the reference
+def all_backends(digits=28):
+ return [LogBackend(), DecimalBackend(digits), ExactBackend()]
@@ -0,0 +1,117 @@
+#!/usr/bin/python
+
+# Persistent memo of the forking computations, kept across runs and shared
+# with the joblib workers. Each result is a file named after the SHA-256 of
+# its key (computation, code version, arguments): a result is written to a
+# temporary file and renamed into place, so that concurrent workers and runs
+# only ever see complete results. Reading a result bumps its modification
+# time, and evict() removes the least recently used results beyond
+# max_entries.
+
+import os
+import json
+import hashlib
+import inspect
+import tempfile
+from decimal import Decimal, InvalidOperation
+
+default_max_entries = 100000
+
+# Hash of the source of the functions and modules a result depends on, so
+# that editing them invalidates the results (and editing anything else,
+# such as the list of stakes, does not)
+def code_version(*objects):
+ digest = hashlib.sha256()
+ for obj in objects:
+  digest.update(inspect.getsource(obj).encode())
+ return digest.hexdigest()[:16]
+
+# A result is a Decimal, or a tuple of Decimals, integers and Nones (such
+# as the adaptive results). Decimals are stored as strings, which keeps them
+# exact and tells them apart from the integers
+def encode(value):
+ if isinstance(value, tuple):
+  return [encode(v) for v in value]
+ if isinstance(value, Decimal):
+  return str(value)
+ if value is None or isinstance(value, int):
+  return value
+ raise TypeError("cannot cache a {}".format(type(value).__name__))
+
+# Raises ValueError or TypeError on anything encode does not produce
+def decode(value):
+ if isinstance(value, list):
+  return tuple(decode(v) for v in value)
+ if isinstance(value, str):
+  try:
+   return Decimal(value)
+  except InvalidOperation:
+   raise ValueError(value)
+ if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+  return value
+ raise TypeError(type(value).__name__)
+
+class ResultCache:
+ def __init__(self, path, max_entries=default_max_entries):
+  self.path = path
+  self.max_entries = max_entries
+
+ def file(self, key):
+  name = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+  return os.path.join(self.path, name[:2], name[2:])
+
+ # The result stored for key (a JSON list), or None. A missing, truncated or
+ # otherwise malformed entry is a miss, and gets overwritten by the next put
+ def get(self, key):
+  path = self.file(key)
+  try:
+   with open(path) as f:
+    entry = json.load(f)
+   if not isinstance(entry, dict) or entry.get('key') != key or 'value' not in entry:
+    return None
+   value = decode(entry['value'])
+  except (OSError, ValueError, TypeError):
+   return None
+  try:
+   os.utime(path)
+  except OSError:
+   # Evicted since it was read
+   pass
+  return value
+
+ def put(self, key, value):
+  path = self.file(key)
+  directory = os.path.dirname(path)
+  os.makedirs(directory, exist_ok=True)
+  fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+  try:
+   with os.fdopen(fd, 'w') as f:
+    json.dump({'key': key, 'value': encode(value)}, f)
+   os.replace(tmp, path)
+  except BaseException:
+   try:
+    os.remove(tmp)
+   except OSError:
+    pass
+   raise
+
+ # Removes the least recently used results beyond max_entries
+ def evict(self):
+  entries = []
+  for directory in os.scandir(self.path):
+   if not directory.is_dir():
+    continue
+   for entry in os.scandir(directory.path):
+    if entry.name.startswith('.tmp-'):
+     continue
+    try:
+     entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+     pass
+  entries.sort(reverse=True)
+  for (_, path) in entries[self.max_entries:]:
+   try:
+    os.remove(path)
+   except OSError:
+    # Already removed by a concurrent eviction
+    pass
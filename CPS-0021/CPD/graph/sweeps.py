@@ -0,0 +1,62 @@
+#!/usr/bin/python
+
+# Dense sweeps over stakes, shared by the forking and mixing scripts.
+# A sweep is a directory holding its coordinates (stakes.npy, windows.npy,
+# and diffs.npy or blocks.npy) and one file per computed array: either a
+# .npy file, which np.load(path, mmap_mode='r') maps without reading it, or
+# a long-format CSV with one column per coordinate.
+
+import os
+import argparse
+import numpy as np
+
+# Stakes swept per chunk, bounding the memory of the intermediate arrays
+stake_chunk = 256
+
+# n stakes evenly spread over (0, max_stake), end points excluded
+def sweep_stakes(n, max_stake=0.5):
+ return np.linspace(0, max_stake, n+2)[1:-1]
+
+# Parses 'first:last' (inclusive), 'first:last:step' or 'a,b,c' into integers,
+# as an argparse type
+def parse_range(text):
+ try:
+  if ':' in text:
+   bounds = [int(t) for t in text.split(':')]
+   if len(bounds) not in (2, 3):
+    raise ValueError(text)
+   step = bounds[2] if len(bounds) == 3 else 1
+   values = list(range(bounds[0], bounds[1] + 1, step))
+  else:
+   values = [int(t) for t in text.split(',')]
+ except ValueError:
+  raise argparse.ArgumentTypeError("expected first:last, first:last:step or a,b,c, got '{}'".format(text))
+ if not values or min(values) < 1:
+  raise argparse.ArgumentTypeError("expected positive integers, got '{}'".format(text))
+ return values
+
+# Creates the sweep directory and saves its coordinates
+def create_sweep(path, coordinates):
+ os.makedirs(path, exist_ok=True)
+ for (name, values) in coordinates.items():
+  np.save(os.path.join(path, name + '.npy'), np.asarray(values))
+
+# Array to fill with a computed sweep: with the 'npy' format, it is mapped
+# onto its file, so that sweeps larger than memory can be written
+def open_array(path, name, shape, fmt='npy'):
+ if fmt == 'npy':
+  return np.lib.format.open_memmap(os.path.join(path, name + '.npy'), mode='w+', dtype=np.float64, shape=shape)
+ return np.empty(shape)
+
+# Writes a filled array; axes are the (name, values) of its dimensions.
+# The CSV is written one slice of the first axis at a time
+def close_array(path, name, array, axes, fmt='npy'):
+ if fmt == 'npy':
+  array.flush()
+  return
+ with open(os.path.join(path, name + '.csv'), 'w') as f:
+  f.write(','.join([axis for (axis, _) in axes] + [name]) + '\n')
+  rest = np.meshgrid(*[values for (_, values) in axes[1:]], indexing='ij')
+  for (i, first) in enumerate(axes[0][1]):
+   columns = [np.full(array[i].size, first)] + [r.ravel() for r in rest] + [np.ravel(array[i])]
+   np.savetxt(f, np.column_stack(columns), delimiter=',', fmt='%.17g')